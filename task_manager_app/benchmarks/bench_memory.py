@@ -0,0 +1,55 @@
+# Память под N задач в разных представлениях.
+#   python benchmarks/bench_memory.py [N ...]
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import make_dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# лог замеров — во временный каталог, а не в ./logs того места, откуда запущено
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.gettempdir()) / "task_manager_bench.log"))
+
+from core.models import Task  # noqa: E402
+from benchmarks.synthetic import make_task_dicts  # noqa: E402
+
+
+# Task до перехода на __slots__ — для сравнения
+LegacyTask = make_dataclass(
+    "LegacyTask",
+    ["title", "description", "due_date", "status", "priority", "id", "created_at"],
+)
+
+
+def measure(blob: bytes, build):
+    # Строки создаются заново (json.loads) под трассировкой, поэтому в замер попадают
+    # и они; промежуточные dict к моменту замера уже освобождены.
+    gc.collect()
+    tracemalloc.start()
+    obj = build(json.loads(blob))
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current
+
+
+def main(sizes):
+    print(f"{'tasks':>10} {'dicts':>12} {'legacy Task':>12} {'slots Task':>12}")
+    for n in sizes:
+        blob = json.dumps(make_task_dicts(n), ensure_ascii=False).encode("utf-8")
+        results = [
+            measure(blob, lambda data: data),
+            measure(blob, lambda data: [LegacyTask(**d) for d in data]),
+            measure(blob, lambda data: [Task.from_dict(d) for d in data]),
+        ]
+        print(f"{n:>10} " + " ".join(f"{r / 2**20:>10.1f}MB" for r in results))
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000])
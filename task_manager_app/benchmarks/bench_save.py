@@ -0,0 +1,50 @@
+# Цена атомарного сохранения: запись на месте (как было) против
+# временного файла + crc32 + fsync + резервной копии.
+#   python benchmarks/bench_save.py [N ...]
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# лог замеров — во временный каталог, а не в ./logs того места, откуда запущено
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.gettempdir()) / "task_manager_bench.log"))
+
+from storage.json_storage import JsonStorage, write_json_array  # noqa: E402
+from benchmarks.synthetic import make_tasks  # noqa: E402
+
+
+REPEAT = 3
+
+
+def best_of(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main(sizes):
+    print(f"{'tasks':>10} {'in place, ms':>13} {'atomic, ms':>11} {'overhead':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            tasks = make_tasks(n)
+            path = Path(tmp) / f"tasks_{n}.json"
+
+            def in_place():
+                with path.open("w", encoding="utf-8") as f:
+                    write_json_array(f, (t.to_dict() for t in tasks))
+
+            storage = JsonStorage(str(path))
+            plain, atomic = best_of(in_place), best_of(lambda: storage.save(tasks))
+            print(f"{n:>10} {plain:>13.1f} {atomic:>11.1f} {atomic / plain - 1:>8.0%}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,65 @@
+# Время до первой страницы (постраничный старт) против полной загрузки,
+# для JSON и бинарного снимка.
+#   python benchmarks/bench_startup.py [N ...]
+import sys
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# лог замеров — во временный каталог, а не в ./logs того места, откуда запущено
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.gettempdir()) / "task_manager_bench.log"))
+
+from core.service import TaskService  # noqa: E402
+from storage.binary_storage import BinaryStorage  # noqa: E402
+from storage.json_storage import JsonStorage  # noqa: E402
+from benchmarks.synthetic import make_tasks  # noqa: E402
+
+
+FIRST_PAGE = 200
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(sizes):
+    print(f"{'tasks':>10} {'format':>8} {'open, ms':>10} {'first page, ms':>15} {'full load, ms':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            tasks = make_tasks(n)
+            json_path = Path(tmp) / f"tasks_{n}.json"
+            JsonStorage(str(json_path), compact=True).save(tasks)
+            bin_path = Path(tmp) / f"tasks_{n}.bin"
+            BinaryStorage(str(bin_path)).save(tasks)
+            del tasks
+
+            for name, make in (("json", lambda: JsonStorage(str(json_path))),
+                               ("binary", lambda: BinaryStorage(str(bin_path)))):
+                def open_only():
+                    storage = make()
+                    next(iter(storage.iter_load()), None)
+                    storage.close()
+
+                def first_page():
+                    svc = TaskService(make())
+                    svc.begin_load(list(islice(svc.storage.iter_load(), FIRST_PAGE)))
+                    svc.storage.close()
+
+                def full_load():
+                    svc = TaskService(make())
+                    svc.load()
+                    svc.storage.close()
+
+                print(f"{n:>10} {name:>8} {timed(open_only):>10.1f} {timed(first_page):>15.1f} "
+                      f"{timed(full_load):>15.1f}")
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,169 @@
+# Нагрузочный тест HTTP API (task_manager.server): запросов в секунду и задержки.
+#   python benchmarks/load_test.py                          — поднять сервер на синтетических задачах
+#   python benchmarks/load_test.py --tasks 100000 -c 100    — размер данных и число клиентов
+#   python benchmarks/load_test.py --url 127.0.0.1:8765     — уже запущенный сервер
+# Клиенты держат keep-alive соединения; смесь запросов — страницы списка (половина
+# клиентов с If-None-Match), поиск, чтение задачи и доля записей --writes.
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import quote
+
+ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# лог замеров — во временный каталог, а не в ./logs того места, откуда запущено
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.gettempdir()) / "task_manager_bench.log"))
+
+from core.service import TaskService  # noqa: E402
+from storage.factory import make_storage  # noqa: E402
+from storage.json_storage import JsonStorage  # noqa: E402
+from task_manager.server import TaskServer  # noqa: E402
+from benchmarks.synthetic import WORDS, make_tasks  # noqa: E402
+
+
+class Client:
+    # Минимальный HTTP/1.1-клиент с одним keep-alive соединением.
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method: str, path: str, body=None, headers: dict | None = None):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(data)}"]
+        head += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        self._writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+
+        status = int((await self._reader.readline()).split()[1])
+        resp_headers = {}
+        while (line := await self._reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            resp_headers[name.strip().lower()] = value.strip()
+        length = int(resp_headers.get("content-length", 0))
+        payload = await self._reader.readexactly(length) if length else b""
+        return status, resp_headers, json.loads(payload) if payload else None
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def start_local_server(n: int, tmp: Path, kind: str) -> TaskServer:
+    # Сервер в отдельном потоке со своим циклом событий; возвращается после start().
+    path = tmp / "tasks.json"
+    JsonStorage(str(path), backups=0).save(make_tasks(n))
+    service = TaskService(make_storage(kind, str(path)))
+    service.load()
+    server = TaskServer(service, port=0, sync_interval=0)
+    ready = threading.Event()
+
+    async def run():
+        await server.start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=asyncio.run, args=(run(),), daemon=True).start()
+    ready.wait()
+    return server
+
+
+async def worker(client: Client, ids: list[str], deadline: float, writes: float, use_etag: bool,
+                 rnd: random.Random, stats: dict) -> None:
+    etags: dict[str, str] = {}
+    while time.perf_counter() < deadline:
+        roll = rnd.random()
+        method, body = "GET", None
+        if roll < writes:
+            kind, method, path = "write", "POST", "/tasks"
+            body = {"title": " ".join(rnd.choices(WORDS, k=3)), "priority": rnd.choice(("low", "medium", "high"))}
+        elif roll < 0.5:
+            kind, path = "list", f"/tasks?sort=priority&limit=50&offset={rnd.randrange(0, 500, 50)}"
+        elif roll < 0.75:
+            kind, path = "search", f"/tasks?q={quote(rnd.choice(WORDS))}&limit=20"
+        else:
+            kind, path = "get", f"/tasks/{rnd.choice(ids)}"
+
+        headers = {"If-None-Match": etags[path]} if use_etag and path in etags else None
+        start = time.perf_counter()
+        status, resp_headers, _ = await client.request(method, path, body, headers)
+        stats[kind].append(time.perf_counter() - start)
+        if status == 304:
+            stats["not_modified"].append(0)
+        elif "etag" in resp_headers:
+            etags[path] = resp_headers["etag"]
+    client.close()
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p), len(values) - 1)] if values else 0.0
+
+
+async def run_load(host: str, port: int, concurrency: int, duration: float, writes: float) -> dict:
+    probe = Client(host, port)
+    _, _, page = await probe.request("GET", "/tasks?limit=1000")
+    probe.close()
+    ids = [t["id"] for t in page["items"]] or ["missing"]
+
+    stats = defaultdict(list)
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(Client(host, port), ids, deadline, writes, i % 2 == 0, random.Random(i), stats)
+        for i in range(concurrency)
+    ))
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="host:port of a running server (default: start one locally)")
+    parser.add_argument("--tasks", type=int, default=10_000, help="synthetic tasks for the local server")
+    parser.add_argument("--storage", default="json", help="storage kind for the local server")
+    parser.add_argument("-c", "--concurrency", type=int, default=50)
+    parser.add_argument("-d", "--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--writes", type=float, default=0.1, help="share of POST /tasks requests")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("task_manager").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.url:
+            host, _, port = args.url.removeprefix("http://").partition(":")
+            port = int(port or 8765)
+        else:
+            server = start_local_server(args.tasks, Path(tmp), args.storage)
+            host, port = server.host, server.port
+        stats = asyncio.run(run_load(host, port, args.concurrency, args.duration, args.writes))
+
+    elapsed = stats.pop("elapsed")
+    not_modified = len(stats.pop("not_modified", []))
+    total = sum(len(v) for v in stats.values())
+    print(f"{'request':<10} {'count':>8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for kind in sorted(stats):
+        lat = stats[kind]
+        print(f"{kind:<10} {len(lat):>8} {len(lat) / elapsed:>10,.0f} "
+              f"{percentile(lat, 0.5) * 1000:>9.2f} {percentile(lat, 0.99) * 1000:>9.2f}")
+    all_lat = [x for v in stats.values() for x in v]
+    print(f"{'total':<10} {total:>8} {total / elapsed:>10,.0f} "
+          f"{percentile(all_lat, 0.5) * 1000:>9.2f} {percentile(all_lat, 0.99) * 1000:>9.2f}")
+    print(f"304 Not Modified: {not_modified} of {total} ({args.concurrency} clients, {elapsed:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
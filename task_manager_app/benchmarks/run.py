@@ -0,0 +1,206 @@
+# Набор замеров сервиса, хранилища и поиска на синтетических задачах.
+#   python benchmarks/run.py                       — сравнить с baseline.json
+#   python benchmarks/run.py --sizes 1000 1000000  — свои размеры
+#   python benchmarks/run.py --save-baseline       — записать текущие числа как эталон
+# Код выхода 1, если пропускная способность упала ниже эталона больше чем на --tolerance.
+import argparse
+import gc
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+# лог замеров — во временный каталог, а не в ./logs того места, откуда запущено
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.gettempdir()) / "task_manager_bench.log"))
+
+from core.ordering import SORT_KEYS  # noqa: E402
+from core.service import TaskService  # noqa: E402
+from storage.base import BaseStorage  # noqa: E402
+from storage.json_storage import JsonStorage  # noqa: E402
+from benchmarks.synthetic import make_tasks  # noqa: E402
+
+
+BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+QUERIES = ["отчёт", "rev", "купить молоко", "проект встреча", "re", "docs", "d", "zzz"]
+
+BENCHES = {}
+
+
+def bench(name):
+    def register(fn):
+        BENCHES[name] = fn
+        return fn
+    return register
+
+
+class NullStorage(BaseStorage):
+    # хранилище без ввода-вывода: замеряем только сам сервис
+    def __init__(self, tasks=()):
+        self._tasks = list(tasks)
+
+    def load(self):
+        return list(self._tasks)
+
+    def save(self, tasks):
+        pass
+
+    def save_task(self, task, tasks):
+        pass
+
+    def delete_task(self, task_id, tasks):
+        pass
+
+
+def loaded_service(n):
+    svc = TaskService(NullStorage(make_tasks(n)))
+    svc.load()
+    return svc
+
+
+# Каждый замер получает (n, tmp) и возвращает (функция, число операций за вызов).
+@bench("json.save")
+def bench_json_save(n, tmp):
+    tasks = make_tasks(n)
+    storage = JsonStorage(str(tmp / "save.json"), backups=0)
+    return lambda: storage.save(tasks), n
+
+
+@bench("json.load")
+def bench_json_load(n, tmp):
+    storage = JsonStorage(str(tmp / "load.json"), backups=0)
+    storage.save(make_tasks(n))
+    return storage.load, n
+
+
+@bench("service.load")
+def bench_service_load(n, tmp):
+    path = tmp / "service.json"
+    JsonStorage(str(path), backups=0).save(make_tasks(n))
+    svc = TaskService(JsonStorage(str(path), backups=0))
+    return svc.load, n
+
+
+@bench("service.add_delete")
+def bench_add_delete(n, tmp):
+    svc = loaded_service(n)
+    svc.list_tasks(sort_by="priority")      # с поддерживаемым представлением, как в UI
+    batch = 1000
+
+    def run():
+        ids = [svc.add_task(f"Новая {i}", "описание", "2025-06-01", "high").id for i in range(batch)]
+        for task_id in ids:
+            svc.delete_task(task_id)
+    return run, 2 * batch
+
+
+@bench("service.get")
+def bench_get(n, tmp):
+    svc = loaded_service(n)
+    ids = [t.id for t in svc.list_tasks()]
+    rnd = random.Random(1)
+    sample = [rnd.choice(ids) for _ in range(10_000)]
+    return lambda: [svc.get_task(i) for i in sample], len(sample)
+
+
+@bench("service.stats")
+def bench_stats(n, tmp):
+    svc = loaded_service(n)
+    calls = 1000
+    return lambda: [svc.stats() for _ in range(calls)], calls
+
+
+@bench("search")
+def bench_search(n, tmp):
+    # то же, что App.apply_filters при непустом запросе: поиск по индексу + сортировка
+    svc = loaded_service(n)
+    svc.search("x")
+    svc.list_tasks(sort_by="priority")
+
+    def run():
+        for q in QUERIES:
+            svc.sort_tasks(svc.search(q), "priority")
+    return run, len(QUERIES)
+
+
+@bench("sort")
+def bench_sort(n, tmp):
+    # App.apply_filters без запроса: готовый порядок из сервиса по каждому ключу
+    svc = loaded_service(n)
+    for key in SORT_KEYS:
+        svc.list_tasks(sort_by=key)
+    return lambda: [svc.list_tasks("active", sort_by=key) for key in SORT_KEYS], len(SORT_KEYS)
+
+
+def measure(setup, n, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        run, ops = setup(n, Path(tmp))
+        best = float("inf")
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+        # пик памяти — отдельным прогоном, tracemalloc сильно замедляет код
+        gc.collect()
+        tracemalloc.start()
+        run()
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return ops / best, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHES), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed throughput drop vs baseline (0.3 = 30%%)")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("task_manager").setLevel(logging.WARNING)
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8")) if BASELINE.exists() else {}
+    results = dict(baseline) if args.save_baseline else {}
+    regressions = []
+
+    print(f"{'benchmark':<20} {'tasks':>9} {'ops/s':>12} {'peak MB':>9} {'vs baseline':>12}")
+    for name in args.only or BENCHES:
+        for n in args.sizes:
+            ops_per_s, peak = measure(BENCHES[name], n, args.repeat)
+            key = f"{name}/{n}"
+            results[key] = round(ops_per_s, 1)
+
+            ref = baseline.get(key)
+            change = ""
+            if ref:
+                ratio = ops_per_s / ref
+                change = f"{ratio - 1:+.0%}"
+                if ratio < 1 - args.tolerance:
+                    regressions.append(key)
+                    change += " !"
+            print(f"{name:<20} {n:>9} {ops_per_s:>12,.0f} {peak / 2**20:>9.1f} {change:>12}")
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"baseline saved to {BASELINE}")
+        return 0
+    if regressions:
+        print(f"regressions (> {args.tolerance:.0%} slower than baseline): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
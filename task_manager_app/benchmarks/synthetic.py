@@ -0,0 +1,35 @@
+import random
+import uuid
+from datetime import date, datetime, timedelta
+
+from core.models import Task
+
+
+WORDS = (
+    "купить сделать позвонить отчёт проект встреча письмо курсовая молоко хлеб "
+    "report review deploy fix release meeting plan budget design test docs"
+).split()
+
+
+def make_task_dicts(n: int, seed: int = 42) -> list[dict]:
+    # Детерминированный набор задач, похожий на реальные данные tasks.json.
+    rnd = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    today = date(2025, 6, 1)
+    tasks = []
+    for i in range(n):
+        due = (today + timedelta(days=rnd.randint(-60, 120))).isoformat() if rnd.random() < 0.6 else ""
+        tasks.append({
+            "id": str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            "title": " ".join(rnd.choices(WORDS, k=rnd.randint(2, 5))),
+            "description": " ".join(rnd.choices(WORDS, k=rnd.randint(0, 15))),
+            "due_date": due,
+            "status": "done" if rnd.random() < 0.3 else "active",
+            "priority": rnd.choice(("low", "medium", "high")),
+            "created_at": (start + timedelta(seconds=i * 37)).isoformat(timespec="seconds"),
+        })
+    return tasks
+
+
+def make_tasks(n: int, seed: int = 42) -> list[Task]:
+    return [Task.from_dict(d) for d in make_task_dicts(n, seed)]
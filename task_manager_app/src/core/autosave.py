@@ -0,0 +1,101 @@
+import copy
+import threading
+
+from core.service import TaskService
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# Отложенное автосохранение: серия изменений подряд превращается в одну запись
+# через delay_ms тишины, а сама запись идёт в отдельном потоке по копии задач.
+#
+# after/after_cancel — таймер цикла событий (у Tk это widget.after/after_cancel):
+# тогда копия снимается в потоке UI, где живут мутации, и не может поймать
+# задачу на полпути. Без них используется threading.Timer.
+class AutosaveScheduler:
+    def __init__(self, service: TaskService, delay_ms: int = 1000, after=None, after_cancel=None):
+        self._service = service
+        self.delay_ms = delay_ms
+        self._after = after
+        self._after_cancel = after_cancel
+        self._timer = None
+
+        self._cond = threading.Condition()
+        self._pending = None        # последняя ещё не записанная копия
+        self._writing = False
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+        self._worker.start()
+
+    def schedule(self) -> None:
+        self._service.dirty = True
+        self._cancel_timer()
+        if self._after is not None:
+            self._timer = self._after(self.delay_ms, self._fire)
+        else:
+            self._timer = threading.Timer(self.delay_ms / 1000, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        # Синхронно: снять копию сейчас и дождаться, пока поток её запишет.
+        self._cancel_timer()
+        self._fire()
+        with self._cond:
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+
+    def close(self, flush: bool = True) -> None:
+        if flush:
+            self.flush()
+        else:
+            self._cancel_timer()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is None:
+            return
+        if self._after is not None:
+            self._after_cancel(self._timer)
+        else:
+            self._timer.cancel()
+        self._timer = None
+
+    def _fire(self) -> None:
+        self._timer = None
+        if not self._service.dirty:
+            return
+        if self._service.loading:
+            # в памяти ещё не все задачи — полная запись потеряла бы остальные
+            self.schedule()
+            return
+        snapshot = [copy.copy(t) for t in self._service.list_tasks()]
+        self._service.dirty = False
+        with self._cond:
+            # если прошлая копия ещё не записана — она уже устарела, пишем только новую
+            self._pending = snapshot
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                tasks, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                self._service.storage.save(tasks)
+            except Exception as e:
+                logger.exception("Autosave failed: %s", e)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
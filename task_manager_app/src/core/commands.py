@@ -0,0 +1,46 @@
+from datetime import date
+
+
+# Команды изменения задач ({"op": "add"|"update"|"done"|"delete", ...}) — общий
+# формат пакетного режима CLI и HTTP API. Данные приходят извне (stdin, клиент),
+# поэтому проверяются строже, чем вызовы TaskService из UI.
+
+# какие поля принимает каждая команда и допустимые значения перечислимых полей
+COMMAND_FIELDS = {
+    "add": {"title", "description", "due_date", "priority"},
+    "update": {"title", "description", "due_date", "status", "priority"},
+    "done": set(),
+    "delete": set(),
+}
+FIELD_VALUES = {"status": ("active", "done"), "priority": ("low", "medium", "high")}
+
+
+def check_command(cmd) -> None:
+    # Команда проверяется целиком до выполнения: неверное значение — ValueError
+    # без единого изменения, а не сбой посреди записи и не молча исправленное поле.
+    if not isinstance(cmd, dict):
+        raise ValueError("command must be a JSON object")
+    op = cmd.get("op")
+    if op not in COMMAND_FIELDS:
+        raise ValueError(f"unknown op: {op!r}")
+    if op != "add" and not isinstance(cmd.get("id"), str):
+        raise ValueError("id is required")
+    fields = {k: v for k, v in cmd.items() if k not in ("op", "id")}
+    unknown = set(fields) - COMMAND_FIELDS[op]
+    if unknown:
+        raise ValueError(f"unknown fields for {op}: {sorted(unknown)}")
+    if op == "add" and "title" not in fields:
+        raise ValueError("title is required")
+    for name, value in fields.items():
+        if not isinstance(value, str):
+            raise ValueError(f"{name} must be a string")
+        if name in FIELD_VALUES and value not in FIELD_VALUES[name]:
+            raise ValueError(f"{name} must be one of: {', '.join(FIELD_VALUES[name])}")
+    due = fields.get("due_date")
+    if due:
+        try:
+            valid = date.fromisoformat(due).isoformat() == due
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(f"due_date must be YYYY-MM-DD or empty, got {due!r}")
@@ -0,0 +1,20 @@
+from datetime import date
+
+
+NO_DATE = 0          # due: задача без срока
+
+
+# Срок как целое число (ordinal даты) — для ключа сортировки по сроку и двоичного
+# хранилища. None — дата не в формате YYYY-MM-DD, тогда её храним как есть, строкой.
+def encode_due(due_date: str) -> int | None:
+    if not due_date:
+        return NO_DATE
+    try:
+        d = date.fromisoformat(due_date)
+    except (ValueError, TypeError):
+        return None
+    return d.toordinal() if d.isoformat() == due_date else None
+
+
+def decode_due(ordinal: int) -> str:
+    return "" if ordinal == NO_DATE else date.fromordinal(ordinal).isoformat()
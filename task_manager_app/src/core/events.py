@@ -0,0 +1,152 @@
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from core.models import Task
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# События изменения задач, которые публикует TaskService (service.events).
+@dataclass(frozen=True, slots=True)
+class TaskCreated:
+    task: Task
+
+
+@dataclass(frozen=True, slots=True)
+class TaskUpdated:
+    task: Task
+    before: dict        # прежние значения изменённых полей
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset(self.before)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskDeleted:
+    task: Task          # удалённая задача (в сервисе её уже нет)
+
+
+@dataclass(frozen=True, slots=True)
+class TasksChanged:
+    # Несколько изменений одной группой (batch, отмена, sync), по одному
+    # итоговому событию на задачу. external — изменения пришли из хранилища
+    # (другой процесс), а не из этого.
+    events: tuple[TaskCreated | TaskUpdated | TaskDeleted, ...]
+    external: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TasksReloaded:
+    # Набор задач заменён целиком (load, постраничная загрузка): по событиям
+    # не восстановить, что изменилось, — только перечитать всё.
+    pass
+
+
+TaskEvent = TaskCreated | TaskUpdated | TaskDeleted
+Event = TaskEvent | TasksChanged | TasksReloaded
+
+
+class EventBus:
+    # Синхронная доставка подписчикам в потоке, где произошла мутация.
+    # Внутри coalesce() события копятся и на выходе из внешнего блока сливаются
+    # по задачам (создана+изменена = создана, создана+удалена = ничего, ...);
+    # подписчик получает одно событие или TasksChanged.
+    def __init__(self):
+        self._handlers: tuple[tuple[Callable, tuple[type, ...]], ...] = ()
+        self._depth = 0
+        self._pending: dict[str, TaskEvent] = {}
+        self._reloaded = False
+        self._external = False
+
+    def __bool__(self) -> bool:
+        # есть ли подписчики: без них сервис не создаёт события вовсе
+        return bool(self._handlers)
+
+    def subscribe(self, handler: Callable[[Event], None], *types: type) -> Callable[[], None]:
+        # types — только эти классы событий (по умолчанию все). Возвращает отписку.
+        entry = (handler, types)
+        self._handlers += (entry,)
+
+        def unsubscribe() -> None:
+            self._handlers = tuple(h for h in self._handlers if h is not entry)
+        return unsubscribe
+
+    def publish(self, event: Event) -> None:
+        if self._depth:
+            self._merge(event)
+        else:
+            self._deliver(event)
+
+    @contextmanager
+    def coalesce(self, external: bool = False):
+        if not self._depth:
+            self._external = external
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._flush()
+
+    def _merge(self, event: Event) -> None:
+        if isinstance(event, TasksReloaded):
+            self._reloaded = True
+            self._pending.clear()
+            return
+        if self._reloaded:
+            return
+        if isinstance(event, TasksChanged):
+            for e in event.events:
+                self._merge(e)
+            return
+
+        task_id = event.task.id
+        prev = self._pending.pop(task_id, None)
+        merged = event if prev is None else _combine(prev, event)
+        if merged is not None:
+            self._pending[task_id] = merged
+
+    def _flush(self) -> None:
+        events = tuple(self._pending.values())
+        reloaded, external = self._reloaded, self._external
+        self._pending = {}
+        self._reloaded = self._external = False
+        if reloaded:
+            self._deliver(TasksReloaded())
+        elif len(events) == 1 and not external:
+            self._deliver(events[0])
+        elif events:
+            self._deliver(TasksChanged(events, external))
+
+    def _deliver(self, event: Event) -> None:
+        for handler, types in self._handlers:
+            if types and not isinstance(event, types):
+                continue
+            try:
+                handler(event)
+            except Exception as e:
+                # сломанный подписчик не должен прерывать мутацию и остальных
+                logger.exception("Event handler %r failed on %s: %s", handler, type(event).__name__, e)
+
+
+def _combine(prev: TaskEvent, new: TaskEvent) -> TaskEvent | None:
+    # Итог двух событий одной задачи подряд; None — изменений в сумме нет.
+    if isinstance(new, TaskDeleted):
+        return None if isinstance(prev, TaskCreated) else new
+    if isinstance(prev, TaskCreated):
+        return TaskCreated(new.task)
+    if isinstance(prev, TaskDeleted):
+        # удалили и вернули (отмена внутри группы): объект задачи новый,
+        # поэтому событие остаётся, даже если поля совпали
+        old, cur = prev.task.to_dict(), new.task.to_dict()
+        return TaskUpdated(new.task, {k: v for k, v in old.items() if cur[k] != v})
+    if isinstance(new, TaskCreated):
+        return new
+    cur = new.task.to_dict()
+    before = {k: v for k, v in {**new.before, **prev.before}.items() if cur[k] != v}
+    return TaskUpdated(new.task, before) if before else None
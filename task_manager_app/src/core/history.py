@@ -0,0 +1,63 @@
+from collections import deque
+from dataclasses import dataclass
+
+
+# Одна правка задачи. before/after — None, если задачи не было (создание)
+# или не стало (удаление); для правки — только изменившиеся поля.
+# seq — порядковый номер задачи при создании/удалении, чтобы вернуть её на место.
+@dataclass(slots=True)
+class Change:
+    task_id: str
+    before: dict | None
+    after: dict | None
+    seq: int | None = None
+
+
+def diff(before: dict, after: dict) -> tuple[dict, dict]:
+    keys = [k for k in after if before.get(k) != after[k]]
+    return {k: before.get(k) for k in keys}, {k: after[k] for k in keys}
+
+
+class History:
+    # Журнал отмены: шаг — список правок (одна мутация или целый batch).
+    # Хранится не больше limit шагов, самые старые вытесняются.
+    def __init__(self, limit: int = 100):
+        self._undo: deque[list[Change]] = deque(maxlen=limit)
+        self._redo: list[list[Change]] = []
+
+    def push(self, changes: list[Change]) -> None:
+        if changes:
+            self._undo.append(changes)
+            self._redo.clear()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo_ids(self) -> list[str]:
+        return [c.task_id for c in self._undo[-1]] if self._undo else []
+
+    def redo_ids(self) -> list[str]:
+        return [c.task_id for c in self._redo[-1]] if self._redo else []
+
+    def pop_undo(self) -> list[Change] | None:
+        if not self._undo:
+            return None
+        changes = self._undo.pop()
+        self._redo.append(changes)
+        return changes
+
+    def pop_redo(self) -> list[Change] | None:
+        if not self._redo:
+            return None
+        changes = self._redo.pop()
+        self._undo.append(changes)
+        return changes
@@ -0,0 +1,121 @@
+import queue
+import threading
+import time
+from itertools import islice
+
+from core.service import TaskService
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# Постраничный старт: первая страница читается сразу, остальные задачи разбирает
+# фоновый поток, а в сервис они попадают порциями в потоке цикла событий
+# (через after), где живут и все остальные мутации.
+class BackgroundLoader:
+    def __init__(self, service: TaskService, after, first_page: int = 200, chunk_size: int = 5000,
+                 poll_ms: int = 30):
+        self._service = service
+        self._after = after
+        self.first_page = first_page
+        self.chunk_size = chunk_size
+        self.poll_ms = poll_ms
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._on_progress = None
+        self._on_done = None
+        self.done = False
+        self.error: str | None = None   # чтение оборвалось (задачи перечитаны через load)
+
+    def start(self, on_progress=None, on_done=None) -> None:
+        self._on_progress = on_progress
+        self._on_done = on_done
+
+        it = iter(self._service.storage.iter_load())
+        try:
+            first = list(islice(it, self.first_page))
+        except Exception as e:
+            # разбирается так же, как ошибка в фоне, — из цикла событий, когда UI уже готов
+            logger.exception("Lazy load: failed to read the first page: %s", e)
+            self._service.begin_load([])
+            self._queue.put(e)
+        else:
+            self._service.begin_load(first)
+            logger.info("Lazy load: first page of %d tasks", len(first))
+            self._thread = threading.Thread(target=self._read_rest, args=(it,), name="task-loader", daemon=True)
+            self._thread.start()
+        self._after(self.poll_ms, self._poll)
+
+    def finish_now(self) -> None:
+        # Дочитать всё синхронно (например, перед закрытием окна с несохранёнными правками).
+        if not self.done:
+            self._drain(budget=None)
+
+    def cancel(self) -> None:
+        self._stop.set()
+
+    def _read_rest(self, it) -> None:
+        storage = self._service.storage
+        try:
+            while not self._stop.is_set():
+                chunk = list(islice(it, self.chunk_size))
+                if not chunk:
+                    break
+                self._queue.put((chunk, storage.load_progress))
+        except Exception as e:
+            logger.exception("Lazy load: failed to read tasks: %s", e)
+            self._queue.put(e)
+        else:
+            self._queue.put(None)
+
+    def _poll(self) -> None:
+        if self.done:
+            return
+        # за один тик — не дольше ~четверти кадра, чтобы UI не подвисал
+        self._drain(budget=0.004)
+        if not self.done:
+            self._after(self.poll_ms, self._poll)
+
+    def _drain(self, budget: float | None) -> None:
+        start = time.perf_counter()
+        while not self.done:
+            try:
+                item = self._queue.get(block=budget is None)
+            except queue.Empty:
+                return
+            if item is None:
+                self._service.end_load()
+                self._finish()
+                return
+            if isinstance(item, Exception):
+                self._fail(item)
+                return
+
+            chunk, progress = item
+            self._service.load_more(chunk)
+            if self._on_progress:
+                self._on_progress(self._service.count(), progress)
+            if budget is not None and time.perf_counter() - start > budget:
+                return
+
+    def _fail(self, error: Exception) -> None:
+        # Прочитана только часть задач. end_load здесь нельзя: неполный список
+        # сошёл бы за загруженный, и первое же сохранение стёрло бы остальное.
+        # Перечитываем всё через load() — хранилище само возьмёт резервную копию
+        # или уберёт испорченный файл в .corrupt. Правки, сделанные за время
+        # загрузки, при этом теряются: сохранить их всё равно было нельзя.
+        self.error = str(error) or type(error).__name__
+        try:
+            self._service.load()
+        except Exception as e:
+            # не читается и целиком — сервис остаётся в loading, сохранения запрещены
+            logger.exception("Lazy load: full reload after a read error failed: %s", e)
+        self._finish()
+
+    def _finish(self) -> None:
+        self.done = True
+        if self._on_done:
+            self._on_done()
@@ -1,9 +1,11 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import uuid4
 
 
-@dataclass
+# slots=True: у экземпляра нет __dict__ — на больших списках это основная экономия памяти
+@dataclass(slots=True)
 class Task:
     title: str
     description: str = ""
@@ -30,9 +32,15 @@ class Task:
             title=data.get("title", ""),
             description=data.get("description", ""),
             due_date=data.get("due_date", ""),
-            status=data.get("status", "active"),
-            priority=data.get("priority", "medium"),
+            # у статуса и приоритета всего несколько значений — держим по одной копии строки
+            status=_interned(data.get("status"), "active"),
+            priority=_interned(data.get("priority"), "medium"),
         )
         t.id = data.get("id", t.id)
         t.created_at = data.get("created_at", t.created_at)
         return t
+
+
+def _interned(value, default: str) -> str:
+    # нет значения (или не строка) — значение по умолчанию, а не "None"
+    return sys.intern(value) if isinstance(value, str) and value else default
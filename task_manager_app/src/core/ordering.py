@@ -0,0 +1,126 @@
+import bisect
+
+from core.models import Task
+from core.encoding import NO_DATE, encode_due
+
+
+PRIORITY_RANK = {"high": 3, "medium": 2, "low": 1}
+STATUS_RANK = {"active": 0, "done": 1}
+
+# Ключи сортировки. К ключу ещё добавляется порядковый номер задачи,
+# поэтому равные по ключу задачи идут в порядке создания.
+SORT_KEYS = {
+    # high > medium > low
+    "priority": lambda t: (-PRIORITY_RANK.get(t.priority, 2),),
+    # сначала активные, внутри — по приоритету
+    "status": lambda t: (STATUS_RANK.get(t.status, 0), -PRIORITY_RANK.get(t.priority, 2)),
+    # задачи без срока — в конце
+    "due_date": lambda t: (t.due_date == "", t.due_date),
+    "created_at": lambda t: (t.created_at,),
+}
+
+
+class SortedView:
+    # Отсортированный список записей (ключ..., seq, id), который поддерживается
+    # вставками через bisect вместо полной пересортировки.
+    def __init__(self, key):
+        self._key = key
+        self._entries: list[tuple] = []
+        self._entry_of: dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def build(cls, key, tasks_with_seq) -> "SortedView":
+        # одна сортировка вместо вставки по одной
+        view = cls(key)
+        for task, seq in tasks_with_seq:
+            entry = (*key(task), seq, task.id)
+            view._entries.append(entry)
+            view._entry_of[task.id] = entry
+        view._entries.sort()
+        return view
+
+    def add(self, task: Task, seq: int) -> None:
+        entry = (*self._key(task), seq, task.id)
+        bisect.insort(self._entries, entry)
+        self._entry_of[task.id] = entry
+
+    def update(self, task: Task, seq: int) -> None:
+        old = self._entry_of.get(task.id)
+        if old is not None and old[:-2] == self._key(task):
+            return
+        self.remove(task.id)
+        self.add(task, seq)
+
+    def remove(self, task_id: str) -> None:
+        entry = self._entry_of.pop(task_id, None)
+        if entry is not None:
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def entry(self, task_id: str) -> tuple:
+        return self._entry_of[task_id]
+
+    def ids(self) -> list[str]:
+        return [e[-1] for e in self._entries]
+
+
+class DueIndex:
+    # Активные задачи со сроком, упорядоченные по сроку: записи (ordinal, seq, id).
+    # Дата разбирается один раз при добавлении/правке задачи, запросы по
+    # диапазону сроков — бинарный поиск и срез, O(log N + k).
+    def __init__(self):
+        self._entries: list[tuple[int, int, str]] = []
+        self._entry_of: dict[str, tuple[int, int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def build(cls, tasks_with_seq) -> "DueIndex":
+        # одна сортировка вместо вставки по одной
+        index = cls()
+        for task, seq in tasks_with_seq:
+            entry = cls._entry(task, seq)
+            if entry is not None:
+                index._entries.append(entry)
+                index._entry_of[task.id] = entry
+        index._entries.sort()
+        return index
+
+    @staticmethod
+    def _entry(task: Task, seq: int) -> tuple[int, int, str] | None:
+        if task.status != "active":
+            return None
+        ordinal = encode_due(task.due_date)
+        if ordinal is None or ordinal == NO_DATE:
+            return None
+        return ordinal, seq, task.id
+
+    def add(self, task: Task, seq: int) -> None:
+        entry = self._entry(task, seq)
+        if entry is not None:
+            bisect.insort(self._entries, entry)
+            self._entry_of[task.id] = entry
+
+    def update(self, task: Task, seq: int) -> None:
+        if self._entry_of.get(task.id) != self._entry(task, seq):
+            self.remove(task.id)
+            self.add(task, seq)
+
+    def remove(self, task_id: str) -> None:
+        entry = self._entry_of.pop(task_id, None)
+        if entry is not None:
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def between(self, lo: int | None = None, hi: int | None = None) -> list[str]:
+        # id задач со сроком lo <= ordinal < hi (None — без границы)
+        i = 0 if lo is None else bisect.bisect_left(self._entries, (lo,))
+        j = len(self._entries) if hi is None else bisect.bisect_left(self._entries, (hi,))
+        return [e[2] for e in self._entries[i:j]]
+
+    def first_from(self, lo: int) -> int | None:
+        # ближайший срок не раньше lo
+        i = bisect.bisect_left(self._entries, (lo,))
+        return self._entries[i][0] if i < len(self._entries) else None
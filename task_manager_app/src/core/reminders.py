@@ -0,0 +1,56 @@
+from datetime import datetime, time
+
+from core.service import TaskService
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# Не чаще, чем раз в столько, таймер всё равно перепроверяет время: after
+# не знает о переводе часов и сне компьютера.
+MAX_WAIT_MS = 6 * 60 * 60 * 1000
+
+
+# Напоминания о сроках без опроса: таймер ставится ровно на ближайшую границу
+# (полночь дня, когда у задачи наступает срок или она становится просроченной),
+# её сообщает индекс сроков сервиса. После мутаций нужен reschedule().
+#
+# after/after_cancel — таймер цикла событий (у Tk это widget.after/after_cancel).
+# on_remind(due_today, overdue) получает списки задач на момент срабатывания.
+class ReminderScheduler:
+    def __init__(self, service: TaskService, after, after_cancel, on_remind, now=datetime.now):
+        self._service = service
+        self._after = after
+        self._after_cancel = after_cancel
+        self._on_remind = on_remind
+        self._now = now
+        self._timer = None
+        self.next_boundary: datetime | None = None
+
+    def reschedule(self) -> None:
+        day = self._service.next_due_boundary()
+        boundary = None if day is None else datetime.combine(day, time.min)
+        if boundary == self.next_boundary and self._timer is not None:
+            return
+        self.cancel()
+        self.next_boundary = boundary
+        if boundary is None:
+            return
+        delay = int((boundary - self._now()).total_seconds() * 1000)
+        self._timer = self._after(max(0, min(delay, MAX_WAIT_MS)), self._fire)
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._after_cancel(self._timer)
+            self._timer = None
+        self.next_boundary = None
+
+    def _fire(self) -> None:
+        self._timer = None
+        if self.next_boundary is not None and self._now() >= self.next_boundary:
+            due_today, overdue = self._service.due_within(0), self._service.overdue()
+            logger.info("Reminder: %d due today, %d overdue", len(due_today), len(overdue))
+            self._on_remind(due_today, overdue)
+        self.next_boundary = None
+        self.reschedule()
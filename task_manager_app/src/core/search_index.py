@@ -0,0 +1,119 @@
+import bisect
+import re
+
+from core.models import Task
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# вес совпадения в названии выше, чем в описании
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+# полное совпадение слова ценнее совпадения по префиксу
+EXACT_BONUS = 2
+
+
+def tokenize(text: str) -> list[str]:
+    # casefold приводит регистр и для кириллицы; «ё» считаем за «е»
+    return _TOKEN_RE.findall((text or "").casefold().replace("ё", "е"))
+
+
+def matches(task: Task, query: str) -> bool:
+    # Та же семантика, что у SearchIndex.search, но для одной задачи без индекса.
+    words = tokenize(task.title) + tokenize(task.description)
+    return all(any(w.startswith(q) for w in words) for q in tokenize(query))
+
+
+class SearchIndex:
+    # Инвертированный индекс: слово -> {id задачи: вес}. Отсортированный словарь
+    # слов позволяет искать по префиксу бинарным поиском.
+    def __init__(self):
+        self._postings: dict[str, dict[str, int]] = {}
+        self._vocab: list[str] = []
+        self._doc_words: dict[str, dict[str, int]] = {}
+        self._seq: dict[str, int] = {}    # порядок добавления — для равных по рангу
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_words)
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._vocab.clear()
+        self._doc_words.clear()
+        self._seq.clear()
+        self._next_seq = 0
+
+    def add(self, task: Task) -> None:
+        if task.id in self._doc_words:
+            self._remove_words(task.id)
+        else:
+            self._seq[task.id] = self._next_seq
+            self._next_seq += 1
+
+        words: dict[str, int] = {}
+        for w in tokenize(task.title):
+            words[w] = words.get(w, 0) + TITLE_WEIGHT
+        for w in tokenize(task.description):
+            words[w] = words.get(w, 0) + DESCRIPTION_WEIGHT
+
+        self._doc_words[task.id] = words
+        for w, weight in words.items():
+            posting = self._postings.get(w)
+            if posting is None:
+                posting = self._postings[w] = {}
+                bisect.insort(self._vocab, w)
+            posting[task.id] = weight
+
+    update = add
+
+    def remove(self, task_id: str) -> None:
+        if task_id not in self._doc_words:
+            return
+        self._remove_words(task_id)
+        del self._doc_words[task_id]
+        del self._seq[task_id]
+
+    def search(self, query: str, candidates=None) -> list[str]:
+        # Все слова запроса должны совпасть (по префиксу). Результат — id по убыванию
+        # релевантности. candidates сужает поиск до уже найденного множества id.
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: dict[str, int] | None = None
+        # начинаем с самого редкого префикса — так промежуточные множества меньше
+        for term_scores in sorted((self._prefix_scores(q) for q in dict.fromkeys(terms)), key=len):
+            if scores is None:
+                scores = term_scores if candidates is None else {
+                    i: s for i, s in term_scores.items() if i in candidates
+                }
+            else:
+                scores = {i: s + term_scores[i] for i, s in scores.items() if i in term_scores}
+            if not scores:
+                return []
+
+        seq = self._seq
+        return sorted(scores, key=lambda i: (-scores[i], seq[i]))
+
+    def _prefix_scores(self, prefix: str) -> dict[str, int]:
+        scores: dict[str, int] = {}
+        vocab = self._vocab
+        i = bisect.bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            w = vocab[i]
+            bonus = EXACT_BONUS if w == prefix else 1
+            for task_id, weight in self._postings[w].items():
+                score = weight * bonus
+                if score > scores.get(task_id, 0):
+                    scores[task_id] = score
+            i += 1
+        return scores
+
+    def _remove_words(self, task_id: str) -> None:
+        for w in self._doc_words[task_id]:
+            posting = self._postings[w]
+            del posting[task_id]
+            if not posting:
+                del self._postings[w]
+                del self._vocab[bisect.bisect_left(self._vocab, w)]
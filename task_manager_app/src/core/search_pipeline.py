@@ -0,0 +1,64 @@
+from core.models import Task
+from core.service import TaskService
+
+
+# Поиск при наборе текста: запрос запускается только после паузы delay_ms,
+# новый символ отменяет и ожидающий запуск, и ещё не показанный результат.
+# Если новый запрос продолжает предыдущий («ab» -> «abc»), ищем только среди
+# уже найденного.
+#
+# after/after_cancel — таймер цикла событий (у Tk это widget.after/after_cancel).
+class SearchPipeline:
+    def __init__(self, service: TaskService, after, after_cancel, delay_ms: int = 150):
+        self._service = service
+        self._after = after
+        self._after_cancel = after_cancel
+        self.delay_ms = delay_ms
+
+        self._pending = None
+        self._generation = 0
+        self._last_key: tuple[str, str | None] | None = None   # (запрос, статус)
+        self._last_ids: set[str] | None = None
+        # задачи изменились — прошлый результат больше нельзя сужать
+        service.events.subscribe(lambda _event: self.invalidate())
+
+    def submit(self, query: str, status: str | None, on_done) -> None:
+        self.cancel()
+        gen = self._generation
+        self._pending = self._after(self.delay_ms, lambda: self._search(gen, query, status, on_done))
+
+    def cancel(self) -> None:
+        self._generation += 1
+        if self._pending is not None:
+            self._after_cancel(self._pending)
+            self._pending = None
+
+    def invalidate(self) -> None:
+        self._last_key = None
+        self._last_ids = None
+
+    def _search(self, gen: int, query: str, status: str | None, on_done) -> None:
+        self._pending = None
+        if gen != self._generation:
+            return
+
+        q = query.strip().casefold()
+        if not q:
+            self.invalidate()
+            tasks = self._service.list_tasks(status)
+        else:
+            within = None
+            if self._last_key is not None and self._last_key[1] == status and q.startswith(self._last_key[0]):
+                within = self._last_ids
+            tasks = self._service.search(q, status, within=within)
+            self._last_key = (q, status)
+            self._last_ids = {t.id for t in tasks}
+
+        # сортировку и отрисовку делаем следующим шагом цикла событий:
+        # если за это время пришёл новый символ, этот результат просто выбросится
+        self._pending = self._after(0, lambda: self._deliver(gen, tasks, on_done))
+
+    def _deliver(self, gen: int, tasks: list[Task], on_done) -> None:
+        self._pending = None
+        if gen == self._generation:
+            on_done(tasks)
@@ -1,96 +1,739 @@
+import sys
+import threading
+from collections import Counter
+from collections.abc import Collection, Iterable
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date
+from functools import wraps
+
+from core.events import EventBus, TaskCreated, TaskDeleted, TasksReloaded, TaskUpdated
+from core.history import Change, History, diff
 from core.models import Task
+from core.ordering import SORT_KEYS, DueIndex, SortedView
+from core.search_index import SearchIndex
 from storage.base import BaseStorage
 from utils.logging_conf import setup_logging
+from utils.rwlock import RWLock
 
 
 logger = setup_logging()
 
 
+# Публичные методы сервиса помечены как чтение или запись. В потокобезопасном
+# режиме (TaskService(..., thread_safe=True)) экземпляр получает обёртки под
+# блокировкой: чтения идут параллельно друг другу, записи — по одной и не
+# пересекаются с чтениями. Без него методы вызываются напрямую, без лишнего
+# уровня вызова (get_task и list_tasks — горячий путь UI).
+def _reads(method):
+    method._locking = "read"
+    return method
+
+
+def _writes(method):
+    method._locking = "write"
+    return method
+
+
+def _locked(bound, acquire):
+    @wraps(bound)
+    def locked(*args, **kwargs):
+        with acquire():
+            return bound(*args, **kwargs)
+    return locked
+
+
+def _check_types(**fields) -> None:
+    # Поля задачи — строки. Число в due_date или description сломало бы счётчики,
+    # сортировку и поиск уже после того, как задача изменена, поэтому проверка — до.
+    for name, value in fields.items():
+        if not isinstance(value, str):
+            raise TypeError(f"{name} must be a string, got {type(value).__name__}")
+
+
+# Ключи представлений сервиса: порядки сортировки и None — порядок создания (seq).
+_VIEW_KEYS = {None: lambda t: (), **SORT_KEYS}
+
+
+class _SeqOrder:
+    # Задачи в порядке seq без копии словаря (см. TaskService._in_order).
+    __slots__ = ("_tasks", "_view")
+
+    def __init__(self, tasks: dict[str, Task], view: SortedView):
+        self._tasks = tasks
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self):
+        tasks = self._tasks
+        return (tasks[i] for i in self._view.ids())
+
+    def __contains__(self, task) -> bool:
+        return getattr(task, "id", None) in self._tasks
+
+
 class TaskService:
-    def __init__(self, storage: BaseStorage):
+    def __init__(self, storage: BaseStorage, thread_safe: bool = False):
         self._storage = storage
-        self._tasks: list[Task] = []
+        # thread_safe: сервис используют несколько потоков (API, фоновое сохранение)
+        self._lock = RWLock() if thread_safe else None
+        if self._lock is not None:
+            for name in dir(type(self)):
+                mode = getattr(getattr(type(self), name), "_locking", None)
+                if mode is not None:
+                    acquire = self._lock.read if mode == "read" else self._lock.write
+                    setattr(self, name, _locked(getattr(self, name), acquire))
+        # ленивые индексы достраиваются и под блокировкой чтения — по одному потоку
+        self._build_lock = threading.Lock()
+        # id -> задача; dict сохраняет порядок вставки, так что он же задаёт порядок списка
+        self._tasks: dict[str, Task] = {}
+        # порядок dict разошёлся с seq (отмена удаления вернула задачу в конец словаря):
+        # порядок списка тогда берётся из представления по seq, см. _in_order
+        self._unordered = False
+        # есть изменения, которые ещё не попали в хранилище (мутации с autosave=False)
+        self.dirty = False
+        # идёт постраничная загрузка (begin_load ... end_load): в памяти пока не все задачи
+        self.loading = False
+        # порядковый номер задачи (порядок создания) — для устойчивой сортировки
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        # поисковый индекс и отсортированные представления строятся при первом
+        # обращении и дальше ведутся инкрементально
+        self._search: SearchIndex | None = None
+        self._views: dict[str | None, SortedView] = {}
+        self._due: DueIndex | None = None
+        # счётчики для stats(): обновляются на каждой мутации
+        self._by_status: Counter[str] = Counter()
+        self._by_priority: Counter[str] = Counter()
+        self._due_active: Counter[str] = Counter()   # срок -> число активных задач
+        self._stats_day = ""                         # на какой день посчитаны два поля ниже
+        self._overdue = 0
+        self._due_today = 0
+        # batch(): вложенность и то, что нужно записать/залогировать на выходе
+        self._batch_depth = 0
+        self._batch_puts: dict[str, Task] = {}
+        self._batch_deleted: dict[str, None] = {}
+        self._batch_log: Counter[str] = Counter()
+        # отмена/повтор: шаг — одна мутация или весь batch
+        self.history = History()
+        self._batch_changes: list[Change] = []
+        self._replaying = False
+        # события изменений для UI и других подписчиков (см. core/events.py)
+        self.events = EventBus()
         logger.info("TaskService initialized")
 
+    @property
+    def storage(self) -> BaseStorage:
+        return self._storage
+
+    @_writes
     def load(self) -> None:
-        self._tasks = self._storage.load()
+        self._tasks = {t.id: t for t in self._storage.load()}
+        self._reset_indexes()
+        self.history.clear()
+        self.dirty = False
+        self.loading = False
         logger.info("Service load: %d tasks in memory", len(self._tasks))
+        self._emit(TasksReloaded)
 
+    @_writes
     def save(self) -> None:
-        self._storage.save(self._tasks)
+        if self.loading:
+            # полная перезапись во время загрузки стёрла бы ещё не прочитанные задачи
+            logger.warning("Service save skipped: tasks are still loading")
+            return
+        if self._unordered:
+            # полная запись и так проходит по всем задачам — заодно выправляем порядок словаря
+            self._tasks = {t.id: t for t in self._in_order()}
+            self._unordered = False
+        self._storage.save(list(self._tasks.values()))
+        self.dirty = False
 
+    # Постраничная загрузка: первая страница сразу, остальное — порциями.
+    @_writes
+    def begin_load(self, first_page: list[Task]) -> None:
+        self._tasks = {t.id: t for t in first_page}
+        self._reset_indexes()
+        self.history.clear()
+        self.dirty = False
+        self.loading = True
+        self._emit(TasksReloaded)
+
+    @_writes
+    def load_more(self, tasks: list[Task]) -> None:
+        for t in tasks:
+            old = self._tasks.get(t.id)
+            if old is not None:
+                self._count(old, -1)
+                self._count(t, +1)
+            else:
+                self._seq[t.id] = self._next_seq
+                self._next_seq += 1
+                self._count(t, +1)
+            self._tasks[t.id] = t
+        # вставлять порцию в отсортированные представления по одной дороже,
+        # чем перестроить их при следующем обращении
+        self._search = None
+        self._views = {}
+        self._due = None
+
+    @_writes
+    def end_load(self) -> None:
+        self.loading = False
+        logger.info("Service load: %d tasks in memory", len(self._tasks))
+        self._emit(TasksReloaded)
+
+    @_writes
+    def sync(self) -> tuple[list[Task], list[str]]:
+        # Подтянуть изменения других процессов (см. BaseStorage.poll_changes).
+        # Возвращает изменённые/новые задачи и id удалённых. Существующие задачи
+        # обновляются на месте, чтобы ссылки на них в UI оставались верными.
+        if self.loading:
+            return [], []
+        changes = self._storage.poll_changes()
+        if changes is None:
+            return [], []
+
+        ops = changes.ops
+        if changes.snapshot is not None:
+            fresh = {t.id: t for t in changes.snapshot}
+            ops = [("del", i) for i in self._tasks if i not in fresh]
+            ops += [("put", t) for t in changes.snapshot if self._tasks.get(t.id) != t]
+
+        changed: dict[str, Task] = {}
+        removed: dict[str, None] = {}    # упорядоченное множество
+        with self.events.coalesce(external=True):
+            for op, value in ops:
+                if op == "del":
+                    t = self._tasks.pop(value, None)
+                    if t is not None:
+                        self._index_remove(t)
+                        changed.pop(value, None)
+                        removed[value] = None
+                        self._emit(TaskDeleted, t)
+                    continue
+
+                new = value
+                t = self._tasks.get(new.id)
+                if t is None:
+                    self._tasks[new.id] = t = new
+                    self._index_add(t)
+                    removed.pop(t.id, None)
+                    self._emit(TaskCreated, t)
+                elif t != new:
+                    text_changed = (t.title, t.description) != (new.title, new.description)
+                    before = t.to_dict()
+                    self._count(t, -1)
+                    t.title, t.description, t.due_date = new.title, new.description, new.due_date
+                    t.status, t.priority, t.created_at = new.status, new.priority, new.created_at
+                    self._count(t, +1)
+                    self._index_update(t, text_changed)
+                    self._emit(TaskUpdated, t, diff(before, t.to_dict())[0])
+                else:
+                    continue
+                changed[t.id] = t
+
+        if changed or removed:
+            logger.info("Service sync: %d changed, %d removed", len(changed), len(removed))
+        return list(changed.values()), list(removed)
+
+    @_writes
     def seed_demo_if_empty(self) -> None:
         if self._tasks:
             return
         logger.info("Seeding demo tasks (storage empty)")
-        self.add_task("Купить продукты", "Молоко, хлеб, яйца", "2025-01-10", "medium", autosave=False)
-        self.add_task("Сделать курсовую", "UI + JSON + логи + тесты + Docker", "2025-02-01", "high", autosave=False)
-        self.add_task("Погулять", "30 минут вечером", "", "low", autosave=False)
+        with self.events.coalesce():
+            self.add_task("Купить продукты", "Молоко, хлеб, яйца", "2025-01-10", "medium", autosave=False)
+            self.add_task("Сделать курсовую", "UI + JSON + логи + тесты + Docker", "2025-02-01", "high", autosave=False)
+            self.add_task("Погулять", "30 минут вечером", "", "low", autosave=False)
+        self.history.clear()
         self.save()
 
+    @_writes
     def add_task(self, title: str, description: str = "", due_date: str = "", priority: str = "medium", autosave: bool = True) -> Task:
-        priority = priority if priority in ("low", "medium", "high") else "medium"
+        _check_types(title=title, description=description, due_date=due_date, priority=priority)
+        priority = sys.intern(priority) if priority in ("low", "medium", "high") else "medium"
         task = Task(title=title.strip() or "Без названия", description=description, due_date=due_date, priority=priority)
-        self._tasks.append(task)
-        logger.info("Task created: id=%s title=%r priority=%s", task.id, task.title, task.priority)
-        if autosave:
-            self.save()
+        self._tasks[task.id] = task
+        self._index_add(task)
+        self._log("created", "Task created: id=%s title=%r priority=%s", task.id, task.title, task.priority)
+        self._record(Change(task.id, None, task.to_dict(), self._seq[task.id]))
+        self._persist(task.id, task, autosave)
+        self._emit(TaskCreated, task)
         return task
 
-    def list_tasks(self, status: str | None = None) -> list[Task]:
+    @_reads
+    def list_tasks(self, status: str | None = None, sort_by: str | None = None) -> list[Task]:
+        # sort_by: None (порядок создания) | "priority" | "status" | "due_date" | "created_at"
+        if sort_by is None:
+            tasks = self._in_order()
+        else:
+            tasks = (self._tasks[i] for i in self._view(sort_by).ids())
         if status is None:
-            return list(self._tasks)
-        return [t for t in self._tasks if t.status == status]
+            return list(tasks)
+        return [t for t in tasks if t.status == status]
 
+    def sort_key(self, sort_by: str):
+        # Ключ текущего порядка sort_by: годится для sort/bisect по задачам сервиса.
+        view = self._view(sort_by)
+        return lambda t: view.entry(t.id)
+
+    @_reads
+    def sort_key_before(self, sort_by: str, task: Task, before: dict) -> tuple:
+        # Ключ sort_key, который был у задачи до правки (before — как в TaskUpdated).
+        # Представление к моменту события уже обновлено, поэтому ключ собирается
+        # заново из прежних значений полей.
+        return (*SORT_KEYS[sort_by](replace(task, **before)), self._seq[task.id], task.id)
+
+    @_reads
+    def sort_tasks(self, tasks: list[Task], sort_by: str) -> list[Task]:
+        # Упорядочить подмножество задач (например, результат поиска) без
+        # пересчёта ключей — берём уже посчитанные из представления.
+        tasks.sort(key=self.sort_key(sort_by))
+        return tasks
+
+    @_reads
+    def count(self) -> int:
+        return len(self._tasks)
+
+    @_reads
     def get_task(self, task_id: str) -> Task | None:
-        for t in self._tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self._tasks.get(task_id)
 
+    @_writes
     def delete_task(self, task_id: str, autosave: bool = True) -> bool:
-        t = self.get_task(task_id)
-        before = len(self._tasks)
-        self._tasks = [x for x in self._tasks if x.id != task_id]
-        changed = len(self._tasks) != before
-        if changed:
-            logger.info("Task deleted: id=%s title=%r", task_id, (t.title if t else None))
-            if autosave:
-                self.save()
-        else:
+        t = self._tasks.pop(task_id, None)
+        if t is None:
             logger.warning("Task delete failed (not found): id=%s", task_id)
-        return changed
+            return False
+
+        seq = self._seq[task_id]
+        self._index_remove(t)
+        self._log("deleted", "Task deleted: id=%s title=%r", task_id, t.title)
+        self._record(Change(task_id, t.to_dict(), None, seq))
+        self._persist(task_id, None, autosave)
+        self._emit(TaskDeleted, t)
+        return True
 
-    def update_task(self, task_id: str, title: str, description: str, due_date: str, status: str, priority: str, autosave: bool = True) -> bool:
+    @_writes
+    def update_task(self, task_id: str, title: str, description: str, due_date: str, status: str, priority: str = "medium", autosave: bool = True) -> bool:
         t = self.get_task(task_id)
         if not t:
             logger.warning("Task update failed (not found): id=%s", task_id)
             return False
 
-        t.title = title.strip() or "Без названия"
-        t.description = description
-        t.due_date = due_date
-        t.status = status
-        t.priority = priority if priority in ("low", "medium", "high") else "medium"
+        # новые значения — до того, как задача и счётчики тронуты: ошибка здесь
+        # не должна оставить их рассогласованными
+        _check_types(title=title, description=description, due_date=due_date, status=status, priority=priority)
+        title = title.strip() or "Без названия"
+        # как в Task.from_dict: по одной копии строки статуса и приоритета на все задачи
+        status = sys.intern(status)
+        priority = sys.intern(priority) if priority in ("low", "medium", "high") else "medium"
 
-        logger.info("Task updated: id=%s title=%r status=%s priority=%s", t.id, t.title, t.status, t.priority)
-        if autosave:
-            self.save()
+        before = t.to_dict()
+        self._count(t, -1)
+        t.title, t.description, t.due_date, t.status, t.priority = title, description, due_date, status, priority
+        self._count(t, +1)
+        self._index_update(t)
+
+        self._log("updated", "Task updated: id=%s title=%r status=%s priority=%s", t.id, t.title, t.status, t.priority)
+        change = Change(t.id, *diff(before, t.to_dict()))
+        self._record(change)
+        self._persist(t.id, t, autosave)
+        if change.before:
+            self._emit(TaskUpdated, t, change.before)
         return True
 
+    @_writes
     def mark_done(self, task_id: str, autosave: bool = True) -> bool:
         t = self.get_task(task_id)
         if not t:
             logger.warning("Task mark_done failed (not found): id=%s", task_id)
             return False
+        old_status = t.status
+        self._count(t, -1)
         t.status = "done"
-        logger.info("Task marked done: id=%s title=%r", t.id, t.title)
-        if autosave:
-            self.save()
+        self._count(t, +1)
+        self._index_update(t, text_changed=False)
+        self._log("done", "Task marked done: id=%s title=%r", t.id, t.title)
+        self._record(Change(t.id, {"status": old_status}, {"status": "done"}))
+        self._persist(t.id, t, autosave)
+        if old_status != "done":
+            self._emit(TaskUpdated, t, {"status": old_status})
         return True
 
+    # Групповые операции: одна запись в хранилище и одна строка лога на всю группу.
+    @_writes
+    def add_many(self, items: Iterable[dict], autosave: bool = True) -> list[Task]:
+        # items — dict с полями title/description/due_date/priority (как у add_task)
+        items = list(items)
+        if len(items) > len(self._tasks):
+            # вставлять по одной в отсортированные представления дороже,
+            # чем перестроить их при следующем обращении
+            self._search = None
+            self._views = {}
+            self._due = None
+        with self.batch():
+            return [
+                self.add_task(d.get("title", ""), d.get("description", ""), d.get("due_date", ""),
+                              d.get("priority", "medium"), autosave=autosave)
+                for d in items
+            ]
+
+    @_writes
+    def update_many(self, task_ids: Iterable[str], autosave: bool = True, **fields) -> int:
+        # fields — новые значения полей update_task, одинаковые для всех задач
+        # (например, status="done" или priority="high"); остальные поля не меняются
+        unknown = set(fields) - {"title", "description", "due_date", "status", "priority"}
+        if unknown:
+            raise ValueError(f"Unknown task fields: {sorted(unknown)}")
+        count = 0
+        with self.batch():
+            for task_id in task_ids:
+                t = self.get_task(task_id)
+                if t is None:
+                    logger.warning("Task update failed (not found): id=%s", task_id)
+                    continue
+                count += self.update_task(
+                    task_id,
+                    fields.get("title", t.title), fields.get("description", t.description),
+                    fields.get("due_date", t.due_date), fields.get("status", t.status),
+                    fields.get("priority", t.priority), autosave=autosave,
+                )
+        return count
+
+    @_writes
+    def import_tasks(self, items: Iterable[dict], autosave: bool = True) -> tuple[int, int]:
+        # Загрузить задачи с сохранением id и даты создания (импорт, перенос между
+        # хранилищами): новые id добавляются, существующие — перезаписываются.
+        # Возвращает (добавлено, обновлено).
+        added = updated = 0
+        with self.batch():
+            for item in items:
+                new = Task.from_dict(item)
+                _check_types(title=new.title, description=new.description, due_date=new.due_date)
+                t = self._tasks.get(new.id)
+                if t is None:
+                    self._tasks[new.id] = new
+                    self._index_add(new)
+                    self._record(Change(new.id, None, new.to_dict(), self._seq[new.id]))
+                    self._log("created", "Task imported: id=%s title=%r", new.id, new.title)
+                    self._persist(new.id, new, autosave)
+                    self._emit(TaskCreated, new)
+                    added += 1
+                    continue
+
+                before = t.to_dict()
+                if before == new.to_dict():
+                    continue
+                self._count(t, -1)
+                for field, value in new.to_dict().items():
+                    setattr(t, field, value)
+                self._count(t, +1)
+                self._index_update(t)
+                change = Change(t.id, *diff(before, t.to_dict()))
+                self._record(change)
+                self._log("updated", "Task imported: id=%s title=%r", t.id, t.title)
+                self._persist(t.id, t, autosave)
+                self._emit(TaskUpdated, t, change.before)
+                updated += 1
+        return added, updated
+
+    @_writes
+    def delete_many(self, task_ids: Iterable[str], autosave: bool = True) -> int:
+        with self.batch():
+            return sum(self.delete_task(i, autosave=autosave) for i in list(task_ids))
+
+    @_writes
+    def mark_done_many(self, task_ids: Iterable[str], autosave: bool = True) -> int:
+        with self.batch():
+            return sum(self.mark_done(i, autosave=autosave) for i in task_ids)
+
+    @contextmanager
+    def batch(self):
+        # Внутри блока мутации с autosave=True не пишутся сразу: изменённые задачи
+        # копятся и уходят в хранилище одним save_changes на выходе из внешнего
+        # batch (даже если блок прерван исключением — в памяти изменения уже есть).
+        # Построчный лог задач понижается до DEBUG, на выходе — одна итоговая строка.
+        # В потокобезопасном режиме весь блок держит блокировку записи.
+        # События блока сливаются и доставляются одной группой после записи.
+        if self._lock is not None:
+            self._lock.acquire_write()
+        try:
+            with self.events.coalesce():
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0:
+                        self._end_batch()
+        finally:
+            if self._lock is not None:
+                self._lock.release_write()
+
+    def _end_batch(self) -> None:
+        self.history.push(self._batch_changes)
+        self._batch_changes = []
+        puts, deleted = list(self._batch_puts.values()), list(self._batch_deleted)
+        self._batch_puts.clear()
+        self._batch_deleted.clear()
+        if self._batch_log:
+            logger.info("Batch: %s", ", ".join(f"{n} {kind}" for kind, n in self._batch_log.items()))
+            self._batch_log.clear()
+        if puts or deleted:
+            self._storage.save_changes(puts, deleted, self._in_order())
+
+    def _persist(self, task_id: str, task: Task | None, autosave: bool) -> None:
+        # task=None — задача удалена
+        if not autosave:
+            self.dirty = True
+        elif self._batch_depth:
+            if task is None:
+                self._batch_puts.pop(task_id, None)
+                self._batch_deleted[task_id] = None
+            else:
+                self._batch_deleted.pop(task_id, None)
+                self._batch_puts[task_id] = task
+        elif task is None:
+            self._storage.delete_task(task_id, self._in_order())
+        else:
+            self._storage.save_task(task, self._in_order())
+
+    # Отмена и повтор. Применённые правки уходят в хранилище одной группой
+    # (save_changes), а не полной перезаписью. Возвращают id затронутых задач.
+    @_writes
+    def undo(self, autosave: bool = True) -> list[str]:
+        changes = self.history.pop_undo()
+        if changes is None:
+            return []
+        self._replay([(c.task_id, c.before, c.after is None, c.seq) for c in reversed(changes)], autosave)
+        logger.info("Undo: %d changes", len(changes))
+        return list(dict.fromkeys(c.task_id for c in changes))
+
+    @_writes
+    def redo(self, autosave: bool = True) -> list[str]:
+        changes = self.history.pop_redo()
+        if changes is None:
+            return []
+        self._replay([(c.task_id, c.after, c.before is None, c.seq) for c in changes], autosave)
+        logger.info("Redo: %d changes", len(changes))
+        return list(dict.fromkeys(c.task_id for c in changes))
+
+    def _replay(self, states: list[tuple[str, dict | None, bool, int | None]], autosave: bool) -> None:
+        # state: None — задачи быть не должно; full — полный dict задачи
+        # (вернуть удалённую на прежнее место seq); иначе — значения изменённых полей
+        self._replaying = True
+        reorder = False
+        try:
+            with self.batch():
+                for task_id, state, full, seq in states:
+                    t = self._tasks.get(task_id)
+                    if state is None:
+                        if t is not None:
+                            self.delete_task(task_id, autosave=autosave)
+                    elif t is None:
+                        if full:
+                            t = self._tasks[task_id] = Task.from_dict(state)
+                            self._index_add(t, seq)
+                            reorder = reorder or (seq is not None and seq < self._next_seq - 1)
+                            self._persist(task_id, t, autosave)
+                            self._emit(TaskCreated, t)
+                    else:
+                        text_changed = "title" in state or "description" in state
+                        before = {field: getattr(t, field) for field in state}
+                        self._count(t, -1)
+                        for field, value in state.items():
+                            setattr(t, field, value)
+                        self._count(t, +1)
+                        self._index_update(t, text_changed)
+                        self._persist(task_id, t, autosave)
+                        self._emit(TaskUpdated, t, before)
+            if reorder:
+                # вернувшаяся задача — в конце словаря; на место её ставит представление
+                # по seq (вставка bisect), а не пересортировка всех задач
+                self._unordered = True
+        finally:
+            self._replaying = False
+
+    def _record(self, change: Change) -> None:
+        # правка без изменений (те же значения, mark_done уже выполненной) —
+        # не шаг отмены и не повод сбрасывать redo
+        if self._replaying or change.before == change.after:
+            return
+        if self._batch_depth:
+            self._batch_changes.append(change)
+        else:
+            self.history.push([change])
+
+    def _emit(self, event_type, *args) -> None:
+        # без подписчиков событие даже не создаётся
+        if self.events:
+            self.events.publish(event_type(*args))
+
+    def _log(self, kind: str, msg: str, *args) -> None:
+        if self._batch_depth:
+            self._batch_log[kind] += 1
+            logger.debug(msg, *args)
+        else:
+            logger.info(msg, *args)
+
+    @_reads
+    def search(self, query: str, status: str | None = None, within: set[str] | None = None) -> list[Task]:
+        # Задачи, где каждое слово запроса встречается (по префиксу) в названии
+        # или описании; более релевантные — раньше. within — искать только среди этих id.
+        index = self._search
+        if index is None:
+            with self._build_lock:
+                index = self._search
+                if index is None:
+                    index = SearchIndex()
+                    for t in self._tasks.values():
+                        index.add(t)
+                    self._search = index
+        found = (self._tasks[i] for i in index.search(query, within))
+        if status is None:
+            return list(found)
+        return [t for t in found if t.status == status]
+
+    # Запросы по сроку среди активных задач; результат упорядочен по сроку.
+    @_reads
+    def due_before(self, day: date | str) -> list[Task]:
+        return self._due_between(None, self._ordinal(day))
+
+    @_reads
+    def overdue(self) -> list[Task]:
+        return self.due_before(self._today())
+
+    @_reads
+    def due_within(self, days: int) -> list[Task]:
+        # от сегодня до сегодня + days включительно (days=0 — только сегодня)
+        today = self._ordinal(self._today())
+        return self._due_between(today, today + days + 1)
+
+    @_reads
+    def next_due_boundary(self) -> date | None:
+        # Ближайший день, с наступлением которого у какой-то задачи срок
+        # становится «сегодня» или задача становится просроченной.
+        today = self._ordinal(self._today())
+        first = self._due_index().first_from(today)
+        return None if first is None else date.fromordinal(max(first, today + 1))
+
+    def _due_between(self, lo: int | None, hi: int | None) -> list[Task]:
+        return [self._tasks[i] for i in self._due_index().between(lo, hi)]
+
+    def _due_index(self) -> DueIndex:
+        if self._due is None:
+            with self._build_lock:
+                if self._due is None:
+                    self._due = DueIndex.build((t, self._seq[t.id]) for t in self._tasks.values())
+        return self._due
+
+    @staticmethod
+    def _ordinal(day: date | str) -> int:
+        return (date.fromisoformat(day) if isinstance(day, str) else day).toordinal()
+
+    def _view(self, sort_by: str | None) -> SortedView:
+        view = self._views.get(sort_by)
+        if view is None:
+            if sort_by not in _VIEW_KEYS:
+                raise ValueError(f"Unknown sort order: {sort_by!r}")
+            with self._build_lock:
+                view = self._views.get(sort_by)
+                if view is None:
+                    # в словарь — только заполненное представление
+                    seq = self._seq
+                    view = SortedView.build(_VIEW_KEYS[sort_by], ((t, seq[t.id]) for t in self._tasks.values()))
+                    self._views[sort_by] = view
+        return view
+
+    def _in_order(self) -> Collection[Task]:
+        # Задачи в порядке seq (порядок списка и файла): обычно это сам словарь.
+        if not self._unordered:
+            return self._tasks.values()
+        return _SeqOrder(self._tasks, self._view(None))
+
+    def _reset_indexes(self) -> None:
+        self._unordered = False
+        self._seq = {task_id: i for i, task_id in enumerate(self._tasks)}
+        self._next_seq = len(self._seq)
+        self._search = None
+        self._views = {}
+        self._due = None
+        self._by_status.clear()
+        self._by_priority.clear()
+        self._due_active.clear()
+        self._stats_day = ""
+        for t in self._tasks.values():
+            self._count(t, +1)
+
+    def _index_add(self, task: Task, seq: int | None = None) -> None:
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        self._seq[task.id] = seq
+        self._count(task, +1)
+        if self._search is not None:
+            self._search.add(task)
+        for view in self._views.values():
+            view.add(task, seq)
+        if self._due is not None:
+            self._due.add(task, seq)
+
+    def _index_update(self, task: Task, text_changed: bool = True) -> None:
+        if text_changed and self._search is not None:
+            self._search.update(task)
+        seq = self._seq[task.id]
+        for view in self._views.values():
+            view.update(task, seq)
+        if self._due is not None:
+            self._due.update(task, seq)
+
+    def _index_remove(self, task: Task) -> None:
+        task_id = task.id
+        del self._seq[task_id]
+        self._count(task, -1)
+        if self._search is not None:
+            self._search.remove(task_id)
+        for view in self._views.values():
+            view.remove(task_id)
+        if self._due is not None:
+            self._due.remove(task_id)
+
+    def _count(self, task: Task, sign: int) -> None:
+        self._by_status[task.status] += sign
+        self._by_priority[task.priority] += sign
+        if task.status == "active" and task.due_date:
+            self._due_active[task.due_date] += sign
+            if task.due_date < self._stats_day:
+                self._overdue += sign
+            elif task.due_date == self._stats_day:
+                self._due_today += sign
+
+    def _today(self) -> str:
+        return date.today().isoformat()
+
+    @_reads
     def stats(self) -> dict:
+        today = self._today()
+        if today != self._stats_day:
+            # сменился день — пересчитываем по числу различных сроков, а не задач
+            with self._build_lock:
+                if today != self._stats_day:
+                    self._overdue = sum(n for d, n in self._due_active.items() if d < today)
+                    self._due_today = self._due_active.get(today, 0)
+                    self._stats_day = today
+
         total = len(self._tasks)
-        done = sum(1 for t in self._tasks if t.status == "done")
-        active = total - done
-        return {"total": total, "active": active, "done": done}
+        done = self._by_status["done"]
+        return {
+            "total": total,
+            "active": total - done,
+            "done": done,
+            "overdue": self._overdue,
+            "due_today": self._due_today,
+            "by_status": {k: n for k, n in self._by_status.items() if n},
+            "by_priority": {k: n for k, n in self._by_priority.items() if n},
+        }
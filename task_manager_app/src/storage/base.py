@@ -1,8 +1,25 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass, field
+
 from core.models import Task
 
 
+@dataclass
+class StorageChanges:
+    # Изменения, сделанные другими процессами с прошлого опроса.
+    # ops — записи в порядке появления: ("put", Task) или ("del", id).
+    ops: list[tuple[str, object]] = field(default_factory=list)
+    # не None — инкрементально догнать не вышло, здесь полный актуальный список задач
+    snapshot: list[Task] | None = None
+
+
 class BaseStorage(ABC):
+    # True, если save_task/delete_task пишут одну запись, а не весь список
+    incremental = False
+    # доля прочитанного при iter_load (0..1), если хранилище умеет её оценить
+    load_progress: float | None = None
+
     @abstractmethod
     def load(self) -> list[Task]:
         raise NotImplementedError
@@ -10,3 +27,29 @@ class BaseStorage(ABC):
     @abstractmethod
     def save(self, tasks: list[Task]) -> None:
         raise NotImplementedError
+
+    def iter_load(self) -> Iterator[Task]:
+        # Задачи по одной. По умолчанию — через полную загрузку; хранилища,
+        # умеющие читать потоково, переопределяют.
+        yield from self.load()
+
+    # Точечные изменения. По умолчанию хранилище умеет только полную перезапись,
+    # поэтому вместе с изменением передаётся вся коллекция задач сервиса.
+    def save_task(self, task: Task, tasks: Collection[Task]) -> None:
+        self.save(list(tasks))
+
+    def delete_task(self, task_id: str, tasks: Collection[Task]) -> None:
+        self.save(list(tasks))
+
+    def save_changes(self, puts: list[Task], deleted: list[str], tasks: Collection[Task]) -> None:
+        # Группа изменений (TaskService.batch): сначала удаления, затем добавления
+        # и правки. По умолчанию — одна полная перезапись.
+        self.save(list(tasks))
+
+    def poll_changes(self) -> StorageChanges | None:
+        # Чужие изменения с прошлого вызова; None — нет изменений или
+        # хранилище не умеет их отслеживать.
+        return None
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,259 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from core.encoding import NO_DATE, decode_due, encode_due
+from core.models import Task
+from storage.base import BaseStorage
+from storage.json_storage import JsonStorage
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# Формат снимка (все числа little-endian):
+#   заголовок | таблица записей фиксированной ширины | куча строк (utf-8) | meta (json)
+# Запись: uuid (16 байт), created_at (секунды от EPOCH), due_date (ordinal),
+# коды статуса и приоритета, флаги и ссылки (смещение, длина) на строки в куче.
+# meta хранит имена статусов/приоритетов для кодов.
+MAGIC = b"TMB1"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxQQQI")    # magic, version, count, heap_offset, meta_offset, meta_len
+RECORD = struct.Struct("<16sqiBBBxQIQIQI")
+
+# флаги: поле не укладывается в компактный вид и лежит строкой в extra (json)
+RAW_ID = 1
+RAW_CREATED = 2
+RAW_DUE = 4
+
+EPOCH = datetime(1970, 1, 1)
+
+
+# Поля записи: id — 16 байт uuid, created_at — секунды от EPOCH. None — значение
+# не укладывается в формат (чужой id, нестандартная дата), тогда оно уходит в extra.
+def encode_id(task_id: str) -> bytes | None:
+    try:
+        u = UUID(task_id)
+    except (ValueError, AttributeError, TypeError):
+        return None
+    # UUID принимает и записи без дефисов/в верхнем регистре — их храним строкой,
+    # чтобы id после обратного преобразования не изменился
+    return u.bytes if str(u) == task_id else None
+
+
+def decode_id(raw: bytes) -> str:
+    return str(UUID(bytes=bytes(raw)))
+
+
+def encode_created(created_at: str) -> int | None:
+    try:
+        dt = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is not None or dt.isoformat(timespec="seconds") != created_at:
+        return None
+    return int((dt - EPOCH).total_seconds())
+
+
+def decode_created(seconds: int) -> str:
+    return (EPOCH + timedelta(seconds=seconds)).isoformat(timespec="seconds")
+
+
+class BinaryTasks(Sequence):
+    # Задачи снимка поверх mmap: Task собирается только при обращении к строке.
+    def __init__(self, mm, count: int, heap_offset: int, statuses: list[str], priorities: list[str]):
+        self._mm = mm
+        self._count = count
+        self._heap = heap_offset
+        self._statuses = [sys.intern(s) for s in statuses]
+        self._priorities = [sys.intern(p) for p in priorities]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(self._count))]
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+
+        (raw_id, created, due, status, priority, flags,
+         title_off, title_len, desc_off, desc_len, extra_off, extra_len) = RECORD.unpack_from(
+            self._mm, HEADER.size + row * RECORD.size)
+        extra = json.loads(self._str(extra_off, extra_len)) if flags else {}
+        return Task(
+            title=self._str(title_off, title_len),
+            description=self._str(desc_off, desc_len),
+            due_date=extra["due_date"] if flags & RAW_DUE else decode_due(due),
+            status=self._statuses[status],
+            priority=self._priorities[priority],
+            id=extra["id"] if flags & RAW_ID else decode_id(raw_id),
+            created_at=extra["created_at"] if flags & RAW_CREATED else decode_created(created),
+        )
+
+    def _str(self, offset: int, length: int) -> str:
+        if not length:
+            return ""
+        start = self._heap + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+
+def write_snapshot(path: Path, tasks: Iterable[Task]) -> int:
+    tasks = list(tasks)
+    statuses: list[str] = []
+    priorities: list[str] = []
+    heap_offset = HEADER.size + len(tasks) * RECORD.size
+    table = bytearray()
+
+    def code(names: list[str], value: str) -> int:
+        try:
+            return names.index(value)
+        except ValueError:
+            names.append(value)
+            return len(names) - 1
+
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        # куча пишется сразу в файл, таблица записей копится в памяти и
+        # встаёт на своё место перед кучей в конце
+        f.seek(heap_offset)
+        heap_pos = 0
+
+        def put(text: str) -> tuple[int, int]:
+            nonlocal heap_pos
+            if not text:
+                return 0, 0
+            data = text.encode("utf-8")
+            f.write(data)
+            heap_pos += len(data)
+            return heap_pos - len(data), len(data)
+
+        for t in tasks:
+            flags, extra = 0, {}
+            raw_id = encode_id(t.id)
+            if raw_id is None:
+                flags, extra["id"], raw_id = flags | RAW_ID, t.id, bytes(16)
+            created = encode_created(t.created_at)
+            if created is None:
+                flags, extra["created_at"], created = flags | RAW_CREATED, t.created_at, 0
+            due = encode_due(t.due_date)
+            if due is None:
+                flags, extra["due_date"], due = flags | RAW_DUE, t.due_date, NO_DATE
+
+            table += RECORD.pack(
+                raw_id, created, due, code(statuses, t.status), code(priorities, t.priority), flags,
+                *put(t.title), *put(t.description),
+                *put(json.dumps(extra, ensure_ascii=False) if extra else ""),
+            )
+
+        if len(statuses) > 255 or len(priorities) > 255:
+            raise ValueError("too many distinct status/priority values for the binary format")
+        meta = json.dumps({"statuses": statuses, "priorities": priorities}).encode("utf-8")
+        meta_offset = heap_offset + heap_pos
+        f.write(meta)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, len(tasks), heap_offset, meta_offset, len(meta)))
+        f.write(table)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return len(tasks)
+
+
+class BinaryStorage(BaseStorage):
+    # Снимок в бинарном формате: load() не разбирает файл, а отображает его в
+    # память и отдаёт ленивую последовательность задач.
+    def __init__(self, filepath: str):
+        self.path = Path(filepath)
+        self._file = None
+        self._mm = None
+
+    def open(self) -> BinaryTasks:
+        self.close()
+        self._file = self.path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, heap_offset, meta_offset, meta_len = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"not a task snapshot (magic={magic!r}, version={version})")
+            meta = json.loads(self._mm[meta_offset:meta_offset + meta_len])
+        except Exception:
+            self.close()
+            raise
+        return BinaryTasks(self._mm, count, heap_offset, meta["statuses"], meta["priorities"])
+
+    def load(self) -> Sequence[Task]:
+        if not self.path.exists():
+            logger.info("Binary load: file not found (%s) -> empty list", self.path)
+            return []
+        try:
+            tasks = self.open()
+        except Exception as e:
+            logger.exception("Binary load: failed to open %s: %s", self.path, e)
+            return []
+        logger.info("Binary load: mapped %d tasks from %s", len(tasks), self.path)
+        return tasks
+
+    def iter_load(self) -> Iterator[Task]:
+        tasks = self.load()
+        total = len(tasks) or 1
+        self.load_progress = 0.0
+        for i, t in enumerate(tasks, 1):
+            yield t
+            if i % 1000 == 0:
+                # число задач известно из заголовка — прогресс точный
+                self.load_progress = i / total
+        self.load_progress = 1.0
+
+    def save(self, tasks: Iterable[Task]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # задачи могут ссылаться на текущее отображение — читаем их до замены файла
+            tasks = list(tasks)
+            self.close()
+            count = write_snapshot(self.path, tasks)
+            logger.info("Binary save: saved %d tasks to %s", count, self.path)
+        except Exception as e:
+            logger.exception("Binary save: failed to write %s: %s", self.path, e)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def json_to_binary(json_path: str, bin_path: str) -> int:
+    tasks = JsonStorage(json_path, streaming=True).load()
+    BinaryStorage(bin_path).save(tasks)
+    return len(tasks)
+
+
+def binary_to_json(bin_path: str, json_path: str) -> int:
+    storage = BinaryStorage(bin_path)
+    try:
+        tasks = storage.load()
+        JsonStorage(json_path).save(tasks)
+        return len(tasks)
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    # python -m storage.binary_storage data/tasks.json data/tasks.bin   — json -> снимок
+    # python -m storage.binary_storage data/tasks.bin data/tasks.json   — обратно
+    src, dst = sys.argv[1:3]
+    convert = binary_to_json if src.endswith(".bin") else json_to_binary
+    print(f"{convert(src, dst)} tasks: {src} -> {dst}")
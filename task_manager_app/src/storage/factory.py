@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from storage.base import BaseStorage
+from storage.binary_storage import BinaryStorage, json_to_binary
+from storage.journal_storage import JournalStorage
+from storage.json_storage import JsonStorage
+from storage.shared_storage import SharedJournalStorage
+from storage.sqlite_storage import migrate_json
+
+
+def make_storage(kind: str, filepath: str) -> BaseStorage:
+    if kind == "journal":
+        return JournalStorage(filepath)
+    if kind == "shared":
+        return SharedJournalStorage(filepath)
+    if kind == "sqlite":
+        # при первом запуске переносим существующий tasks.json в базу
+        return migrate_json(filepath, str(Path(filepath).with_suffix(".db")))
+    if kind == "binary":
+        bin_path = Path(filepath).with_suffix(".bin")
+        if not bin_path.exists() and Path(filepath).exists():
+            json_to_binary(filepath, str(bin_path))
+        return BinaryStorage(str(bin_path))
+    return JsonStorage(filepath)
@@ -0,0 +1,155 @@
+import json
+import os
+import shutil
+import threading
+from collections.abc import Collection
+from pathlib import Path
+
+from core.models import Task
+from storage.base import BaseStorage
+from storage.json_storage import JsonStorage, write_json_file
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+# Снимок tasks.json + журнал изменений (одна JSON-строка на мутацию).
+# Журнал дописывается при каждом изменении, а когда он перерастает
+# compact_threshold байт, в фоне пишется новый снимок и журнал обнуляется.
+class JournalStorage(BaseStorage):
+    incremental = True
+
+    def __init__(self, filepath: str, compact_threshold: int = 1024 * 1024):
+        self.snapshot = JsonStorage(filepath)
+        self.path = self.snapshot.path
+        self.journal_path = self.path.with_suffix(".journal")
+        # журнал, который сейчас сворачивается в снимок
+        self.compacting_path = self.path.with_suffix(".journal.old")
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.Lock()
+        self._journal = None
+        self._journal_size = 0
+        self._compactor: threading.Thread | None = None
+
+    def load(self) -> list[Task]:
+        self.wait_compaction()
+        tasks = {t.id: t for t in self.snapshot.load()}
+        replayed = 0
+        for path in (self.compacting_path, self.journal_path):
+            replayed += self._replay(path, tasks)
+        self._journal_size = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        logger.info("Journal load: %d tasks (%d journal records replayed)", len(tasks), replayed)
+        return list(tasks.values())
+
+    def save(self, tasks: list[Task]) -> None:
+        self.wait_compaction()
+        with self._lock:
+            self._close_journal()
+            self._write_snapshot([t.to_dict() for t in tasks])
+            self.journal_path.unlink(missing_ok=True)
+            self.compacting_path.unlink(missing_ok=True)
+            self._journal_size = 0
+
+    def save_task(self, task: Task, tasks: Collection[Task]) -> None:
+        self._append([{"op": "put", "task": task.to_dict()}], tasks)
+
+    def delete_task(self, task_id: str, tasks: Collection[Task]) -> None:
+        self._append([{"op": "del", "id": task_id}], tasks)
+
+    def save_changes(self, puts: list[Task], deleted: list[str], tasks: Collection[Task]) -> None:
+        records = [{"op": "del", "id": i} for i in deleted]
+        records += [{"op": "put", "task": t.to_dict()} for t in puts]
+        self._append(records, tasks)
+
+    def close(self) -> None:
+        self.wait_compaction()
+        with self._lock:
+            self._close_journal()
+
+    def wait_compaction(self) -> None:
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def _replay(self, path: Path, tasks: dict[str, Task]) -> int:
+        if not path.exists():
+            return 0
+
+        count = 0
+        with path.open("r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # недописанная строка после падения — всё, что дальше, не применяем
+                    logger.warning("Journal load: broken record at %s:%d, ignoring the tail", path, lineno)
+                    break
+
+                op = record.get("op")
+                if op == "put" and isinstance(record.get("task"), dict):
+                    t = Task.from_dict(record["task"])
+                    tasks[t.id] = t
+                elif op == "del":
+                    tasks.pop(record.get("id"), None)
+                else:
+                    logger.warning("Journal load: unknown record at %s:%d", path, lineno)
+                    continue
+                count += 1
+        return count
+
+    def _append(self, records: list[dict], tasks: Collection[Task]) -> None:
+        line = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records)
+        try:
+            with self._lock:
+                if self._journal is None:
+                    self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._journal = self.journal_path.open("a", encoding="utf-8")
+                self._journal.write(line)
+                self._journal.flush()
+                self._journal_size += len(line.encode("utf-8"))
+                need_compaction = self._journal_size >= self.compact_threshold
+        except Exception as e:
+            logger.exception("Journal append: failed to write %s: %s", self.journal_path, e)
+            return
+
+        if need_compaction and (self._compactor is None or not self._compactor.is_alive()):
+            self._start_compaction(tasks)
+
+    def _start_compaction(self, tasks: Collection[Task]) -> None:
+        # Снимок данных берём в вызывающем потоке, в фоне только сериализация и запись.
+        data = [t.to_dict() for t in tasks]
+
+        with self._lock:
+            self._close_journal()
+            if self.compacting_path.exists():
+                # прошлое сворачивание не завершилось — не теряем его записи
+                with self.compacting_path.open("ab") as dst, self.journal_path.open("rb") as src:
+                    shutil.copyfileobj(src, dst)
+                self.journal_path.unlink()
+            else:
+                os.replace(self.journal_path, self.compacting_path)
+            self._journal_size = 0
+
+        logger.info("Journal compaction started: %d tasks", len(data))
+        self._compactor = threading.Thread(target=self._compact, args=(data,), name="journal-compactor", daemon=True)
+        self._compactor.start()
+
+    def _compact(self, data: list[dict]) -> None:
+        try:
+            self._write_snapshot(data)
+            self.compacting_path.unlink(missing_ok=True)
+            logger.info("Journal compaction finished: %s", self.path)
+        except Exception as e:
+            logger.exception("Journal compaction failed for %s: %s", self.path, e)
+
+    def _write_snapshot(self, data: list[dict]) -> None:
+        write_json_file(self.path, data, self.snapshot.compact)
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -1,4 +1,10 @@
+import io
 import json
+import os
+import re
+import shutil
+import zlib
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from core.models import Task
@@ -9,36 +15,292 @@ from utils.logging_conf import setup_logging
 logger = setup_logging()
 
 
+READ_CHUNK = 64 * 1024      # символов за одно чтение при потоковой загрузке
+WRITE_CHUNK = 1000          # задач за одну запись при сохранении
+
+# Контрольная сумма — отдельной строкой после массива. Потоковый разбор на неё
+# не смотрит (читает только до «]»), проверяет её _verify. Файлы без строки
+# (старые или записанные чужой программой) принимаются, если не обрезаны.
+FOOTER = "\n#crc32=%08x\n"
+FOOTER_RE = re.compile(rb"\n#crc32=([0-9a-f]{8})\n\Z")
+FOOTER_LEN = len(FOOTER % 0)
+
+
+def iter_json_array(f, chunk_size: int = READ_CHUNK) -> Iterator:
+    # Потоковый разбор JSON-массива верхнего уровня: элементы отдаются по одному,
+    # в памяти держится только текущий кусок файла.
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_ws()
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("expected a JSON array")
+    pos += 1
+
+    skip_ws()
+    if pos < len(buf) and buf[pos] == "]":
+        return
+
+    while True:
+        skip_ws()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # элемент не поместился в буфер целиком — дочитываем
+                if not fill():
+                    raise
+                continue
+            # значение, упёршееся в конец буфера, могло быть обрезано (число, литерал)
+            if end == len(buf) and not eof and fill():
+                continue
+            break
+        pos = end
+        yield item
+
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("unexpected end of JSON array")
+        if buf[pos] == "]":
+            return
+        if buf[pos] != ",":
+            raise ValueError(f"expected ',' or ']' in JSON array, got {buf[pos]!r}")
+        pos += 1
+
+
+def write_json_array(f, items: Iterable[dict], compact: bool = False, chunk_size: int = WRITE_CHUNK) -> int:
+    # Запись массива кусками по chunk_size элементов, без промежуточного списка всех dict.
+    # Без compact результат совпадает с json.dump(..., ensure_ascii=False, indent=2).
+    if compact:
+        def encode(item):
+            return json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+        sep, head, tail = ",", "[", "]"
+    else:
+        def encode(item):
+            return "  " + json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+        sep, head, tail = ",\n", "[\n", "\n]"
+
+    count = 0
+    parts: list[str] = []
+    for item in items:
+        parts.append(encode(item))
+        count += 1
+        if len(parts) >= chunk_size:
+            f.write((head if count == len(parts) else sep) + sep.join(parts))
+            parts = []
+
+    if count == 0:
+        f.write("[]")
+        return 0
+    if parts:
+        f.write((head if count == len(parts) else sep) + sep.join(parts))
+    f.write(tail)
+    return count
+
+
+class _CrcWriter:
+    # Текстовая запись в бинарный файл с подсчётом crc32 на лету.
+    def __init__(self, f):
+        self._f = f
+        self.crc = 0
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.crc = zlib.crc32(data, self.crc)
+        self._f.write(data)
+
+
+def _fsync_dir(path: Path) -> None:
+    # после rename сбрасываем и каталог, иначе после сбоя питания имя может
+    # указывать на старый файл; на Windows каталоги так не открываются
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_json_file(path: Path, items: Iterable[dict], compact: bool = False) -> int:
+    # Атомарная запись: временный файл -> fsync -> os.replace. При сбое на любом
+    # шаге на диске остаётся прежняя версия файла целиком.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("wb") as f:
+            out = _CrcWriter(f)
+            count = write_json_array(out, items, compact)
+            f.write((FOOTER % out.crc).encode("ascii"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+    return count
+
+
+def _verify(path: Path) -> None:
+    # ValueError, если строка с контрольной суммой есть и не сходится. У файла
+    # без неё проверяется хотя бы конец: обрезанный массив не кончается на «]».
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        f.seek(max(size - FOOTER_LEN, 0))
+        tail = f.read()
+        m = FOOTER_RE.search(tail)
+        if m is None:
+            if not tail.rstrip().endswith(b"]"):
+                raise ValueError(f"{path} is truncated (no closing ']')")
+            return
+        f.seek(0)
+        crc, left = 0, size - FOOTER_LEN
+        while left > 0:
+            data = f.read(min(left, 1 << 20))
+            if not data:
+                break
+            crc = zlib.crc32(data, crc)
+            left -= len(data)
+    if crc != int(m.group(1), 16):
+        raise ValueError(f"checksum mismatch in {path}")
+
+
 class JsonStorage(BaseStorage):
-    def __init__(self, filepath: str):
+    # streaming: load() разбирает файл по одной задаче (см. iter_load) вместо json.load;
+    # compact: сохранять без отступов — файл меньше, запись быстрее;
+    # backups: сколько прошлых версий хранить рядом (tasks.json.bak1, .bak2, ...).
+    def __init__(self, filepath: str, streaming: bool = False, compact: bool = False, backups: int = 2):
         self.path = Path(filepath)
+        self.streaming = streaming
+        self.compact = compact
+        self.backups = backups
+
+    def backup_path(self, n: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.bak{n}")
 
     def load(self) -> list[Task]:
-        if not self.path.exists():
+        for path in self._generations():
+            try:
+                _verify(path)
+                tasks = list(self._iter_file(path)) if self.streaming else self._read_file(path)
+            except Exception as e:
+                logger.exception("JSON load: failed to read/parse %s: %s", path, e)
+                continue
+            if path != self.path:
+                self._restore(path)
+            logger.info("JSON load: loaded %d tasks from %s%s", len(tasks), path,
+                        " (streaming)" if self.streaming else "")
+            return tasks
+
+        if self.path.exists():
+            self._quarantine()
+        else:
             logger.info("JSON load: file not found (%s) -> empty list", self.path)
-            return []
+        return []
+
+    def iter_load(self) -> Iterator[Task]:
+        # Генератор задач по одной. Как и load(), при ошибке проверки или разбора
+        # переходит к следующей целой версии (и восстанавливает файл из неё),
+        # а если целых нет — убирает файл в .corrupt. Ошибку разбора после того,
+        # как часть задач уже отдана, не исправить — она пробрасывается,
+        # и вызывающий перечитывает всё через load().
+        for path in self._generations():
+            yielded = False
+            try:
+                _verify(path)
+                for task in self._iter_file(path):
+                    yielded = True
+                    yield task
+            except Exception as e:
+                if yielded:
+                    raise
+                logger.exception("JSON load: failed to read/parse %s: %s", path, e)
+                continue
+            if path != self.path:
+                self._restore(path)
+            return
+        if self.path.exists():
+            self._quarantine()
 
+    def save(self, tasks: Iterable[Task]) -> None:
         try:
-            with self.path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            self._rotate()
+            count = write_json_file(self.path, (t.to_dict() for t in tasks), self.compact)
+            logger.info("JSON save: saved %d tasks to %s", count, self.path)
         except Exception as e:
-            logger.exception("JSON load: failed to read/parse %s: %s", self.path, e)
-            return []
+            logger.exception("JSON save: failed to write %s: %s", self.path, e)
 
+    def _read_file(self, path: Path) -> list[Task]:
+        with path.open("rb") as f:
+            data = f.read()
+        m = FOOTER_RE.search(data, max(len(data) - FOOTER_LEN, 0))
+        data = json.loads(data[:m.start()] if m else data)
         if not isinstance(data, list):
-            logger.warning("JSON load: invalid format (expected list) in %s", self.path)
-            return []
+            raise ValueError(f"invalid format (expected list) in {path}")
+        return [Task.from_dict(item) for item in data if isinstance(item, dict)]
+
+    def _iter_file(self, path: Path) -> Iterator[Task]:
+        # По ходу чтения обновляет load_progress (по байтам файла).
+        total = path.stat().st_size or 1
+        self.load_progress = 0.0
+        with path.open("rb") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+            for n, item in enumerate(iter_json_array(f), 1):
+                if isinstance(item, dict):
+                    yield Task.from_dict(item)
+                if n % 1000 == 0:
+                    self.load_progress = min(raw.tell() / total, 1.0)
+        self.load_progress = 1.0
 
-        tasks = [Task.from_dict(item) for item in data if isinstance(item, dict)]
-        logger.info("JSON load: loaded %d tasks from %s", len(tasks), self.path)
-        return tasks
+    def _generations(self) -> list[Path]:
+        paths = [self.path] + [self.backup_path(n) for n in range(1, self.backups + 1)]
+        return [p for p in paths if p.exists()]
 
-    def save(self, tasks: list[Task]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = [t.to_dict() for t in tasks]
+    def _rotate(self) -> None:
+        # tasks.json -> .bak1 -> .bak2 -> ...; текущий файл не переименовываем, а
+        # связываем жёсткой ссылкой, чтобы между шагами он не пропадал с диска
+        if self.backups <= 0 or not self.path.exists():
+            return
+        for n in range(self.backups, 1, -1):
+            if self.backup_path(n - 1).exists():
+                os.replace(self.backup_path(n - 1), self.backup_path(n))
+        bak = self.backup_path(1)
+        bak.unlink(missing_ok=True)
         try:
-            with self.path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info("JSON save: saved %d tasks to %s", len(tasks), self.path)
-        except Exception as e:
-            logger.exception("JSON save: failed to write %s: %s", self.path, e)
+            os.link(self.path, bak)
+        except OSError:
+            shutil.copy2(self.path, bak)
+
+    def _restore(self, backup: Path) -> None:
+        logger.warning("JSON load: %s is damaged, restored from %s", self.path, backup)
+        if self.path.exists():
+            self._quarantine()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        shutil.copy2(backup, tmp)
+        os.replace(tmp, self.path)
+
+    def _quarantine(self) -> None:
+        # испорченный файл не удаляем: его может удастся восстановить вручную
+        broken = self.path.with_name(self.path.name + ".corrupt")
+        os.replace(self.path, broken)
+        logger.error("JSON load: no readable version of %s, damaged file moved to %s", self.path, broken)
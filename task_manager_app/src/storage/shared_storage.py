@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+from collections.abc import Collection
+from contextlib import contextmanager
+from pathlib import Path
+
+from core.models import Task
+from storage.base import StorageChanges
+from storage.journal_storage import JournalStorage
+from utils.logging_conf import setup_logging
+
+try:
+    import fcntl
+except ImportError:     # Windows: рекомендательных блокировок fcntl нет
+    fcntl = None
+
+
+logger = setup_logging()
+
+
+def _file_id(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class FileLock:
+    # Межпроцессная блокировка через flock на отдельном файле (сам tasks.json
+    # заменяется через rename, держать блокировку на нём нельзя).
+    def __init__(self, path: Path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._fd: int | None = None
+        self._depth = 0
+
+    @contextmanager
+    def hold(self, exclusive: bool = True):
+        with self._thread_lock:
+            if self._depth == 0:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    os.close(self._fd)      # закрытие снимает flock
+                    self._fd = None
+
+
+# Журнал, который могут одновременно вести несколько процессов (две копии
+# приложения, CLI рядом с GUI). Каждая запись дописывается под блокировкой,
+# перед этим процесс дочитывает чужие записи с того места, где остановился, —
+# они копятся и отдаются сервису через poll_changes. Если журнал свернули в
+# снимок в другом процессе, догнать по записям нельзя: тогда отдаётся полный
+# список задач, а сервис сам вычисляет разницу.
+class SharedJournalStorage(JournalStorage):
+    def __init__(self, filepath: str, compact_threshold: int = 1024 * 1024):
+        super().__init__(filepath, compact_threshold)
+        self.lock = FileLock(self.path.with_suffix(".lock"))
+        self._offset = 0            # до какого байта журнал уже прочитан
+        self._journal_id: tuple | None = None
+        self._snapshot_id: tuple | None = None
+        self._pending: list[dict] = []
+        self._stale = False         # снимок сменился в другом процессе
+
+    def load(self) -> list[Task]:
+        with self._lock, self.lock.hold(exclusive=False):
+            tasks = super().load()
+            self._remember_files()
+            self._pending = []
+            self._stale = False
+        return tasks
+
+    def save(self, tasks: list[Task]) -> None:
+        with self._lock, self.lock.hold():
+            self._read_external()
+            if self._stale:
+                # снимок уже переписан другим процессом, а разницу с ним мы ещё не
+                # забрали: выигрывает последняя запись, то есть эта
+                logger.warning("Shared storage: overwriting a snapshot changed by another process")
+            self._write_full(tasks)
+
+    def poll_changes(self) -> StorageChanges | None:
+        with self._lock, self.lock.hold(exclusive=False):
+            self._read_external()
+            if self._stale:
+                tasks = super().load()
+                self._remember_files()
+                self._pending = []
+                self._stale = False
+                logger.info("Shared storage: snapshot changed by another process, %d tasks", len(tasks))
+                return StorageChanges(snapshot=tasks)
+            pending, self._pending = self._pending, []
+
+        if not pending:
+            return None
+        ops = []
+        for record in pending:
+            if record["op"] == "put":
+                ops.append(("put", Task.from_dict(record["task"])))
+            else:
+                ops.append(("del", record["id"]))
+        logger.info("Shared storage: %d changes from other processes", len(ops))
+        return StorageChanges(ops=ops)
+
+    def _append(self, records: list[dict], tasks: Collection[Task]) -> None:
+        line = "".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records
+        ).encode("utf-8")
+        try:
+            with self._lock, self.lock.hold():
+                self._read_external()
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                # файл открываем на каждую запись: другой процесс мог заменить журнал
+                with self.journal_path.open("ab") as f:
+                    f.write(line)
+                    self._offset = f.tell()
+                self._journal_id = _file_id(self.journal_path)
+                self._journal_size = self._offset
+                # сворачиваем сразу и под той же блокировкой: фоновое сворачивание
+                # из нескольких процессов пришлось бы согласовывать между собой.
+                # Процесс с устаревшим видом снимка не сворачивает — дождётся poll_changes.
+                if self._journal_size >= self.compact_threshold and not self._stale:
+                    self._write_full(tasks)
+        except Exception as e:
+            logger.exception("Shared journal append: failed to write %s: %s", self.journal_path, e)
+
+    def _write_full(self, tasks: Collection[Task]) -> None:
+        # Под блокировкой: новый снимок вместо снимка и журнала. Чужие записи,
+        # которые сервис этого процесса ещё не забрал, в снимок тоже попадают.
+        data = {t.id: t.to_dict() for t in tasks}
+        if not self._stale:
+            self._apply(self._pending, data)
+        self._write_snapshot(list(data.values()))
+        self.journal_path.unlink(missing_ok=True)
+        self.compacting_path.unlink(missing_ok=True)
+        self._remember_files()
+
+    def _read_external(self) -> None:
+        # Вызывается под блокировкой: дочитать чужие записи журнала.
+        if self._stale:
+            return
+        if _file_id(self.path) != self._snapshot_id:
+            self._stale = True
+            return
+
+        journal_id = _file_id(self.journal_path)
+        if journal_id is None:
+            if self._journal_id is not None:
+                self._stale = True
+            return
+        if self._journal_id is not None and journal_id[:2] != self._journal_id[:2]:
+            self._stale = True
+            return
+        if self._journal_id is None:
+            self._offset = 0
+
+        with self.journal_path.open("rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # хвост без перевода строки — запись, которую кто-то ещё дописывает без блокировки
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                logger.warning("Shared journal: broken record in %s, skipped", self.journal_path)
+                continue
+            op = record.get("op")
+            if (op == "put" and isinstance(record.get("task"), dict)) or (op == "del" and "id" in record):
+                self._pending.append(record)
+        self._offset += end
+        self._journal_id = journal_id
+
+    def _remember_files(self) -> None:
+        self._snapshot_id = _file_id(self.path)
+        self._journal_id = _file_id(self.journal_path)
+        self._offset = self._journal_id[3] if self._journal_id else 0
+        self._journal_size = self._offset
+
+    @staticmethod
+    def _apply(records: list[dict], data: dict[str, dict]) -> None:
+        for record in records:
+            if record["op"] == "put":
+                data[record["task"]["id"]] = record["task"]
+            else:
+                data.pop(record["id"], None)
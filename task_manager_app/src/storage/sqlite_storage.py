@@ -0,0 +1,209 @@
+import sqlite3
+import sys
+import threading
+from collections.abc import Collection, Iterator
+from pathlib import Path
+
+from core.models import Task
+from storage.base import BaseStorage
+from storage.json_storage import JsonStorage
+from utils.logging_conf import setup_logging
+
+
+logger = setup_logging()
+
+
+COLUMNS = ("id", "title", "description", "due_date", "status", "priority", "created_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    due_date    TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL DEFAULT 'active',
+    priority    TEXT NOT NULL DEFAULT 'medium',
+    created_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+"""
+
+SELECT_SQL = f"SELECT {', '.join(COLUMNS)} FROM tasks"
+# порядок вставки хранится в rowid, upsert его не меняет
+UPSERT_SQL = (
+    f"INSERT INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+    "ON CONFLICT(id) DO UPDATE SET title=excluded.title, description=excluded.description, "
+    "due_date=excluded.due_date, status=excluded.status, priority=excluded.priority, "
+    "created_at=excluded.created_at"
+)
+DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+
+
+def _row(task: Task) -> tuple:
+    return (task.id, task.title, task.description, task.due_date, task.status, task.priority, task.created_at)
+
+
+def _task(row: tuple) -> Task:
+    return Task.from_dict(dict(zip(COLUMNS, row)))
+
+
+class SqliteStorage(BaseStorage):
+    incremental = True
+
+    def __init__(self, filepath: str):
+        self.path = Path(filepath)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def load(self) -> list[Task]:
+        with self._lock:
+            rows = self._conn.execute(SELECT_SQL + " ORDER BY rowid").fetchall()
+        tasks = [_task(r) for r in rows]
+        logger.info("SQLite load: loaded %d tasks from %s", len(tasks), self.path)
+        return tasks
+
+    def iter_load(self) -> Iterator[Task]:
+        # отдельный курсор и fetchmany — в памяти только текущая пачка строк
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] or 1
+            cur = self._conn.execute(SELECT_SQL + " ORDER BY rowid")
+        done = 0
+        self.load_progress = 0.0
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(1000)
+            if not rows:
+                break
+            for r in rows:
+                yield _task(r)
+            done += len(rows)
+            self.load_progress = min(done / total, 1.0)
+        self.load_progress = 1.0
+
+    def save(self, tasks: list[Task]) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.execute("DELETE FROM tasks")
+                    self._conn.executemany(UPSERT_SQL, (_row(t) for t in tasks))
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            logger.info("SQLite save: saved %d tasks to %s", len(tasks), self.path)
+        except Exception as e:
+            logger.exception("SQLite save: failed to write %s: %s", self.path, e)
+
+    def save_task(self, task: Task, tasks: Collection[Task]) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(UPSERT_SQL, _row(task))
+        except Exception as e:
+            logger.exception("SQLite save: failed to upsert id=%s: %s", task.id, e)
+
+    def delete_task(self, task_id: str, tasks: Collection[Task]) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(DELETE_SQL, (task_id,))
+        except Exception as e:
+            logger.exception("SQLite save: failed to delete id=%s: %s", task_id, e)
+
+    def save_changes(self, puts: list[Task], deleted: list[str], tasks: Collection[Task]) -> None:
+        # вся группа — одна транзакция
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(DELETE_SQL, ((i,) for i in deleted))
+                    self._conn.executemany(UPSERT_SQL, (_row(t) for t in puts))
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            logger.exception("SQLite save: failed to apply %d changes: %s", len(puts) + len(deleted), e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Запросы, которые выполняет сама БД (по индексам), без загрузки всех задач в память.
+    def query(self, status: str | None = None, priority: str | None = None) -> list[Task]:
+        sql, params = SELECT_SQL, []
+        where = []
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if priority is not None:
+            where.append("priority = ?")
+            params.append(priority)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY rowid", params).fetchall()
+        return [_task(r) for r in rows]
+
+    def due_before(self, due_date: str) -> list[Task]:
+        with self._lock:
+            rows = self._conn.execute(
+                SELECT_SQL + " WHERE due_date != '' AND due_date < ? ORDER BY due_date, rowid", (due_date,)
+            ).fetchall()
+        return [_task(r) for r in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        by_status = dict(rows)
+        total = sum(by_status.values())
+        done = by_status.get("done", 0)
+        return {"total": total, "active": total - done, "done": done}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def import_json(self, json_path: str) -> int:
+        tasks = JsonStorage(json_path).load()
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(UPSERT_SQL, (_row(t) for t in tasks))
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            logger.exception("SQLite import: failed to import %s: %s", json_path, e)
+            return 0
+        logger.info("SQLite import: imported %d tasks from %s", len(tasks), json_path)
+        return len(tasks)
+
+
+def migrate_json(json_path: str, db_path: str) -> SqliteStorage:
+    # Однократный перенос tasks.json: факт миграции помечаем в user_version,
+    # чтобы опустевшая со временем база не импортировала старый файл заново.
+    storage = SqliteStorage(db_path)
+    with storage._lock:
+        migrated = storage._conn.execute("PRAGMA user_version").fetchone()[0]
+    if not migrated:
+        if Path(json_path).exists():
+            storage.import_json(json_path)
+        with storage._lock:
+            storage._conn.execute("PRAGMA user_version = 1")
+    return storage
+
+
+if __name__ == "__main__":
+    # python -m storage.sqlite_storage [data/tasks.json] [data/tasks.db]
+    args = sys.argv[1:]
+    json_path = args[0] if len(args) > 0 else "data/tasks.json"
+    db_path = args[1] if len(args) > 1 else "data/tasks.db"
+    migrate_json(json_path, db_path).close()
@@ -1,23 +1,37 @@
+import tkinter as tk
 import customtkinter as ctk
 from datetime import datetime
 
+from core.autosave import AutosaveScheduler
+from core.events import TaskDeleted, TasksChanged, TasksReloaded, TaskUpdated
+from core.lazy_load import BackgroundLoader
+from core.reminders import ReminderScheduler
+from core.search_index import matches
+from core.search_pipeline import SearchPipeline
 from core.service import TaskService
-from storage.json_storage import JsonStorage
+from storage.factory import make_storage
 from ui.views import SidebarView, TaskListView, TaskDetailsView
 from ui.dialogs import NewTaskDialog, MessageDialog, ConfirmDialog, SettingsDialog
-from utils.logging_conf import setup_logging
+from utils.logging_conf import configure_logging, stop_logging
 from utils.settings import Settings
 
 
+SYNC_MS = 1000      # как часто забирать изменения других процессов (хранилище "shared")
+
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
 
-        self.logger = setup_logging()
-
         # Настройки
         self.settings = Settings("data/settings.json")
         self.settings.load()
+
+        self.logger = configure_logging(
+            level=self.settings.log_level,
+            console_level=self.settings.console_log_level,
+            use_queue=self.settings.log_async,
+        )
         ctk.set_appearance_mode(self.settings.appearance_mode)
         ctk.set_default_color_theme("blue")
 
@@ -25,14 +39,26 @@ class App(ctk.CTk):
         self.geometry("1100x650")
         self.minsize(950, 550)
 
-        self.storage = JsonStorage("data/tasks.json")
+        self.storage = make_storage(self.settings.storage, "data/tasks.json")
         self.service = TaskService(self.storage)
-        self.service.load()
-        self.service.seed_demo_if_empty()
+        self.loader: BackgroundLoader | None = None
+        if self.settings.lazy_load:
+            # первая страница — сразу, остальное догружается в фоне (см. on_load_progress)
+            self.loader = BackgroundLoader(self.service, self.after)
+            self.loader.start(self.on_load_progress, self.on_load_done)
+        else:
+            self.service.load()
+            self.service.seed_demo_if_empty()
+        self.autosaver = AutosaveScheduler(
+            self.service, self.settings.autosave_delay_ms, self.after, self.after_cancel
+        )
+        self.search_pipeline = SearchPipeline(self.service, self.after, self.after_cancel)
+        self.reminders = ReminderScheduler(self.service, self.after, self.after_cancel, self.on_remind)
 
         self.selected_id: str | None = None
         self.current_filter: str | None = None  # None / "active" / "done"
         self.search_query: str = ""
+        self.sort_by: str = "priority"
 
         self.grid_columnconfigure(0, weight=0)
         self.grid_columnconfigure(1, weight=1)
@@ -51,20 +77,126 @@ class App(ctk.CTk):
         # callbacks
         self.list_view.on_select = self.on_select_task
         self.list_view.on_search = self.on_search
+        self.list_view.on_sort = self.on_sort
 
         self.sidebar.btn_all.configure(command=self.show_all)
         self.sidebar.btn_active.configure(command=self.show_active)
         self.sidebar.btn_done.configure(command=self.show_done)
         self.sidebar.btn_new.configure(command=self.create_task)
         self.sidebar.btn_settings.configure(command=self.open_settings)
-        self.sidebar.btn_exit.configure(command=self.destroy)
+        self.sidebar.btn_exit.configure(command=self.on_close)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.details_view.btn_save.configure(command=self.save_selected)
         self.details_view.btn_delete.configure(command=self.delete_selected)
         self.details_view.btn_done.configure(command=self.mark_selected_done)
-
+        self.list_view.btn_bulk_done.configure(command=self.mark_many_done)
+        self.list_view.btn_bulk_delete.configure(command=self.delete_many_selected)
+
+        # отмена/повтор; Cyrillic_ya/Cyrillic_en — те же клавиши в русской раскладке
+        for seq in ("<Control-z>", "<Control-Z>", "<Control-Cyrillic_ya>"):
+            self.bind(seq, self.undo)
+        for seq in ("<Control-y>", "<Control-Y>", "<Control-Cyrillic_en>"):
+            self.bind(seq, self.redo)
+
+        # список, статистика, напоминания и автосохранение реагируют на события
+        # сервиса, а не на то, что обработчик кнопки не забыл вызвать refresh()
+        self.service.events.subscribe(self.on_tasks_changed)
         self.show_all()
 
+        if self.loader is None:
+            self.reminders.reschedule()
+
+        self._sync_job = None
+        if self.settings.storage == "shared":
+            self._sync_job = self.after(SYNC_MS, self._poll_sync)
+
+    def _poll_sync(self):
+        # изменения других процессов приходят событием TasksChanged(external=True)
+        self.service.sync()
+        self._sync_job = self.after(SYNC_MS, self._poll_sync)
+
+    def on_tasks_changed(self, event):
+        if isinstance(event, TasksReloaded):
+            # страницы фоновой загрузки показывает on_load_progress
+            if not self.service.loading:
+                self.reminders.reschedule()
+                self.refresh()
+            return
+
+        external = isinstance(event, TasksChanged) and event.external
+        events = event.events if isinstance(event, TasksChanged) else (event,)
+        if external:
+            self.reminders.reschedule()
+        else:
+            self._after_mutation()
+
+        if len(events) > 50:
+            # крупная групповая операция — дешевле перерисовать список целиком
+            self.refresh()
+        else:
+            for e in events:
+                old_key = None
+                if isinstance(e, TaskUpdated):
+                    old_key = self.service.sort_key_before(self.sort_by, e.task, e.before)
+                self.refresh_task(e.task.id, old_key)
+
+        for e in events:
+            if e.task.id != self.selected_id:
+                continue
+            if isinstance(e, TaskDeleted):
+                self.selected_id = None
+            elif not external:
+                # правку в другом процессе не пишем поверх того, что сейчас редактируют
+                self.on_select_task(self.selected_id)
+
+    def _write_through(self) -> bool:
+        # Инкрементальное хранилище пишет одну запись — это дёшево, делаем сразу.
+        # Полную перезапись откладываем в AutosaveScheduler.
+        return self.settings.autosave and self.storage.incremental
+
+    def _after_mutation(self):
+        if self.settings.autosave and not self.storage.incremental:
+            self.autosaver.schedule()
+        # ближайший срок мог измениться
+        self.reminders.reschedule()
+
+    def on_load_progress(self, loaded: int, progress: float | None):
+        self.sidebar.set_progress(loaded, progress)
+        self.update_stats()
+
+    def on_load_done(self):
+        # end_load (или load после ошибки чтения) уже прислал TasksReloaded: список перерисован
+        self.sidebar.set_progress(None)
+        if self.loader.error is not None:
+            self.sidebar.set_load_error(self.loader.error)
+            return
+        self.service.seed_demo_if_empty()
+
+    def on_close(self):
+        if self._sync_job is not None:
+            self.after_cancel(self._sync_job)
+        self.reminders.cancel()
+        if self.loader is not None and not self.loader.done:
+            if self.service.dirty:
+                # есть несохранённые правки — дочитываем файл, иначе запись его обрежет
+                self.loader.finish_now()
+            else:
+                self.loader.cancel()
+        # при выключенном автосохранении изменения на выходе, как и раньше, не пишем
+        self.autosaver.close(flush=self.settings.autosave)
+        self.storage.close()
+        self.destroy()
+        stop_logging()
+
+    def on_remind(self, due_today, overdue):
+        # наступил новый день: счётчики «просрочено»/«на сегодня» поменялись
+        self.update_stats()
+        if due_today:
+            titles = "\n".join(f"• {t.title}" for t in due_today[:5])
+            more = f"\n… и ещё {len(due_today) - 5}" if len(due_today) > 5 else ""
+            MessageDialog(self, "Напоминание", f"Сегодня срок у задач: {len(due_today)}\n\n{titles}{more}")
+
     def _is_valid_date(self, s: str) -> bool:
         s = (s or "").strip()
         if s == "":
@@ -91,33 +223,61 @@ class App(ctk.CTk):
 
     def update_stats(self):
         st = self.service.stats()
-        self.sidebar.set_stats(st["total"], st["active"], st["done"])
+        self.sidebar.set_stats(
+            st["total"], st["active"], st["done"],
+            st["overdue"], st["due_today"], st["by_priority"],
+        )
 
-    def apply_filters(self, tasks):
-        q = (self.search_query or "").strip().lower()
-        if q:
-            tasks = [
-                t for t in tasks
-                if q in (t.title or "").lower() or q in (t.description or "").lower()
-            ]
+    def _matches(self, task) -> bool:
+        if self.current_filter is not None and task.status != self.current_filter:
+            return False
+        return matches(task, self.search_query)
+
+    def apply_filters(self):
+        if (self.search_query or "").strip():
+            # поиск идёт по индексу, найденное упорядочиваем по готовым ключам сортировки
+            tasks = self.service.search(self.search_query, self.current_filter)
+            return self.service.sort_tasks(tasks, self.sort_by)
+        # без поиска порядок уже поддерживается сервисом — сортировать нечего
+        return self.service.list_tasks(self.current_filter, sort_by=self.sort_by)
+
+    def refresh_task(self, task_id: str, old_key=None):
+        # Одна задача изменилась: обновляем только её строку, а не весь список.
+        # old_key — ключ сортировки задачи до изменения.
+        task = self.service.get_task(task_id)
+        shown = self.list_view.contains(task_id)
+        key = self.service.sort_key(self.sort_by)
+
+        if task is None or not self._matches(task):
+            if shown:
+                self.list_view.apply_diff(removed=[task_id])
+        elif not shown:
+            self.list_view.insert_sorted(task, key)
+        elif old_key is not None and old_key != key(task):
+            # изменилось поле сортировки — переставляем строку на новое место
+            self.list_view.apply_diff(removed=[task_id])
+            self.list_view.insert_sorted(task, key)
+        else:
+            self.list_view.apply_diff(updated=[task])
 
-        # сортировка по приоритету (high > medium > low)
-        pr_rank = {"high": 3, "medium": 2, "low": 1}
-        tasks.sort(key=lambda t: pr_rank.get(t.priority, 2), reverse=True)
-        return tasks
+        self.update_stats()
 
     def refresh(self):
-        if self.current_filter is None:
-            tasks = self.service.list_tasks()
-        else:
-            tasks = self.service.list_tasks(self.current_filter)
-
-        tasks = self.apply_filters(tasks)
-        self.list_view.render(tasks)
+        # полная перерисовка: ожидающий поиск устарел, прошлые результаты тоже
+        self.search_pipeline.cancel()
+        self.search_pipeline.invalidate()
+        self.list_view.render(self.apply_filters())
         self.update_stats()
 
     def on_search(self, query: str):
         self.search_query = query
+        self.search_pipeline.submit(query, self.current_filter, self._show_search_results)
+
+    def _show_search_results(self, tasks):
+        self.list_view.render(self.service.sort_tasks(tasks, self.sort_by))
+
+    def on_sort(self, sort_by: str):
+        self.sort_by = sort_by
         self.refresh()
 
     def show_all(self):
@@ -160,14 +320,8 @@ class App(ctk.CTk):
 
         task = self.service.add_task(
             title, desc, due, pr,
-            autosave=self.settings.autosave
+            autosave=self._write_through()
         )
-
-        if not self.settings.autosave:
-            # если автосохранение выключено — сохраняем только при явной необходимости (пока оставим как есть)
-            pass
-
-        self.refresh()
         self.on_select_task(task.id)
 
     def save_selected(self):
@@ -189,12 +343,10 @@ class App(ctk.CTk):
             MessageDialog(self, "Ошибка", "Неверная дата.\nВведите в формате YYYY-MM-DD, например 2025-12-31.")
             return
 
-        ok = self.service.update_task(
+        self.service.update_task(
             self.selected_id, title, desc, due, status, pr,
-            autosave=self.settings.autosave
+            autosave=self._write_through()
         )
-        if ok:
-            self.refresh()
 
     def delete_selected(self):
         if not self.selected_id:
@@ -209,16 +361,45 @@ class App(ctk.CTk):
         if not dlg.result:
             return
 
-        ok = self.service.delete_task(self.selected_id, autosave=self.settings.autosave)
-        if ok:
-            self.selected_id = None
-            self.refresh()
+        self.service.delete_task(self.selected_id, autosave=self._write_through())
 
     def mark_selected_done(self):
         if not self.selected_id:
             MessageDialog(self, "Ошибка", "Сначала выберите задачу в списке.")
             return
 
-        ok = self.service.mark_done(self.selected_id, autosave=self.settings.autosave)
-        if ok:
-            self.refresh()
+        self.service.mark_done(self.selected_id, autosave=self._write_through())
+
+    def mark_many_done(self):
+        ids = list(self.list_view.selected)
+        if not ids:
+            return
+        # одна запись в хранилище и одно событие на всю группу (см. TaskService.batch)
+        self.service.mark_done_many(ids, autosave=self._write_through())
+
+    def delete_many_selected(self):
+        ids = list(self.list_view.selected)
+        if not ids:
+            return
+
+        dlg = ConfirmDialog(self, "Подтверждение", f"Удалить выбранные задачи ({len(ids)})?")
+        self.wait_window(dlg)
+        if not dlg.result:
+            return
+
+        if self.service.delete_many(ids, autosave=self._write_through()):
+            self.list_view.clear_selection()
+
+    def undo(self, _event=None):
+        return self._history_step(self.service.undo)
+
+    def redo(self, _event=None):
+        return self._history_step(self.service.redo)
+
+    def _history_step(self, step):
+        # в полях ввода Ctrl+Z/Ctrl+Y относятся к тексту, а не к задачам
+        if isinstance(self.focus_get(), (tk.Entry, tk.Text)):
+            return None
+        # список и панель деталей обновит on_tasks_changed
+        step(autosave=self._write_through())
+        return "break"
@@ -0,0 +1,228 @@
+import argparse
+import json
+import sys
+from itertools import chain
+from pathlib import Path
+
+from core.commands import check_command
+from core.service import TaskService
+from storage.factory import make_storage
+from storage.json_storage import iter_json_array, write_json_array
+from utils.logging_conf import configure_logging
+from utils.settings import Settings
+
+
+# Консольный вход без Tk: python -m task_manager.cli <команда> ...
+# Задачи выводятся построчно в NDJSON (один JSON-объект на строку), так что
+# вывод можно читать потоком (jq, другой скрипт) не дожидаясь конца.
+#
+#   add "Купить хлеб" --due 2025-01-10 --priority high
+#   list --status active --sort due_date
+#   search "отчёт"
+#   edit <id> --status done --due 2025-02-01
+#   done <id> [<id> ...]
+#   import tasks.json | tasks.ndjson | -      (JSON-массив или NDJSON)
+#   export [файл] [--format ndjson|json]
+#   batch < commands.ndjson                  ({"op": "add", "title": ...} на строку)
+#
+# Изменения одной команды сохраняются одной записью (TaskService.batch).
+
+SORT_CHOICES = ("priority", "status", "due_date", "created_at")
+
+
+def emit(out, obj) -> None:
+    out.write(json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+def emit_tasks(out, tasks) -> None:
+    for t in tasks:
+        emit(out, t.to_dict())
+
+
+def read_items(f):
+    # JSON-массив (в том числе tasks.json) разбирается потоково, иначе — NDJSON
+    head = f.read(1)
+    while head and head.isspace():
+        head = f.read(1)
+    if not head:
+        return
+    if head == "[":
+        yield from iter_json_array(_Pushback(head, f))
+        return
+    for line in chain([head + f.readline()], f):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+class _Pushback:
+    # вернуть в поток уже прочитанный символ
+    def __init__(self, head: str, f):
+        self._head = head
+        self._f = f
+
+    def read(self, size: int = -1) -> str:
+        head, self._head = self._head, ""
+        return head + self._f.read(size)
+
+
+def open_input(path: str, stdin):
+    return stdin if path == "-" else open(path, encoding="utf-8")
+
+
+def run_batch(svc: TaskService, lines, out) -> int:
+    failed = 0
+    with svc.batch():
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                cmd = json.loads(line)
+                task = apply_command(svc, cmd)
+            except (ValueError, KeyError, TypeError) as e:
+                failed += 1
+                emit(out, {"ok": False, "line": lineno, "error": str(e)})
+                continue
+            emit(out, {"ok": True, "op": cmd["op"], "task": task.to_dict() if task else None})
+    return 1 if failed else 0
+
+
+def apply_command(svc: TaskService, cmd: dict):
+    # неверная команда (поле, значение, op) — ValueError до каких-либо изменений
+    check_command(cmd)
+    op = cmd["op"]
+    if op == "add":
+        return svc.add_task(cmd["title"], cmd.get("description", ""), cmd.get("due_date", ""),
+                            cmd.get("priority", "medium"))
+    task = svc.get_task(cmd["id"])
+    if task is None:
+        raise KeyError(f"task not found: {cmd['id']}")
+    if op == "update":
+        fields = {k: v for k, v in cmd.items() if k not in ("op", "id")}
+        svc.update_many([task.id], **fields)
+    elif op == "done":
+        svc.mark_done(task.id)
+    elif op == "delete":
+        svc.delete_task(task.id)
+        return None
+    else:
+        raise ValueError(f"unknown op: {op!r}")
+    return task
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="task_manager.cli", description="Task Manager без графического интерфейса")
+    parser.add_argument("--data", default="data/tasks.json", help="файл задач (по умолчанию data/tasks.json)")
+    parser.add_argument("--storage", help="json | journal | shared | sqlite | binary (по умолчанию — из settings.json)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("add", help="добавить задачу")
+    p.add_argument("title")
+    p.add_argument("--description", default="")
+    p.add_argument("--due", default="", help="срок YYYY-MM-DD")
+    p.add_argument("--priority", choices=("low", "medium", "high"), default="medium")
+
+    p = sub.add_parser("list", help="вывести задачи")
+    p.add_argument("--status", choices=("active", "done"))
+    p.add_argument("--sort", choices=SORT_CHOICES)
+
+    p = sub.add_parser("search", help="поиск по названию и описанию")
+    p.add_argument("query")
+    p.add_argument("--status", choices=("active", "done"))
+
+    p = sub.add_parser("edit", help="изменить поля задачи")
+    p.add_argument("id")
+    p.add_argument("--title")
+    p.add_argument("--description")
+    p.add_argument("--due", help="срок YYYY-MM-DD, пустая строка — без срока")
+    p.add_argument("--status", choices=("active", "done"))
+    p.add_argument("--priority", choices=("low", "medium", "high"))
+
+    p = sub.add_parser("done", help="отметить задачи выполненными")
+    p.add_argument("ids", nargs="+")
+
+    p = sub.add_parser("import", help="импорт задач из JSON-массива или NDJSON ('-' — stdin)")
+    p.add_argument("file")
+
+    p = sub.add_parser("export", help="экспорт задач")
+    p.add_argument("file", nargs="?", default="-")
+    p.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+
+    sub.add_parser("batch", help="команды из stdin, по одному JSON-объекту на строку")
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None) -> int:
+    stdin = stdin or sys.stdin
+    out = stdout or sys.stdout
+    args = build_parser().parse_args(argv)
+
+    data = Path(args.data)
+    settings = Settings(str(data.parent / "settings.json"))
+    settings.load()
+    # в консоли логи только в файл; на stderr — предупреждения и ошибки
+    configure_logging(level=settings.log_level, console_level="WARNING", use_queue=False)
+
+    storage = make_storage(args.storage or settings.storage, str(data))
+    svc = TaskService(storage)
+    try:
+        svc.load()
+        return run_command(svc, args, stdin, out)
+    finally:
+        storage.close()
+
+
+def run_command(svc: TaskService, args, stdin, out) -> int:
+    if args.command in ("add", "edit"):
+        if args.command == "add":
+            cmd = {"op": "add", "title": args.title, "description": args.description,
+                   "due_date": args.due, "priority": args.priority}
+        else:
+            fields = {"title": args.title, "description": args.description, "due_date": args.due,
+                      "status": args.status, "priority": args.priority}
+            cmd = {"op": "update", "id": args.id, **{k: v for k, v in fields.items() if v is not None}}
+        try:
+            task = apply_command(svc, cmd)
+        except (ValueError, KeyError) as e:
+            print(f"error: {e.args[0] if e.args else e}", file=sys.stderr)
+            return 1
+        emit(out, task.to_dict())
+    elif args.command == "list":
+        emit_tasks(out, svc.list_tasks(args.status, sort_by=args.sort))
+    elif args.command == "search":
+        emit_tasks(out, svc.search(args.query, args.status))
+    elif args.command == "done":
+        missing = [i for i in args.ids if svc.get_task(i) is None]
+        svc.mark_done_many(args.ids)
+        emit_tasks(out, (svc.get_task(i) for i in args.ids if i not in missing))
+        for task_id in missing:
+            print(f"task not found: {task_id}", file=sys.stderr)
+        return 1 if missing else 0
+    elif args.command == "import":
+        f = open_input(args.file, stdin)
+        try:
+            added, updated = svc.import_tasks(item for item in read_items(f) if isinstance(item, dict))
+        finally:
+            if f is not stdin:
+                f.close()
+        emit(out, {"added": added, "updated": updated})
+    elif args.command == "export":
+        dst = out if args.file == "-" else open(args.file, "w", encoding="utf-8")
+        try:
+            items = (t.to_dict() for t in svc.list_tasks())
+            if args.format == "json":
+                write_json_array(dst, items)
+                dst.write("\n")
+            else:
+                for item in items:
+                    emit(dst, item)
+        finally:
+            if dst is not out:
+                dst.close()
+    elif args.command == "batch":
+        return run_batch(svc, stdin, out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
-from task_manager.app import App
-
-
 def main():
+    # customtkinter и ui импортируются только здесь: консольный вход
+    # (task_manager.cli) не должен платить за запуск Tk
+    from task_manager.app import App
+
     app = App()
     app.mainloop()
 
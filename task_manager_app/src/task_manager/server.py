@@ -0,0 +1,386 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+from core.commands import check_command
+from core.service import TaskService
+from storage.factory import make_storage
+from task_manager.cli import SORT_CHOICES, apply_command
+from utils.logging_conf import configure_logging, setup_logging
+from utils.settings import Settings
+
+
+logger = setup_logging()
+
+
+# Локальный HTTP/JSON API поверх TaskService: python -m task_manager.server --port 8765
+#
+#   GET    /tasks?status=&sort=&q=&offset=&limit=   страница задач (ETag)
+#   GET    /tasks/<id>
+#   POST   /tasks                 {"title": ..., "description", "due_date", "priority"}
+#   PATCH  /tasks/<id>            {"priority": "high", ...}
+#   POST   /tasks/<id>/done
+#   DELETE /tasks/<id>
+#   POST   /batch                 [{"op": "add"|"update"|"done"|"delete", ...}, ...]
+#   GET    /stats                 (ETag)
+#
+# Всё выполняется в одном потоке событийного цикла. Чтения обслуживаются сразу,
+# изменения ставятся в очередь единственной задачи-писателя: она забирает всё,
+# что накопилось, и выполняет одним TaskService.batch() — одна запись в
+# хранилище на группу запросов, и хранилище никогда не видит параллельных save.
+# Запись блокирует цикл на время сохранения, поэтому под записывающей нагрузкой
+# лучше storage = "journal" или "sqlite": json переписывает файл целиком
+# (см. benchmarks/load_test.py --storage).
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+MAX_BODY = 1024 * 1024
+SYNC_INTERVAL = 1.0     # секунд между опросами хранилища на чужие изменения
+CACHE_SIZE = 64         # закэшированных выборок для текущей версии данных
+
+REASONS = {
+    200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified", 400: "Bad Request",
+    404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    431: "Request Header Fields Too Large", 500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message or REASONS.get(status, ""))
+        self.status = status
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: dict[str, str], body: bytes):
+        self.method = method
+        url = urlsplit(target)
+        self.path = url.path.rstrip("/") or "/"
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"null")
+        except ValueError as e:
+            raise HttpError(400, f"invalid JSON: {e}")
+
+
+class TaskServer:
+    def __init__(self, service: TaskService, host: str = "127.0.0.1", port: int = 8765,
+                 sync_interval: float = SYNC_INTERVAL):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.sync_interval = sync_interval
+        self.version = 0        # растёт с каждым изменением задач, из неё ETag
+        # счётчик версий в каждом процессе начинается с нуля: без метки запуска
+        # ETag после перезапуска совпал бы с закэшированным у клиента
+        self._etag_prefix = uuid4().hex[:12]
+        self._cache: dict[tuple, list] = {}
+        self._writes: asyncio.Queue | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._tasks: list[asyncio.Task] = []
+        # любое изменение задач (и своё, и подтянутое sync) — новая версия
+        service.events.subscribe(lambda _event: self._bump())
+
+    async def start(self) -> None:
+        self._writes = asyncio.Queue()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # порт 0 — выбрать свободный (тесты, load_test)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tasks = [asyncio.create_task(self._writer())]
+        if self.sync_interval:
+            self._tasks.append(asyncio.create_task(self._poll_sync()))
+        logger.info("API server: listening on http://%s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("API server: stopped")
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    # --- запись ---
+
+    async def write(self, fn):
+        # Выполнить fn() в задаче-писателе и дождаться результата.
+        future = asyncio.get_running_loop().create_future()
+        await self._writes.put((fn, future))
+        return await future
+
+    async def _writer(self) -> None:
+        while True:
+            jobs = [await self._writes.get()]
+            while not self._writes.empty():
+                jobs.append(self._writes.get_nowait())
+            # ответы уйдут клиентам не раньше, чем batch запишет изменения
+            try:
+                with self.service.batch():
+                    for fn, future in jobs:
+                        try:
+                            result = fn()
+                        except Exception as e:
+                            if not future.cancelled():
+                                future.set_exception(e)
+                        else:
+                            if not future.cancelled():
+                                future.set_result(result)
+            except Exception as e:
+                logger.exception("API server: failed to save changes: %s", e)
+
+    async def _poll_sync(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            await self.write(self.service.sync)
+
+    def _bump(self) -> None:
+        self.version += 1
+        self._cache.clear()
+
+    # --- HTTP ---
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as e:
+                    self._send(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                status, body, headers = await self._dispatch(request)
+                self._send(writer, status, body, headers, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _readline(reader: asyncio.StreamReader) -> bytes:
+        # строка длиннее лимита потока (64 КиБ) — ValueError из readline; без
+        # перехвата соединение обрывалось бы без ответа
+        try:
+            return await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise HttpError(431, "request line or header too long")
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Request | None:
+        line = await self._readline(reader)
+        if not line:
+            return None
+        try:
+            method, target, _version = line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+
+        headers = {}
+        while True:
+            line = await self._readline(reader)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(400, "bad Content-Length")
+        if length > MAX_BODY:
+            raise HttpError(413)
+        body = await reader.readexactly(length) if length else b""
+        return Request(method.upper(), target, headers, body)
+
+    def _send(self, writer: asyncio.StreamWriter, status: int, body=None, headers: dict | None = None,
+              keep_alive: bool = True) -> None:
+        data = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                 f"Content-Length: {len(data)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if data:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + data)
+
+    async def _dispatch(self, request: Request) -> tuple[int, object, dict]:
+        parts = request.path.strip("/").split("/")
+        try:
+            if parts == ["tasks"]:
+                if request.method == "GET":
+                    return self._cached(request, self._list)
+                if request.method == "POST":
+                    return 201, await self._command(request.json(), "add"), {}
+            elif parts[0] == "tasks" and len(parts) == 2:
+                task_id = parts[1]
+                if request.method == "GET":
+                    task = self.service.get_task(task_id)
+                    if task is None:
+                        raise HttpError(404, f"task not found: {task_id}")
+                    return 200, task.to_dict(), {}
+                if request.method == "PATCH":
+                    return 200, await self._command(request.json(), "update", task_id), {}
+                if request.method == "DELETE":
+                    await self._command({}, "delete", task_id)
+                    return 204, None, {}
+            elif parts[0] == "tasks" and parts[2:] == ["done"] and len(parts) == 3:
+                if request.method == "POST":
+                    return 200, await self._command({}, "done", parts[1]), {}
+            elif parts == ["batch"]:
+                if request.method == "POST":
+                    return 200, await self._batch(request.json()), {}
+            elif parts == ["stats"]:
+                if request.method == "GET":
+                    return self._cached(request, lambda r: self.service.stats())
+            else:
+                raise HttpError(404)
+            raise HttpError(405)
+        except HttpError as e:
+            return e.status, {"error": str(e)}, {}
+        except Exception as e:
+            logger.exception("API server: %s %s failed: %s", request.method, request.path, e)
+            return 500, {"error": str(e)}, {}
+
+    def _cached(self, request: Request, build) -> tuple[int, object, dict]:
+        # ETag — версия данных: пока изменений не было, клиент получает 304
+        # без тела, а сервер не строит ответ заново
+        etag = f'"{self._etag_prefix}-{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return 304, None, {"ETag": etag}
+        return 200, build(request), {"ETag": etag}
+
+    def _list(self, request: Request) -> dict:
+        q = request.query
+        status = q.get("status") or None
+        sort = q.get("sort") or None
+        if sort is not None and sort not in SORT_CHOICES:
+            raise HttpError(400, f"unknown sort: {sort}")
+        try:
+            offset = max(int(q.get("offset", 0)), 0)
+            limit = min(int(q.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+        except ValueError:
+            raise HttpError(400, "offset/limit must be integers")
+        if limit < 1:
+            # пустая страница с next = offset зациклила бы клиента, идущего по next
+            raise HttpError(400, "limit must be at least 1")
+
+        # выборка целиком кэшируется до следующего изменения: страницы одного
+        # запроса не пересчитывают поиск и сортировку
+        key = (status, sort, q.get("q", "").strip())
+        tasks = self._cache.get(key)
+        if tasks is None:
+            if key[2]:
+                tasks = self.service.search(key[2], status)
+                if sort:
+                    tasks = self.service.sort_tasks(tasks, sort)
+            else:
+                tasks = self.service.list_tasks(status, sort_by=sort)
+            if len(self._cache) >= CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = tasks
+
+        page = tasks[offset:offset + limit]
+        end = offset + len(page)
+        return {
+            "items": [t.to_dict() for t in page],
+            "total": len(tasks),
+            "offset": offset,
+            "limit": limit,
+            "next": end if page and end < len(tasks) else None,
+        }
+
+    async def _command(self, body, op: str, task_id: str | None = None) -> dict | None:
+        if not isinstance(body, dict):
+            raise HttpError(400, "expected a JSON object")
+        cmd = dict(body, op=op)
+        if task_id is not None:
+            cmd["id"] = task_id
+        try:
+            check_command(cmd)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        try:
+            task = await self.write(lambda: apply_command(self.service, cmd))
+        except KeyError as e:
+            raise HttpError(404, e.args[0] if e.args else str(e))
+        except (ValueError, TypeError) as e:
+            raise HttpError(400, str(e))
+        return task.to_dict() if task else None
+
+    async def _batch(self, body) -> list[dict]:
+        # Все команды — одной группой писателя: одна запись в хранилище.
+        if not isinstance(body, list):
+            raise HttpError(400, "expected a JSON array of commands")
+
+        # проверка — до очереди; неверная команда сразу получает ошибку и не выполняется
+        errors = []
+        for cmd in body:
+            try:
+                check_command(cmd)
+            except ValueError as e:
+                errors.append(str(e))
+            else:
+                errors.append(None)
+
+        def run() -> list[dict]:
+            results = []
+            for cmd, error in zip(body, errors):
+                if error is None:
+                    try:
+                        task = apply_command(self.service, cmd)
+                    except (ValueError, KeyError, TypeError) as e:
+                        error = str(e)
+                if error is not None:
+                    results.append({"ok": False, "error": error})
+                    continue
+                results.append({"ok": True, "op": cmd["op"], "task": task.to_dict() if task else None})
+            return results
+        return await self.write(run)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="task_manager.server", description="HTTP/JSON API для задач")
+    parser.add_argument("--data", default="data/tasks.json")
+    parser.add_argument("--storage", help="json | journal | shared | sqlite | binary (по умолчанию — из settings.json)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    data = Path(args.data)
+    settings = Settings(str(data.parent / "settings.json"))
+    settings.load()
+    configure_logging(level=settings.log_level, console_level=settings.console_log_level,
+                      use_queue=settings.log_async)
+
+    storage = make_storage(args.storage or settings.storage, str(data))
+    service = TaskService(storage)
+    service.load()
+    try:
+        asyncio.run(TaskServer(service, args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        storage.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
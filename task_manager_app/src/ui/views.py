@@ -1,5 +1,18 @@
+import bisect
+
 import customtkinter as ctk
 
+from ui.widgets import CARD_HEIGHT, CARD_PADY, TaskCard
+
+
+# подпись в меню -> порядок сортировки TaskService.list_tasks(sort_by=...)
+SORT_OPTIONS = {
+    "Сортировка: по приоритету": "priority",
+    "Сортировка: по статусу": "status",
+    "Сортировка: по сроку": "due_date",
+    "Сортировка: по дате создания": "created_at",
+}
+
 
 class SidebarView(ctk.CTkFrame):
     def __init__(self, master):
@@ -34,19 +47,52 @@ class SidebarView(ctk.CTkFrame):
         self.lbl_done = ctk.CTkLabel(self, text="Выполнено: 0")
         self.lbl_done.grid(row=8, column=0, padx=15, pady=2, sticky="w")
 
+        self.lbl_details = ctk.CTkLabel(self, text="", justify="left")
+        self.lbl_details.grid(row=9, column=0, padx=15, pady=(6, 2), sticky="w")
+
+        self.lbl_progress = ctk.CTkLabel(self, text="")
+        self.lbl_progress.grid(row=10, column=0, padx=15, pady=(6, 2), sticky="nw")
+        self.lbl_progress.grid_remove()
+
         self.btn_settings = ctk.CTkButton(self, text="⚙ Настройки")
         self.btn_settings.grid(row=11, column=0, padx=15, pady=(5, 5), sticky="ew")
 
         self.btn_exit = ctk.CTkButton(self, text="Выход")
         self.btn_exit.grid(row=12, column=0, padx=15, pady=(5, 15), sticky="ew")
 
-    def set_stats(self, total: int, active: int, done: int):
+    def set_progress(self, loaded: int | None, progress: float | None = None):
+        if loaded is None:
+            self.lbl_progress.grid_remove()
+            return
+        text = f"Загрузка: {loaded} задач"
+        if progress is not None:
+            text += f" ({progress:.0%})"
+        self.lbl_progress.configure(text=text)
+        self.lbl_progress.grid()
+
+    def set_load_error(self, message: str):
+        self.lbl_progress.configure(text=f"Ошибка загрузки: {message}", wraplength=210)
+        self.lbl_progress.grid()
+
+    def set_stats(self, total: int, active: int, done: int, overdue: int = 0, due_today: int = 0,
+                  by_priority: dict | None = None):
         self.lbl_total.configure(text=f"Всего: {total}")
         self.lbl_active.configure(text=f"Активных: {active}")
         self.lbl_done.configure(text=f"Выполнено: {done}")
 
+        by_priority = by_priority or {}
+        self.lbl_details.configure(
+            text=(
+                f"Просрочено: {overdue}\n"
+                f"На сегодня: {due_today}\n"
+                f"🔴 {by_priority.get('high', 0)}   🟡 {by_priority.get('medium', 0)}   🟢 {by_priority.get('low', 0)}"
+            )
+        )
+
 
 class TaskListView(ctk.CTkFrame):
+    # Виртуализированный список: карточки создаются только под видимые строки
+    # и при прокрутке/обновлении переиспользуются, а не пересоздаются.
     def __init__(self, master):
         super().__init__(master)
         self.grid_rowconfigure(1, weight=1)
@@ -54,51 +100,224 @@ class TaskListView(ctk.CTkFrame):
 
         self.on_select = None    # callback(task_id)
         self.on_search = None    # callback(query)
+        self.on_sort = None      # callback(sort_by)
+        # выделенные задачи (Ctrl+клик добавляет/убирает); кнопки групповых
+        # действий видны, когда выделено больше одной
+        self.selected: set[str] = set()
 
         header = ctk.CTkFrame(self)
-        header.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+        header.grid(row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 5))
         header.grid_columnconfigure(0, weight=1)
 
         self.search = ctk.CTkEntry(header, placeholder_text="Поиск по названию/описанию...")
         self.search.grid(row=0, column=0, sticky="ew", padx=(0, 10), pady=10)
         self.search.bind("<KeyRelease>", self._handle_search)
 
-        self.sort = ctk.CTkOptionMenu(header, values=["Сортировка: по приоритету", "Сортировка: по статусу"])
+        self.sort = ctk.CTkOptionMenu(header, values=list(SORT_OPTIONS), command=self._handle_sort)
         self.sort.grid(row=0, column=1, sticky="e", pady=10)
 
-        self.body = ctk.CTkScrollableFrame(self)
-        self.body.grid(row=1, column=0, sticky="nsew", padx=10, pady=(5, 10))
+        self.bulk = ctk.CTkFrame(header, fg_color="transparent")
+        self.bulk.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 10))
+        self.bulk.grid_columnconfigure(0, weight=1)
+        self.lbl_selected = ctk.CTkLabel(self.bulk, text="")
+        self.lbl_selected.grid(row=0, column=0, sticky="w")
+        self.btn_bulk_done = ctk.CTkButton(self.bulk, text="Выполнить выбранные", width=170)
+        self.btn_bulk_done.grid(row=0, column=1, padx=(0, 8))
+        self.btn_bulk_delete = ctk.CTkButton(self.bulk, text="Удалить выбранные", width=170)
+        self.btn_bulk_delete.grid(row=0, column=2)
+        self.bulk.grid_remove()
+
+        self.body = ctk.CTkFrame(self)
+        self.body.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=(5, 10))
+        self.body.bind("<Configure>", self._on_resize)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.body.bind(seq, self._on_wheel)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 10), pady=(5, 10))
+
+        self._tasks = []
+        self._first = 0          # индекс задачи в верхней видимой карточке
+        self._rows = 0           # сколько карточек помещается в окне
+        self._cards: list[TaskCard] = []
+        self._card_of: dict[str, TaskCard] = {}   # id задачи -> видимая карточка
+        self._pos: dict[str, int] | None = None   # id -> позиция, строится лениво
+        self._query = ""
 
     def _handle_search(self, _event=None):
+        # стрелки, Shift и т.п. текст не меняют — поиск не перезапускаем
+        query = self.search.get()
+        if query == self._query:
+            return
+        self._query = query
         if self.on_search:
-            self.on_search(self.search.get())
+            self.on_search(query)
+
+    def _handle_sort(self, label: str):
+        if self.on_sort:
+            self.on_sort(SORT_OPTIONS[label])
+
+    def _handle_select(self, task_id: str, additive: bool = False):
+        if additive:
+            self.selected ^= {task_id}
+        else:
+            self.selected = {task_id}
+        self._show_selection()
+        if not additive and self.on_select:
+            self.on_select(task_id)
+
+    def clear_selection(self):
+        self.selected = set()
+        self._show_selection()
+
+    def _show_selection(self):
+        for card in self._card_of.values():
+            card.set_selected(card.task_id in self.selected)
+        if len(self.selected) > 1:
+            self.lbl_selected.configure(text=f"Выбрано: {len(self.selected)}")
+            self.bulk.grid()
+        else:
+            self.bulk.grid_remove()
 
     def render(self, tasks):
-        for w in self.body.winfo_children():
-            w.destroy()
-
-        for t in tasks:
-            card = ctk.CTkFrame(self.body)
-            card.pack(fill="x", padx=5, pady=6)
-
-            pr_icon = {"low": "🟢", "medium": "🟡", "high": "🔴"}.get(t.priority, "🟡")
-            title = ctk.CTkLabel(card, text=f"{pr_icon} {t.title}", font=("Arial", 15, "bold"))
-            title.pack(anchor="w", padx=10, pady=(10, 0))
-
-            status = "✅ done" if t.status == "done" else "🟦 active"
-            meta = ctk.CTkLabel(card, text=f"{status}   Срок: {t.due_date or '-'}   Приоритет: {t.priority}")
-            meta.pack(anchor="w", padx=10, pady=(2, 0))
-
-            short_desc = (t.description[:60] + "…") if len(t.description) > 60 else t.description
-            desc = ctk.CTkLabel(card, text=short_desc)
-            desc.pack(anchor="w", padx=10, pady=(2, 10))
-
-            def _select(_event=None, task_id=t.id):
-                if self.on_select:
-                    self.on_select(task_id)
-
-            for w in (card, title, meta, desc):
-                w.bind("<Button-1>", _select)
+        self._tasks = list(tasks)
+        self._pos = None
+        if self.selected:
+            # выделение — только среди показанных задач
+            self.selected &= self._positions().keys()
+            self._show_selection()
+        self._scroll_to(self._first)
+
+    def contains(self, task_id: str) -> bool:
+        return task_id in self._positions()
+
+    def insert_sorted(self, task, key):
+        # список уже отсортирован по key: новая задача встаёт после равных ей
+        idx = bisect.bisect_right(self._tasks, key(task), key=key)
+        self.apply_diff(inserted=[(idx, task)])
+
+    def apply_diff(self, inserted=(), removed=(), updated=(), moved=()):
+        # Точечное обновление списка по ключам (id задачи). Применяется по порядку:
+        #   updated  — [task], позиция не меняется
+        #   removed  — [task_id]
+        #   moved    — [(task_id, new_index)]
+        #   inserted — [(index, task)]
+        # Перерисовываются только видимые карточки, начиная с первой затронутой строки.
+        dirty_from = None
+
+        def touch(idx):
+            nonlocal dirty_from
+            dirty_from = idx if dirty_from is None else min(dirty_from, idx)
+
+        for t in updated:
+            card = self._card_of.get(t.id)
+            if card is not None:
+                self._tasks[self._first + card.slot] = t
+                card.bind_task(t)
+            else:
+                idx = self._positions().get(t.id)
+                if idx is not None:
+                    self._tasks[idx] = t
+
+        if removed:
+            pos = self._positions()
+            for idx in sorted((pos[i] for i in removed if i in pos), reverse=True):
+                del self._tasks[idx]
+                touch(idx)
+            self._pos = None
+            if self.selected & set(removed):
+                self.selected -= set(removed)
+                self._show_selection()
+
+        for task_id, new_idx in moved:
+            old_idx = self._positions().get(task_id)
+            if old_idx is None:
+                continue
+            t = self._tasks.pop(old_idx)
+            new_idx = max(0, min(new_idx, len(self._tasks)))
+            self._tasks.insert(new_idx, t)
+            touch(min(old_idx, new_idx))
+            self._pos = None
+
+        for idx, t in inserted:
+            idx = max(0, min(idx, len(self._tasks)))
+            self._tasks.insert(idx, t)
+            touch(idx)
+            self._pos = None
+
+        if dirty_from is not None:
+            before = self._first
+            self._clamp_first()
+            if self._first != before:
+                self._redraw()
+            else:
+                self._redraw(max(0, dirty_from - self._first))
+
+    def _positions(self) -> dict[str, int]:
+        if self._pos is None:
+            self._pos = {t.id: i for i, t in enumerate(self._tasks)}
+        return self._pos
+
+    def _on_resize(self, event):
+        rows = event.height // (CARD_HEIGHT + CARD_PADY) + 1
+        if rows == self._rows:
+            return
+        self._rows = rows
+        while len(self._cards) < rows:
+            self._cards.append(TaskCard(self.body, on_click=self._handle_select, on_wheel=self._on_wheel))
+        self._scroll_to(self._first)
+
+    def _on_scrollbar(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._tasks)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (max(self._rows - 1, 1) if args[2] == "pages" else 1)
+            self._scroll_to(self._first + step)
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self._scroll_to(self._first + step)
+
+    def _scroll_to(self, first: int):
+        self._first = first
+        self._clamp_first()
+        self._redraw()
+
+    def _clamp_first(self):
+        # последняя строка не должна уезжать выше низа окна
+        visible = max(self._rows - 1, 1)
+        self._first = max(0, min(self._first, len(self._tasks) - visible))
+
+    def _redraw(self, from_slot: int = 0):
+        total = len(self._tasks)
+        for i in range(from_slot, len(self._cards)):
+            card = self._cards[i]
+            idx = self._first + i
+            if card.task_id is not None and self._card_of.get(card.task_id) is card:
+                del self._card_of[card.task_id]
+            if i < self._rows and idx < total:
+                card.bind_task(self._tasks[idx])
+                card.set_selected(card.task_id in self.selected)
+                self._card_of[card.task_id] = card
+                if card.slot != i:
+                    card.place(x=0, y=i * (CARD_HEIGHT + CARD_PADY) + CARD_PADY, relwidth=1.0, anchor="nw")
+                    card.slot = i
+            elif card.slot is not None:
+                card.task_id = None
+                card.slot = None
+                card.place_forget()
+
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + self._rows) / total))
 
 
 class TaskDetailsView(ctk.CTkFrame):
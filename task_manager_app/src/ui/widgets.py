@@ -0,0 +1,73 @@
+import customtkinter as ctk
+
+
+PR_ICONS = {"low": "🟢", "medium": "🟡", "high": "🔴"}
+
+# Высота карточки фиксированная: по ней список считает, какие строки видны.
+CARD_HEIGHT = 96
+CARD_PADY = 6
+SELECTED_BORDER = ("#3B8ED0", "#1F6AA5")
+
+
+class TaskCard(ctk.CTkFrame):
+    # Переиспользуемая карточка: виджеты создаются один раз,
+    # при прокрутке меняется только текст и id задачи.
+    def __init__(self, master, on_click=None, on_wheel=None):
+        super().__init__(master, height=CARD_HEIGHT)
+        self.pack_propagate(False)
+
+        self.task_id: str | None = None
+        self.slot: int | None = None     # номер видимой строки, в которой стоит карточка
+        self._on_click = on_click
+        self._texts = ("", "", "")
+        self._selected = False
+
+        self.title_lbl = ctk.CTkLabel(self, text="", font=("Arial", 15, "bold"))
+        self.title_lbl.pack(anchor="w", padx=10, pady=(10, 0))
+
+        self.meta_lbl = ctk.CTkLabel(self, text="")
+        self.meta_lbl.pack(anchor="w", padx=10, pady=(2, 0))
+
+        self.desc_lbl = ctk.CTkLabel(self, text="")
+        self.desc_lbl.pack(anchor="w", padx=10, pady=(2, 10))
+
+        for w in (self, self.title_lbl, self.meta_lbl, self.desc_lbl):
+            w.bind("<Button-1>", self._click)
+            # Ctrl+клик — добавить к выделению / убрать из него
+            w.bind("<Control-Button-1>", self._ctrl_click)
+            if on_wheel:
+                w.bind("<MouseWheel>", on_wheel)
+                w.bind("<Button-4>", on_wheel)
+                w.bind("<Button-5>", on_wheel)
+
+    def _click(self, _event=None):
+        if self._on_click and self.task_id is not None:
+            self._on_click(self.task_id, False)
+
+    def _ctrl_click(self, _event=None):
+        if self._on_click and self.task_id is not None:
+            self._on_click(self.task_id, True)
+        return "break"
+
+    def set_selected(self, selected: bool):
+        if selected != self._selected:
+            self._selected = selected
+            self.configure(border_width=2 if selected else 0, border_color=SELECTED_BORDER)
+
+    def bind_task(self, t):
+        self.task_id = t.id
+
+        pr_icon = PR_ICONS.get(t.priority, "🟡")
+        status = "✅ done" if t.status == "done" else "🟦 active"
+        short_desc = (t.description[:60] + "…") if len(t.description) > 60 else t.description
+        texts = (
+            f"{pr_icon} {t.title}",
+            f"{status}   Срок: {t.due_date or '-'}   Приоритет: {t.priority}",
+            short_desc,
+        )
+
+        # configure у CTkLabel перерисовывает виджет — трогаем только изменившееся
+        for lbl, old, new in zip((self.title_lbl, self.meta_lbl, self.desc_lbl), self._texts, texts):
+            if old != new:
+                lbl.configure(text=new)
+        self._texts = texts
@@ -1,28 +1,92 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
-def setup_logging(log_path: str = "logs/app.log") -> logging.Logger:
-    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+LOGGER_NAME = "task_manager"
+MAX_BYTES = 1024 * 1024     # размер файла лога, после которого он ротируется
+BACKUP_COUNT = 3            # сколько старых файлов лога хранить
 
-    logger = logging.getLogger("task_manager")
-    logger.setLevel(logging.INFO)
+_listener: QueueListener | None = None
 
-    # чтобы не дублировать хендлеры при перезапусках из IDE
-    if logger.handlers:
-        return logger
 
+def _level(value) -> int:
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _make_handlers(log_path: str, level, console_level, max_bytes: int, backup_count: int) -> list[logging.Handler]:
+    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
     fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
 
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setLevel(logging.INFO)
+    file_handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    file_handler.setLevel(_level(level))
     file_handler.setFormatter(fmt)
 
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(_level(console_level))
     console_handler.setFormatter(fmt)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    return [file_handler, console_handler]
+
+
+def setup_logging(log_path: str = "logs/app.log") -> logging.Logger:
+    logger = logging.getLogger(LOGGER_NAME)
+
+    # чтобы не дублировать хендлеры при перезапусках из IDE
+    # (и не сбросить то, что уже настроил configure_logging)
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.INFO)
+    for handler in _make_handlers(log_path, logging.INFO, logging.INFO, MAX_BYTES, BACKUP_COUNT):
+        logger.addHandler(handler)
+
+    return logger
+
 
+def configure_logging(log_path: str = "logs/app.log", level="INFO", console_level="INFO",
+                      use_queue: bool = True, max_bytes: int = MAX_BYTES,
+                      backup_count: int = BACKUP_COUNT) -> logging.Logger:
+    # Перенастройка логгера приложения (уровни — из Settings). С use_queue
+    # вызывающий поток только кладёт запись в очередь, а запись в файл и
+    # консоль делает отдельный поток QueueListener — мутации в потоке UI
+    # не ждут диска.
+    global _listener
+    stop_logging()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    handlers = _make_handlers(log_path, level, console_level, max_bytes, backup_count)
+    # записи ниже уровня всех хендлеров отсекаются ещё до очереди
+    logger.setLevel(min(h.level for h in handlers))
+
+    if use_queue:
+        q = queue.SimpleQueue()     # без ограничения размера: put никогда не блокируется
+        logger.addHandler(QueueHandler(q))
+        _listener = QueueListener(q, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
     return logger
+
+
+def stop_logging() -> None:
+    # Дописать всё из очереди и остановить поток записи (при выходе из приложения).
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,84 @@
+import threading
+from contextlib import contextmanager
+
+
+class RWLock:
+    # Блокировка «много читателей или один писатель».
+    # Писатель в очереди не пропускает новых читателей, иначе непрерывный поток
+    # чтений никогда бы его не пустил. Оба режима реентерабельны в своём потоке,
+    # писатель может читать; повысить чтение до записи нельзя — два таких
+    # потока ждали бы друг друга вечно, поэтому это RuntimeError.
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None     # ident потока-писателя
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()     # глубина чтения в текущем потоке
+
+    def acquire_read(self) -> None:
+        depth = getattr(self._local, "reads", 0)
+        if depth:
+            self._local.reads = depth + 1
+            return
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        self._local.reads = 1
+
+    def release_read(self) -> None:
+        depth = getattr(self._local, "reads", 0)
+        if not depth:
+            raise RuntimeError("release_read() without acquire_read()")
+        self._local.reads = depth - 1
+        if depth > 1:
+            return
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if getattr(self._local, "reads", 0):
+                raise RuntimeError("cannot upgrade a read lock to a write lock")
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("release_write() by a thread that does not hold the lock")
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
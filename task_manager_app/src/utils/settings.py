@@ -7,6 +7,12 @@ class Settings:
         self.path = Path(path)
         self.appearance_mode = "System"  # "Light" | "Dark" | "System"
         self.autosave = True            # автосохранение в JSON
+        self.autosave_delay_ms = 1000   # пауза, после которой серия изменений пишется на диск
+        self.lazy_load = True           # показывать первую страницу задач, остальное грузить в фоне
+        self.storage = "json"           # "json" | "journal" | "shared" | "sqlite" | "binary"
+        self.log_level = "INFO"         # уровень для файла логов: "DEBUG" | "INFO" | "WARNING" | ...
+        self.console_log_level = "INFO"
+        self.log_async = True           # писать логи в отдельном потоке (QueueHandler)
 
     def load(self):
         if not self.path.exists():
@@ -15,6 +21,12 @@ class Settings:
             data = json.loads(self.path.read_text(encoding="utf-8"))
             self.appearance_mode = data.get("appearance_mode", self.appearance_mode)
             self.autosave = bool(data.get("autosave", self.autosave))
+            self.autosave_delay_ms = int(data.get("autosave_delay_ms", self.autosave_delay_ms))
+            self.lazy_load = bool(data.get("lazy_load", self.lazy_load))
+            self.storage = data.get("storage", self.storage)
+            self.log_level = data.get("log_level", self.log_level)
+            self.console_log_level = data.get("console_log_level", self.console_log_level)
+            self.log_async = bool(data.get("log_async", self.log_async))
         except Exception:
             # если файл битый — просто оставляем дефолты
             return
@@ -24,5 +36,11 @@ class Settings:
         data = {
             "appearance_mode": self.appearance_mode,
             "autosave": self.autosave,
+            "autosave_delay_ms": self.autosave_delay_ms,
+            "lazy_load": self.lazy_load,
+            "storage": self.storage,
+            "log_level": self.log_level,
+            "console_log_level": self.console_log_level,
+            "log_async": self.log_async,
         }
         self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -1,4 +1,5 @@
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]  # task_manager_app
@@ -7,3 +8,7 @@ TESTS = ROOT / "tests"
 
 sys.path.insert(0, str(SRC))    # чтобы работали core/storage/ui/...
 sys.path.insert(0, str(TESTS))  # чтобы работал импорт tests.fakes
+
+# лог тестов — во временный каталог, а не в ./logs каталога запуска
+from utils.logging_conf import setup_logging  # noqa: E402
+setup_logging(str(Path(tempfile.mkdtemp(prefix="task_manager_tests_")) / "app.log"))
@@ -11,3 +11,23 @@ class MemoryStorage(BaseStorage):
 
     def save(self, tasks: list[Task]) -> None:
         self._tasks = list(tasks)
+
+
+class FakeLoop:
+    # Вместо Tk.after: колбэки копятся и запускаются вручную.
+    def __init__(self):
+        self.callbacks = {}
+        self._next = 0
+
+    def after(self, _ms, fn):
+        self._next += 1
+        self.callbacks[self._next] = fn
+        return self._next
+
+    def after_cancel(self, handle):
+        self.callbacks.pop(handle, None)
+
+    def run(self):
+        while self.callbacks:
+            handle = min(self.callbacks)
+            self.callbacks.pop(handle)()
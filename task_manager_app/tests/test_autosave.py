@@ -0,0 +1,61 @@
+import time
+
+from core.autosave import AutosaveScheduler
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, tasks):
+        self.saves += 1
+        super().save(tasks)
+
+
+def make_service():
+    storage = CountingStorage()
+    service = TaskService(storage)
+    service.load()
+    return service, storage
+
+
+def test_burst_of_mutations_is_written_once():
+    svc, storage = make_service()
+    saver = AutosaveScheduler(svc, delay_ms=50)
+
+    for i in range(20):
+        svc.add_task(f"Task {i}", autosave=False)
+        saver.schedule()
+    time.sleep(0.3)
+
+    assert storage.saves == 1
+    assert len(storage.load()) == 20
+    assert svc.dirty is False
+    saver.close()
+
+
+def test_close_flushes_pending_changes():
+    svc, storage = make_service()
+    saver = AutosaveScheduler(svc, delay_ms=60_000)
+
+    t = svc.add_task("Task", autosave=False)
+    saver.schedule()
+    saver.close()
+
+    assert [x.id for x in storage.load()] == [t.id]
+
+
+def test_snapshot_is_not_affected_by_later_mutations():
+    svc, storage = make_service()
+    saver = AutosaveScheduler(svc, delay_ms=60_000)
+
+    t = svc.add_task("Old", autosave=False)
+    saver.schedule()
+    saver.flush()
+    svc.update_task(t.id, "New", "", "", "active", autosave=False)
+
+    assert storage.load()[0].title == "Old"
+    saver.close()
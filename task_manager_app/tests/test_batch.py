@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+
+from core.service import TaskService
+from storage.journal_storage import JournalStorage
+from .fakes import MemoryStorage
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, tasks):
+        self.saves += 1
+        super().save(tasks)
+
+
+def test_bulk_operations_save_once_and_log_a_summary(caplog):
+    storage = CountingStorage()
+    svc = TaskService(storage)
+
+    with caplog.at_level(logging.INFO, logger="task_manager"):
+        tasks = svc.add_many({"title": f"T{i}", "priority": "high" if i % 2 else "low"} for i in range(50))
+        assert storage.saves == 1
+        assert svc.mark_done_many(t.id for t in tasks[:20]) == 20
+        assert svc.update_many([t.id for t in tasks[20:30]], priority="medium") == 10
+        assert svc.delete_many([t.id for t in tasks[40:]] + ["missing"]) == 10
+
+    assert storage.saves == 4
+    assert len(storage.load()) == 40
+    summaries = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Batch:")]
+    assert summaries == ["Batch: 50 created", "Batch: 20 done", "Batch: 10 updated", "Batch: 10 deleted"]
+    assert not any(r.getMessage().startswith("Task created") for r in caplog.records)
+
+    st = svc.stats()
+    assert (st["done"], st["by_priority"]["medium"]) == (20, 10)
+    assert [t.priority for t in svc.list_tasks(sort_by="priority")[:5]] == ["high"] * 5
+
+
+def test_nested_batch_flushes_on_outer_exit_even_after_error():
+    storage = CountingStorage()
+    svc = TaskService(storage)
+    a = svc.add_task("A")
+
+    with pytest.raises(RuntimeError):
+        with svc.batch():
+            svc.mark_done(a.id)
+            with svc.batch():
+                b = svc.add_task("B")
+                svc.delete_task(b.id)
+            assert storage.saves == 1
+            raise RuntimeError
+
+    assert storage.saves == 2
+    assert [(t.title, t.status) for t in storage.load()] == [("A", "done")]
+
+
+def test_journal_writes_whole_batch_in_one_append(tmp_path):
+    storage = JournalStorage(str(tmp_path / "tasks.json"))
+    svc = TaskService(storage)
+    svc.load()
+    tasks = svc.add_many({"title": f"T{i}"} for i in range(5))
+    with svc.batch():
+        svc.delete_task(tasks[0].id)
+        svc.mark_done(tasks[1].id)
+    storage.close()
+
+    lines = (tmp_path / "tasks.journal").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 7
+    again = TaskService(JournalStorage(str(tmp_path / "tasks.json")))
+    again.load()
+    assert [(t.title, t.status) for t in again.list_tasks()] == [
+        ("T1", "done"), ("T2", "active"), ("T3", "active"), ("T4", "active"),
+    ]
@@ -0,0 +1,48 @@
+from core.models import Task
+from core.service import TaskService
+from storage.binary_storage import BinaryStorage, binary_to_json, json_to_binary
+from storage.json_storage import JsonStorage
+
+
+def test_roundtrip_keeps_every_field(tmp_path):
+    tasks = [
+        Task("Купить ёлку", "описание\nв две строки", "2025-12-30", "active", "high"),
+        Task("", "", "", "done", "low"),
+        # поля, которые не кодируются компактно, хранятся как есть
+        Task("odd", due_date="завтра", status="blocked", priority="urgent", id="legacy-1",
+             created_at="2025-01-01T10:00:00+03:00"),
+    ]
+    storage = BinaryStorage(str(tmp_path / "tasks.bin"))
+    storage.save(tasks)
+
+    loaded = storage.load()
+    assert len(loaded) == 3
+    assert [t.to_dict() for t in loaded] == [t.to_dict() for t in tasks]
+    assert loaded[-1].id == "legacy-1"
+    storage.close()
+
+
+def test_service_saves_over_its_own_mapping(tmp_path):
+    storage = BinaryStorage(str(tmp_path / "tasks.bin"))
+    storage.save([Task("A"), Task("B")])
+    svc = TaskService(storage)
+    svc.load()
+    svc.add_task("C", "", "")
+
+    storage.close()
+    assert [t.title for t in BinaryStorage(str(tmp_path / "tasks.bin")).load()] == ["A", "B", "C"]
+
+
+def test_converter_roundtrip(tmp_path):
+    tasks = [Task("A", "a", "2025-01-01"), Task("B", status="done")]
+    JsonStorage(str(tmp_path / "in.json")).save(tasks)
+
+    assert json_to_binary(str(tmp_path / "in.json"), str(tmp_path / "tasks.bin")) == 2
+    assert binary_to_json(str(tmp_path / "tasks.bin"), str(tmp_path / "out.json")) == 2
+    assert (tmp_path / "in.json").read_text("utf-8") == (tmp_path / "out.json").read_text("utf-8")
+
+
+def test_missing_or_foreign_file_loads_empty(tmp_path):
+    assert list(BinaryStorage(str(tmp_path / "none.bin")).load()) == []
+    (tmp_path / "bad.bin").write_bytes(b"[]" * 40)
+    assert list(BinaryStorage(str(tmp_path / "bad.bin")).load()) == []
@@ -0,0 +1,134 @@
+import io
+import json
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from storage.json_storage import JsonStorage
+from task_manager import cli
+from utils.logging_conf import LOGGER_NAME, stop_logging
+from .conftest import SRC
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    # cli перенастраивает логгер приложения — возвращаем как было
+    monkeypatch.chdir(tmp_path)
+    logger = logging.getLogger(LOGGER_NAME)
+    saved = logger.handlers[:], logger.level
+
+    def run(*argv, stdin=""):
+        out = io.StringIO()
+        code = cli.main(["--data", str(tmp_path / "tasks.json"), *argv], io.StringIO(stdin), out)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    yield run
+    stop_logging()
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers[:], logger.level = saved
+
+
+def test_add_list_search_done(run):
+    _, [a] = run("add", "Купить хлеб", "--priority", "high", "--due", "2025-01-10")
+    run("add", "Отчёт", "--description", "квартальный")
+
+    _, tasks = run("list")
+    assert [t["title"] for t in tasks] == ["Купить хлеб", "Отчёт"]
+    assert tasks[0]["priority"] == "high" and tasks[0]["due_date"] == "2025-01-10"
+
+    _, found = run("search", "квартал")
+    assert [t["title"] for t in found] == ["Отчёт"]
+
+    code, done = run("done", a["id"], "missing")
+    assert code == 1
+    assert [t["id"] for t in done] == [a["id"]] and done[0]["status"] == "done"
+    _, active = run("list", "--status", "active")
+    assert [t["title"] for t in active] == ["Отчёт"]
+
+
+def test_export_import_round_trip(run, tmp_path):
+    run("add", "A")
+    run("add", "B")
+    run("export", str(tmp_path / "out.json"), "--format", "json")
+    _, ndjson = run("export")
+
+    other = ["--data", str(tmp_path / "other" / "tasks.json")]
+    code, [res] = run(*other, "import", str(tmp_path / "out.json"))
+    assert code == 0 and res == {"added": 2, "updated": 0}
+    _, imported = run(*other, "list")
+    assert imported == ndjson
+
+    # NDJSON из stdin: существующие id перезаписываются, а не дублируются
+    changed = [dict(ndjson[0], title="A2")]
+    lines = "".join(json.dumps(t) + "\n" for t in changed)
+    _, [res] = run(*other, "import", "-", stdin=lines)
+    assert res == {"added": 0, "updated": 1}
+    _, imported = run(*other, "list")
+    assert [t["title"] for t in imported] == ["A2", "B"]
+    assert imported[0]["created_at"] == ndjson[0]["created_at"]
+
+
+def test_batch_saves_once(run, monkeypatch):
+    _, [a] = run("add", "A")
+    saves = []
+    save = JsonStorage.save
+    monkeypatch.setattr(JsonStorage, "save", lambda self, tasks: saves.append(1) or save(self, tasks))
+
+    commands = [
+        {"op": "add", "title": "B", "priority": "low"},
+        {"op": "update", "id": a["id"], "priority": "high"},
+        {"op": "done", "id": "missing"},
+        {"op": "delete", "id": a["id"]},
+    ]
+    code, results = run("batch", stdin="\n".join(json.dumps(c) for c in commands))
+
+    assert code == 1
+    assert [r["ok"] for r in results] == [True, True, False, True]
+    assert results[1]["task"]["priority"] == "high"
+    assert results[2]["line"] == 3
+    assert len(saves) == 1
+    _, tasks = run("list")
+    assert [(t["title"], t["priority"]) for t in tasks] == [("B", "low")]
+
+
+def test_cli_does_not_import_ui(tmp_path):
+    code = (
+        "import sys; from task_manager import cli; "
+        "assert not {'ui', 'customtkinter', 'tkinter'} & set(sys.modules), sorted(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True, env={"PYTHONPATH": str(SRC)})
+
+
+def test_invalid_values_are_rejected(run, capsys):
+    code, out = run("add", "x", "--due", "garbage")
+    assert code == 1 and out == [] and "due_date" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        run("add", "x", "--priority", "urgent")
+
+    _, [a] = run("add", "A", "--due", "2025-01-10")
+    assert run("edit", a["id"], "--due", "10.01.2025")[0] == 1
+    with pytest.raises(SystemExit):
+        run("edit", a["id"], "--status", "archived")
+    code, [edited] = run("edit", a["id"], "--status", "done", "--due", "")
+    assert code == 0 and (edited["status"], edited["due_date"]) == ("done", "")
+    assert run("edit", "missing", "--title", "y")[0] == 1
+
+    commands = [
+        {"op": "add", "title": "B", "due_date": "nope"},
+        {"op": "add", "title": "C", "priority": "urgent"},
+        {"op": "update", "id": a["id"], "status": "archived"},
+        {"op": "update", "id": a["id"], "colour": "red"},
+        ["not", "an", "object"],
+        {"op": "add", "title": "D"},
+    ]
+    code, results = run("batch", stdin="\n".join(json.dumps(c) for c in commands))
+    assert code == 1
+    assert [r["ok"] for r in results] == [False, False, False, False, False, True]
+    assert [r["line"] for r in results[:5]] == [1, 2, 3, 4, 5]
+
+    _, tasks = run("list")
+    assert [(t["title"], t["status"], t["due_date"], t["priority"]) for t in tasks] == [
+        ("A", "done", "", "medium"), ("D", "active", "", "medium")]
@@ -0,0 +1,78 @@
+from datetime import date, datetime
+
+from core.reminders import ReminderScheduler
+from core.service import TaskService
+from .fakes import FakeLoop, MemoryStorage
+
+
+class FixedDayService(TaskService):
+    today = "2025-02-01"
+
+    def _today(self) -> str:
+        return self.today
+
+
+def titles(tasks):
+    return [t.title for t in tasks]
+
+
+def test_due_queries_follow_mutations():
+    svc = FixedDayService(MemoryStorage())
+    svc.add_task("late", due_date="2025-01-10")
+    today = svc.add_task("today", due_date="2025-02-01")
+    svc.add_task("soon", due_date="2025-02-03")
+    later = svc.add_task("later", due_date="2025-03-01")
+    svc.add_task("no date")
+    svc.add_task("bad date", due_date="завтра")
+
+    assert titles(svc.overdue()) == ["late"]
+    assert titles(svc.due_within(0)) == ["today"]
+    assert titles(svc.due_within(7)) == ["today", "soon"]
+    assert titles(svc.due_before(date(2025, 2, 4))) == ["late", "today", "soon"]
+
+    svc.mark_done(today.id)
+    svc.update_task(later.id, "later", "", "2025-01-05", "active")
+    assert titles(svc.overdue()) == ["later", "late"]
+    assert titles(svc.due_within(0)) == []
+    svc.undo()
+    assert titles(svc.overdue()) == ["late"]
+
+
+def test_boundary_is_the_next_due_day_or_midnight_after_today():
+    svc = FixedDayService(MemoryStorage())
+    assert svc.next_due_boundary() is None
+    svc.add_task("overdue", due_date="2025-01-01")
+    assert svc.next_due_boundary() is None
+    t = svc.add_task("soon", due_date="2025-02-05")
+    assert svc.next_due_boundary() == date(2025, 2, 5)
+    svc.update_task(t.id, "soon", "", "2025-02-01", "active")
+    assert svc.next_due_boundary() == date(2025, 2, 2)
+
+
+def test_scheduler_sleeps_until_the_boundary():
+    svc = FixedDayService(MemoryStorage())
+    loop = FakeLoop()
+    delays, reminders = [], []
+    clock = [datetime(2025, 2, 1, 22, 0)]
+
+    def after(ms, fn):
+        delays.append(ms)
+        return loop.after(ms, fn)
+
+    scheduler = ReminderScheduler(svc, after, loop.after_cancel,
+                                  lambda due, late: reminders.append((titles(due), titles(late))),
+                                  now=lambda: clock[0])
+    scheduler.reschedule()
+    assert delays == []
+
+    svc.add_task("tomorrow", due_date="2025-02-02")
+    scheduler.reschedule()
+    scheduler.reschedule()              # граница не сменилась — таймер не переставляется
+    assert delays == [2 * 60 * 60 * 1000]
+
+    clock[0] = datetime(2025, 2, 2, 0, 0)
+    svc.today = "2025-02-02"
+    handle = min(loop.callbacks)
+    loop.callbacks.pop(handle)()
+    assert reminders == [(["tomorrow"], [])]
+    assert scheduler.next_boundary == datetime(2025, 2, 3)
@@ -0,0 +1,49 @@
+import sys
+
+import pytest
+
+from core.encoding import NO_DATE, decode_due, encode_due
+from core.models import Task
+from core.service import TaskService
+from storage.binary_storage import decode_created, decode_id, encode_created, encode_id
+from .fakes import MemoryStorage
+
+
+def test_roundtrip_of_compact_fields():
+    t = Task("A", due_date="2025-01-10")
+    assert decode_id(encode_id(t.id)) == t.id
+    assert decode_created(encode_created(t.created_at)) == t.created_at
+    assert decode_due(encode_due(t.due_date)) == t.due_date
+    assert encode_due("") == NO_DATE and decode_due(NO_DATE) == ""
+
+
+def test_values_outside_the_compact_format_are_not_encoded():
+    # такие значения хранилище держит как есть, строкой
+    assert encode_id("legacy-id-1") is None
+    assert encode_id(str(Task("A").id).upper()) is None
+    assert encode_created("вчера") is None
+    assert encode_due("31.12.2025") is None
+
+
+def test_task_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Task("A").__dict__
+
+
+def test_status_and_priority_are_interned():
+    svc = TaskService(MemoryStorage())
+    # строки, собранные во время работы (ввод, JSON), — не те же объекты, что литералы
+    high, done = "".join(["hi", "gh"]), "".join(["do", "ne"])
+    a = svc.add_task("A", priority=high)
+    svc.update_task(a.id, "A", "", "", done, high)
+    b = Task.from_dict({"title": "B", "status": done, "priority": high})
+
+    assert a.priority is b.priority is sys.intern("high")
+    assert a.status is b.status is sys.intern("done")
+
+
+def test_missing_status_and_priority_get_defaults():
+    for data in ({"title": "A"}, {"title": "A", "status": None, "priority": None},
+                 {"title": "A", "status": "", "priority": 3}):
+        t = Task.from_dict(data)
+        assert (t.status, t.priority) == ("active", "medium")
@@ -0,0 +1,119 @@
+import bisect
+
+from core.events import EventBus, TaskCreated, TaskDeleted, TasksChanged, TasksReloaded, TaskUpdated
+from core.models import Task
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+def make_service():
+    svc = TaskService(MemoryStorage())
+    svc.load()
+    events = []
+    svc.events.subscribe(events.append)
+    return svc, events
+
+
+def test_single_mutations_publish_typed_events():
+    svc, events = make_service()
+    t = svc.add_task("A", priority="low")
+    svc.update_task(t.id, "A", "", "2025-01-01", "active", "high")
+    svc.update_task(t.id, "A", "", "2025-01-01", "active", "high")    # без изменений — без события
+    svc.mark_done(t.id)
+    svc.delete_task(t.id)
+
+    assert [type(e) for e in events] == [TaskCreated, TaskUpdated, TaskUpdated, TaskDeleted]
+    assert events[1].before == {"due_date": "", "priority": "low"}
+    assert events[1].fields == {"due_date", "priority"}
+    assert events[2].before == {"status": "active"}
+    assert events[3].task is t
+
+
+def test_batch_is_coalesced_per_task():
+    svc, events = make_service()
+    a = svc.add_task("A")
+    b = svc.add_task("B")
+    events.clear()
+
+    with svc.batch():
+        c = svc.add_task("C")
+        svc.update_many([c.id], priority="high")     # создана+изменена = создана
+        tmp = svc.add_task("tmp")
+        svc.delete_task(tmp.id)                      # создана+удалена = ничего
+        svc.update_many([a.id], priority="high")
+        svc.update_many([a.id], priority="medium")   # вернули как было = ничего
+        svc.mark_done(b.id)
+        svc.delete_task(b.id)                        # изменена+удалена = удалена
+        assert events == []                          # внутри блока — ничего
+
+    [event] = events
+    assert isinstance(event, TasksChanged) and not event.external
+    assert [(type(e), e.task.id) for e in event.events] == [(TaskCreated, c.id), (TaskDeleted, b.id)]
+    assert event.events[0].task.priority == "high"
+
+
+def test_delete_then_restore_is_an_update():
+    # так выглядит отмена удаления: прежняя задача уходит, возвращается новый объект
+    old = Task("A")
+    new = Task.from_dict(dict(old.to_dict(), title="B"))
+    bus = EventBus()
+    got = []
+    bus.subscribe(got.append)
+    with bus.coalesce():
+        bus.publish(TaskDeleted(old))
+        bus.publish(TaskCreated(new))
+    assert got == [TaskUpdated(new, {"title": "A"})]
+
+
+def test_reload_and_external_changes():
+    storage = MemoryStorage()
+    svc = TaskService(storage)
+    events = []
+    svc.events.subscribe(events.append, TasksReloaded, TasksChanged)
+    svc.load()
+    svc.add_task("A")                   # отфильтровано подпиской
+    assert [type(e) for e in events] == [TasksReloaded]
+
+    bus = EventBus()
+    got = []
+    bus.subscribe(got.append)
+    with bus.coalesce(external=True):
+        bus.publish(TaskCreated(svc.list_tasks()[0]))
+    assert got == [TasksChanged((TaskCreated(svc.list_tasks()[0]),), external=True)]
+
+
+def test_failing_handler_does_not_break_mutation_or_others():
+    svc, events = make_service()
+
+    def broken(_event):
+        raise RuntimeError("boom")
+
+    svc.events.subscribe(broken)
+    svc.add_task("A")
+    unsubscribe = svc.events.subscribe(events.append)
+    unsubscribe()
+    svc.add_task("B")
+
+    assert [e.task.title for e in events] == ["A", "B"]
+    assert svc.count() == 2
+
+
+def test_old_sort_key_moves_the_edited_row():
+    svc, events = make_service()
+    a = svc.add_task("A", priority="high")
+    svc.add_task("B", priority="medium")
+    svc.add_task("C", priority="low")
+    key = svc.sort_key("priority")
+    rows = sorted(svc.list_tasks(), key=key)
+    events.clear()
+
+    svc.update_task(a.id, "A", "", "", "active", "low")
+    [e] = events
+    old_key = svc.sort_key_before("priority", e.task, e.before)
+    # sort_key к этому моменту отдаёт уже новый ключ — старый только так
+    assert old_key != key(e.task)
+
+    # как App.refresh_task: строку убирают со старого места и вставляют по новому ключу
+    rows.pop(bisect.bisect_left(rows, old_key, key=key))
+    rows.insert(bisect.bisect_right(rows, key(e.task), key=key), e.task)
+    assert [t.title for t in rows] == [t.title for t in svc.list_tasks(sort_by="priority")] == ["B", "A", "C"]
@@ -0,0 +1,110 @@
+from core.history import History
+from core.service import TaskService
+from storage.journal_storage import JournalStorage
+from .fakes import MemoryStorage
+
+
+def snapshot(svc):
+    return [t.to_dict() for t in svc.list_tasks()]
+
+
+def test_undo_and_redo_every_kind_of_mutation():
+    svc = TaskService(MemoryStorage())
+    a = svc.add_task("A", "", "", "low")
+    b = svc.add_task("B")
+    states = [snapshot(svc)]
+    svc.update_task(a.id, "A2", "d", "2025-01-01", "active", "high")
+    states.append(snapshot(svc))
+    svc.mark_done(b.id)
+    states.append(snapshot(svc))
+    svc.delete_task(a.id)
+    states.append(snapshot(svc))
+
+    for expected in reversed(states[:-1]):
+        assert svc.undo()
+        assert snapshot(svc) == expected
+    for expected in states[1:]:
+        assert svc.redo()
+        assert snapshot(svc) == expected
+    assert svc.redo() == []
+
+    st = svc.stats()
+    assert (st["total"], st["done"]) == (1, 1)
+    assert svc.storage.load()[0].to_dict() == snapshot(svc)[0]
+
+
+def test_batch_is_one_step_and_new_mutation_drops_redo():
+    svc = TaskService(MemoryStorage())
+    tasks = svc.add_many({"title": f"T{i}"} for i in range(5))
+    svc.delete_many(t.id for t in tasks[:3])
+
+    assert sorted(svc.undo()) == sorted(t.id for t in tasks[:3])
+    assert svc.count() == 5
+    assert [t.title for t in svc.search("t2")] == ["T2"]
+
+    svc.add_task("new")
+    assert not svc.history.can_redo
+
+
+
+def test_noop_mutations_are_not_recorded():
+    svc = TaskService(MemoryStorage())
+    a = svc.add_task("A", "", "", "low")
+    svc.mark_done(a.id)
+    svc.update_task(a.id, "A2", "", "", "done", "low")
+    assert svc.undo() == [a.id]
+
+    # те же значения, повторный mark_done, пустая групповая правка — redo на месте
+    svc.update_task(a.id, "A", "", "", "done", "low")
+    svc.mark_done(a.id)
+    svc.update_many([a.id], priority="low")
+    assert svc.history.can_redo
+    assert svc.redo() == [a.id]
+    assert svc.get_task(a.id).title == "A2"
+    svc.undo()
+    assert svc.undo() == [a.id] and svc.get_task(a.id).status == "active"
+
+
+def test_undo_delete_in_the_middle_restores_position():
+    svc = TaskService(MemoryStorage())
+    tasks = svc.add_many({"title": f"T{i}", "priority": "low" if i % 2 else "high"} for i in range(6))
+    titles = [t.title for t in tasks]
+    by_priority = [t.title for t in svc.list_tasks(sort_by="priority")]
+    svc.delete_task(tasks[2].id)
+    svc.delete_task(tasks[4].id)
+
+    svc.undo()
+    svc.undo()
+    assert [t.title for t in svc.list_tasks()] == titles
+    assert [t.title for t in svc.list_tasks(sort_by="priority")] == by_priority
+    assert [t.title for t in svc.storage.load()] == titles
+
+    # новая задача — после всех, полная запись сохраняет тот же порядок
+    svc.add_task("new")
+    svc.save()
+    assert [t.title for t in svc.list_tasks()] == titles + ["new"]
+    assert [t.title for t in svc.storage.load()] == titles + ["new"]
+    svc.delete_task(tasks[0].id)
+    assert svc.undo() == [tasks[0].id]
+    assert [t.title for t in svc.list_tasks("active")] == titles + ["new"]
+
+def test_history_is_bounded():
+    history = History(limit=3)
+    for i in range(10):
+        history.push([i])
+    assert [history.pop_undo() for _ in range(4)] == [[9], [8], [7], None]
+
+
+def test_undo_is_written_incrementally(tmp_path):
+    storage = JournalStorage(str(tmp_path / "tasks.json"))
+    svc = TaskService(storage)
+    svc.load()
+    a = svc.add_task("A")
+    svc.delete_task(a.id)
+    svc.undo()
+    storage.close()
+
+    assert not (tmp_path / "tasks.json").exists()
+    again = TaskService(JournalStorage(str(tmp_path / "tasks.json")))
+    again.load()
+    assert [t.to_dict() for t in again.list_tasks()] == [a.to_dict()]
@@ -0,0 +1,70 @@
+from core.service import TaskService
+from storage.journal_storage import JournalStorage
+from storage.json_storage import JsonStorage
+
+
+def make_service(path, **kwargs):
+    storage = JournalStorage(str(path), **kwargs)
+    service = TaskService(storage)
+    service.load()
+    return service, storage
+
+
+def test_mutations_are_appended_and_replayed(tmp_path):
+    path = tmp_path / "tasks.json"
+    svc, storage = make_service(path)
+    a = svc.add_task("A", "", "")
+    b = svc.add_task("B", "", "")
+    svc.update_task(a.id, "A2", "desc", "2025-01-01", "active", "high")
+    svc.mark_done(b.id)
+    c = svc.add_task("C", "", "")
+    svc.delete_task(c.id)
+    storage.close()
+
+    assert not path.exists()
+    lines = (tmp_path / "tasks.journal").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 6
+
+    svc2, _ = make_service(path)
+    tasks = svc2.list_tasks()
+    assert [t.id for t in tasks] == [a.id, b.id]
+    assert tasks[0].title == "A2" and tasks[0].priority == "high"
+    assert tasks[1].status == "done"
+
+
+def test_broken_tail_is_ignored(tmp_path):
+    path = tmp_path / "tasks.json"
+    svc, storage = make_service(path)
+    a = svc.add_task("A", "", "")
+    storage.close()
+
+    with (tmp_path / "tasks.journal").open("a", encoding="utf-8") as f:
+        f.write('{"op":"put","task":{"id":"x"')
+
+    svc2, _ = make_service(path)
+    assert [t.id for t in svc2.list_tasks()] == [a.id]
+
+
+def test_compaction_writes_snapshot_and_resets_journal(tmp_path):
+    path = tmp_path / "tasks.json"
+    svc, storage = make_service(path, compact_threshold=512)
+    ids = [svc.add_task(f"Task {i}", "x" * 50, "").id for i in range(20)]
+    storage.wait_compaction()
+    storage.close()
+
+    assert path.exists()
+    assert not (tmp_path / "tasks.journal.old").exists()
+    assert 0 < len(JsonStorage(str(path)).load()) <= len(ids)
+
+    svc2, _ = make_service(path)
+    assert [t.id for t in svc2.list_tasks()] == ids
+
+
+def test_full_save_truncates_journal(tmp_path):
+    path = tmp_path / "tasks.json"
+    svc, storage = make_service(path)
+    svc.add_task("A", "", "")
+    svc.save()
+
+    assert not (tmp_path / "tasks.journal").exists()
+    assert len(JsonStorage(str(path)).load()) == 1
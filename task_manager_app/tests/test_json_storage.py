@@ -0,0 +1,123 @@
+import io
+import json
+
+import pytest
+
+from core.models import Task
+from storage.json_storage import JsonStorage, iter_json_array, write_json_array
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 7])
+def test_writer_matches_json_dump(n):
+    items = [Task(f"Задача {i}", "строка\nвторая").to_dict() for i in range(n)]
+    f = io.StringIO()
+    write_json_array(f, iter(items), chunk_size=2)
+
+    assert f.getvalue() == json.dumps(items, ensure_ascii=False, indent=2)
+
+
+def test_compact_writer_is_valid_json():
+    items = [{"a": i} for i in range(5)]
+    f = io.StringIO()
+    write_json_array(f, items, compact=True, chunk_size=2)
+
+    assert f.getvalue() == '[{"a":0},{"a":1},{"a":2},{"a":3},{"a":4}]'
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 16, 4096])
+def test_streaming_parser_handles_chunk_boundaries(chunk):
+    items = [{"title": "x" * i, "n": 12345, "nested": [1, {"b": "]"}]} for i in range(20)] + [7, "s", None]
+    text = " \n" + json.dumps(items, indent=2) + "\n"
+
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk)) == items
+    assert list(iter_json_array(io.StringIO("[]"), chunk_size=chunk)) == []
+
+
+@pytest.mark.parametrize("text", ['{"a": 1}', "[1, 2", "[1,,2]", "[1 2]"])
+def test_streaming_parser_rejects_malformed_input(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_streaming_load_and_compact_save_roundtrip(tmp_path):
+    path = tmp_path / "tasks.json"
+    tasks = [Task(f"T{i}", due_date="2025-01-01") for i in range(10)]
+    JsonStorage(str(path), compact=True).save(iter(tasks))
+
+    storage = JsonStorage(str(path), streaming=True)
+    assert [t.to_dict() for t in storage.iter_load()] == [t.to_dict() for t in tasks]
+    assert [t.id for t in storage.load()] == [t.id for t in tasks]
+
+
+def test_streaming_load_of_broken_file_returns_empty_list(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text('[{"title": "A"}, {"title": ', encoding="utf-8")
+
+    assert JsonStorage(str(path), streaming=True).load() == []
+
+
+def test_failed_save_keeps_previous_file(tmp_path):
+    path = tmp_path / "tasks.json"
+    storage = JsonStorage(str(path))
+    storage.save([Task("A"), Task("B")])
+    before = path.read_bytes()
+
+    def broken():
+        yield Task("C")
+        raise RuntimeError("disk full")
+
+    storage.save(broken())
+
+    assert path.read_bytes() == before
+    assert not (tmp_path / "tasks.json.tmp").exists()
+
+
+def test_rotation_keeps_given_number_of_backups(tmp_path):
+    storage = JsonStorage(str(tmp_path / "tasks.json"), backups=2)
+    for n in range(1, 5):
+        storage.save([Task(f"T{i}") for i in range(n)])
+
+    assert len(storage.load()) == 4
+    assert len(JsonStorage(str(storage.backup_path(1)), backups=0).load()) == 3
+    assert len(JsonStorage(str(storage.backup_path(2)), backups=0).load()) == 2
+    assert not storage.backup_path(3).exists()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_damaged_file_is_restored_from_backup(tmp_path, streaming):
+    path = tmp_path / "tasks.json"
+    storage = JsonStorage(str(path), streaming=streaming)
+    storage.save([Task("A")])
+    storage.save([Task("A"), Task("B")])
+    # порча внутри строки: JSON остаётся корректным, ловит только контрольная сумма
+    path.write_bytes(path.read_bytes().replace(b'"B"', b'"X"'))
+
+    assert [t.title for t in storage.load()] == ["A"]
+    assert (tmp_path / "tasks.json.corrupt").exists()
+    assert [t.title for t in JsonStorage(str(path), backups=0).load()] == ["A"]
+
+
+def test_file_without_checksum_still_loads(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps([Task("A").to_dict()]), encoding="utf-8")
+
+    assert [t.title for t in JsonStorage(str(path)).load()] == ["A"]
+    assert [t.title for t in JsonStorage(str(path), streaming=True).iter_load()] == ["A"]
+
+
+def test_truncated_file_without_checksum_falls_back_when_streamed(tmp_path):
+    path = tmp_path / "tasks.json"
+    storage = JsonStorage(str(path), streaming=True)
+    good = json.dumps([Task("A").to_dict()])
+    storage.backup_path(1).write_text(good, encoding="utf-8")
+    # старый формат без контрольной суммы, запись оборвалась на середине
+    path.write_text(json.dumps([Task("A").to_dict(), Task("B").to_dict()])[:-40], encoding="utf-8")
+
+    assert [t.title for t in storage.iter_load()] == ["A"]
+    assert (tmp_path / "tasks.json.corrupt").exists()
+    assert path.read_text(encoding="utf-8") == good
+
+    # целых версий нет — файл убирается в .corrupt, задач нет
+    path.write_text(good[:-20], encoding="utf-8")
+    assert list(JsonStorage(str(path), backups=0).iter_load()) == []
+    assert not path.exists()
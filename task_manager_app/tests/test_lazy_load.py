@@ -0,0 +1,80 @@
+import json
+
+from core.lazy_load import BackgroundLoader
+from core.service import TaskService
+from storage.json_storage import JsonStorage
+from benchmarks.synthetic import make_tasks
+from .fakes import FakeLoop
+
+
+def make_loader(tmp_path, n):
+    path = tmp_path / "tasks.json"
+    tasks = make_tasks(n)
+    JsonStorage(str(path)).save(tasks)
+    svc = TaskService(JsonStorage(str(path)))
+    loop = FakeLoop()
+    return svc, loop, BackgroundLoader(svc, loop.after, first_page=10, chunk_size=100), tasks
+
+
+def test_first_page_is_available_immediately(tmp_path):
+    svc, loop, loader, tasks = make_loader(tmp_path, 1000)
+    progress, done = [], []
+    loader.start(lambda n, p: progress.append((n, p)), lambda: done.append(True))
+
+    assert svc.count() == 10
+    assert svc.loading is True
+
+    loop.run()
+
+    assert done == [True] and svc.loading is False
+    assert [t.id for t in svc.list_tasks()] == [t.id for t in tasks]
+    assert progress[-1][0] == 1000
+    assert all(a[0] < b[0] for a, b in zip(progress, progress[1:]))
+    assert svc.stats()["total"] == 1000
+    assert len(svc.list_tasks(sort_by="priority")) == 1000
+
+
+def test_full_save_is_refused_while_loading(tmp_path):
+    svc, loop, loader, tasks = make_loader(tmp_path, 500)
+    loader.start()
+    svc.save()
+
+    assert len(JsonStorage(str(tmp_path / "tasks.json")).load()) == 500
+    loader.finish_now()
+    assert svc.count() == 500
+
+
+def test_read_error_reloads_from_backup_instead_of_ending_the_load(tmp_path):
+    svc, loop, loader, tasks = make_loader(tmp_path, 1000)
+    path = tmp_path / "tasks.json"
+    items = [t.to_dict() for t in tasks]
+    svc.storage.backup_path(1).write_text(json.dumps(items[:300]), encoding="utf-8")
+    # без контрольной суммы, конец целый, а посередине мусор: первая страница читается
+    path.write_text(json.dumps(items[:500])[:-1] + ", @@, " + json.dumps(items[500:])[1:], encoding="utf-8")
+
+    done = []
+    loader.start(on_done=lambda: done.append(True))
+    assert svc.count() == 10 and svc.loading is True
+    loop.run()
+
+    assert done == [True] and loader.error
+    assert svc.loading is False
+    assert [t.id for t in svc.list_tasks()] == [t.id for t in tasks[:300]]
+    assert (tmp_path / "tasks.json.corrupt").exists()
+
+
+def test_first_page_error_does_not_count_as_loaded(tmp_path):
+    svc, loop, loader, tasks = make_loader(tmp_path, 100)
+    path = tmp_path / "tasks.json"
+    items = [t.to_dict() for t in tasks]
+    broken = json.dumps(items[:5])[:-1] + ", @@, " + json.dumps(items[5:])[1:]
+    path.write_text(broken, encoding="utf-8")
+    loader.start()
+    assert svc.loading is True
+    svc.save()                  # пока ошибка не разобрана — сохранять нельзя
+    assert path.read_text(encoding="utf-8") == broken
+
+    loop.run()
+    assert loader.error and svc.loading is False
+    assert svc.count() == 0
+    assert (tmp_path / "tasks.json.corrupt").read_text(encoding="utf-8") == broken
@@ -0,0 +1,43 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from utils.logging_conf import LOGGER_NAME, configure_logging, stop_logging
+
+
+@pytest.fixture
+def app_logger():
+    logger = logging.getLogger(LOGGER_NAME)
+    saved = logger.handlers[:], logger.level
+    yield logger
+    stop_logging()
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers[:], logger.level = saved
+
+
+def test_queue_mode_writes_from_listener_thread(app_logger, tmp_path):
+    log_path = tmp_path / "app.log"
+    logger = configure_logging(str(log_path), level="DEBUG", console_level="CRITICAL")
+
+    assert [type(h) for h in logger.handlers] == [QueueHandler]
+    logger.debug("debug %d", 1)
+    logger.info("info %s", "ё")
+    stop_logging()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" | ", 1)[1] for line in lines] == ["DEBUG | debug 1", "INFO | info ё"]
+
+
+def test_levels_and_rotation(app_logger, tmp_path):
+    log_path = tmp_path / "app.log"
+    logger = configure_logging(str(log_path), level="warning", console_level="CRITICAL",
+                               use_queue=False, max_bytes=200, backup_count=2)
+
+    assert not logger.isEnabledFor(logging.INFO)
+    for i in range(20):
+        logger.warning("line %02d", i)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app.log", "app.log.1", "app.log.2"]
+    assert log_path.stat().st_size <= 200
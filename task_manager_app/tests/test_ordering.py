@@ -0,0 +1,55 @@
+import pytest
+
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+def make_service():
+    service = TaskService(MemoryStorage())
+    service.load()
+    return service
+
+
+def titles(tasks):
+    return [t.title for t in tasks]
+
+
+def test_priority_order_is_stable_and_maintained():
+    svc = make_service()
+    svc.add_task("low", priority="low")
+    svc.add_task("high1", priority="high")
+    m = svc.add_task("medium", priority="medium")
+    assert titles(svc.list_tasks(sort_by="priority")) == ["high1", "medium", "low"]
+
+    svc.add_task("high2", priority="high")
+    svc.update_task(m.id, "medium", "", "", "active", "high")
+    assert titles(svc.list_tasks(sort_by="priority")) == ["high1", "medium", "high2", "low"]
+
+
+def test_status_and_due_date_orders():
+    svc = make_service()
+    a = svc.add_task("a", due_date="2025-03-01")
+    svc.add_task("b", due_date="")
+    svc.add_task("c", due_date="2025-01-01", priority="high")
+    svc.mark_done(a.id)
+
+    assert titles(svc.list_tasks(sort_by="status")) == ["c", "b", "a"]
+    assert titles(svc.list_tasks(sort_by="due_date")) == ["c", "a", "b"]
+    assert titles(svc.list_tasks("active", sort_by="due_date")) == ["c", "b"]
+
+    svc.delete_task(a.id)
+    assert titles(svc.list_tasks(sort_by="due_date")) == ["c", "b"]
+
+
+def test_sort_tasks_orders_a_subset():
+    svc = make_service()
+    svc.add_task("купить хлеб", priority="low")
+    svc.add_task("купить молоко", priority="high")
+
+    found = svc.sort_tasks(svc.search("купить"), "priority")
+    assert titles(found) == ["купить молоко", "купить хлеб"]
+
+
+def test_unknown_sort_order_raises():
+    with pytest.raises(ValueError):
+        make_service().list_tasks(sort_by="nope")
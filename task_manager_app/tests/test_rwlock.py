@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+from utils.rwlock import RWLock
+
+
+def test_readers_share_writer_excludes():
+    lock = RWLock()
+    inside = threading.Barrier(3, timeout=2)
+
+    def reader():
+        with lock.read():
+            inside.wait()       # три читателя одновременно внутри
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    events = []
+    with lock.read():
+        writer = threading.Thread(target=lambda: (lock.acquire_write(), events.append("write"), lock.release_write()))
+        writer.start()
+        time.sleep(0.05)
+        assert events == []     # писатель ждёт читателя
+    writer.join(2)
+    assert events == ["write"]
+
+
+def test_waiting_writer_blocks_new_readers():
+    lock = RWLock()
+    events = []
+    lock.acquire_read()
+
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), events.append("write"), lock.release_write()))
+    writer.start()
+    time.sleep(0.05)
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), events.append("read"), lock.release_read()))
+    reader.start()
+    time.sleep(0.05)
+    assert events == []
+
+    lock.release_read()
+    writer.join(2)
+    reader.join(2)
+    assert events == ["write", "read"]
+
+
+def test_reentrant_and_no_upgrade():
+    lock = RWLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    # после всего блокировка свободна
+    with lock.write():
+        pass
@@ -0,0 +1,72 @@
+from core.models import Task
+from core.search_index import SearchIndex, matches, tokenize
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+def make_service():
+    service = TaskService(MemoryStorage())
+    service.load()
+    return service
+
+
+def test_tokenize_folds_cyrillic_case():
+    assert tokenize("Купить ЁЛКУ, молоко!") == ["купить", "елку", "молоко"]
+
+
+def test_prefix_search_requires_all_words():
+    idx = SearchIndex()
+    a = Task("Купить молоко")
+    b = Task("Купить хлеб", "и молоко")
+    c = Task("Сделать курсовую")
+    for t in (a, b, c):
+        idx.add(t)
+
+    assert set(idx.search("куп")) == {a.id, b.id}
+    assert set(idx.search("куп мол")) == {a.id, b.id}
+    assert idx.search("куп хл") == [b.id]
+    assert idx.search("нет такого") == []
+    assert idx.search("   ") == []
+
+
+def test_title_matches_rank_higher_than_description():
+    idx = SearchIndex()
+    a = Task("Отчёт", "написать план")
+    b = Task("План на неделю")
+    idx.add(a)
+    idx.add(b)
+
+    assert idx.search("план") == [b.id, a.id]
+
+
+def test_candidates_narrow_results():
+    idx = SearchIndex()
+    a = Task("abc")
+    b = Task("abd")
+    idx.add(a)
+    idx.add(b)
+
+    assert idx.search("ab", candidates={a.id}) == [a.id]
+
+
+def test_service_search_follows_mutations():
+    svc = make_service()
+    a = svc.add_task("Купить молоко")
+    b = svc.add_task("Погулять", "30 минут")
+
+    assert [t.id for t in svc.search("молоко")] == [a.id]
+
+    svc.update_task(b.id, "Купить хлеб", "", "", "active")
+    assert {t.id for t in svc.search("купить")} == {a.id, b.id}
+
+    svc.delete_task(a.id)
+    assert [t.id for t in svc.search("купить")] == [b.id]
+
+    svc.mark_done(b.id)
+    assert svc.search("купить", status="active") == []
+
+
+def test_matches_agrees_with_index():
+    t = Task("Сделать курсовую", "UI + JSON")
+    assert matches(t, "курс json")
+    assert not matches(t, "урсовую")
@@ -0,0 +1,75 @@
+from core.search_pipeline import SearchPipeline
+from core.service import TaskService
+from .fakes import FakeLoop, MemoryStorage
+
+
+class SpyService(TaskService):
+    def __init__(self):
+        super().__init__(MemoryStorage())
+        self.calls = []
+
+    def search(self, query, status=None, within=None):
+        self.calls.append((query, within))
+        return super().search(query, status, within)
+
+
+def make_pipeline():
+    svc = SpyService()
+    svc.load()
+    loop = FakeLoop()
+    return svc, loop, SearchPipeline(svc, loop.after, loop.after_cancel)
+
+
+def test_burst_of_keys_runs_one_search():
+    svc, loop, pipeline = make_pipeline()
+    svc.add_task("abc")
+    results = []
+
+    for q in ("a", "ab", "abc"):
+        pipeline.submit(q, None, results.append)
+    loop.run()
+
+    assert [q for q, _ in svc.calls] == ["abc"]
+    assert len(results) == 1 and results[0][0].title == "abc"
+
+
+def test_stale_result_is_not_delivered():
+    svc, loop, pipeline = make_pipeline()
+    svc.add_task("abc")
+    results = []
+
+    pipeline.submit("ab", None, results.append)
+    loop.callbacks.pop(min(loop.callbacks))()      # поиск выполнен, показ ещё в очереди
+    pipeline.submit("xyz", None, results.append)
+    loop.run()
+
+    assert results == [[]]
+
+
+def test_extended_query_narrows_previous_results():
+    svc, loop, pipeline = make_pipeline()
+    a = svc.add_task("abc")
+    svc.add_task("abd")
+    results = []
+
+    pipeline.submit("ab", None, results.append)
+    loop.run()
+    pipeline.submit("abc", None, results.append)
+    loop.run()
+
+    assert svc.calls[0][1] is None
+    assert svc.calls[1][1] == {t.id for t in results[0]}
+    assert [t.id for t in results[1]] == [a.id]
+
+
+def test_invalidate_drops_previous_results():
+    svc, loop, pipeline = make_pipeline()
+    svc.add_task("abc")
+    pipeline.submit("ab", None, lambda _: None)
+    loop.run()
+
+    pipeline.invalidate()
+    pipeline.submit("abc", None, lambda _: None)
+    loop.run()
+
+    assert svc.calls[1][1] is None
@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+from core.service import TaskService
+from task_manager.server import Request, TaskServer
+from .fakes import MemoryStorage
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, tasks):
+        self.saves += 1
+        super().save(tasks)
+
+
+async def request(server, method, path, body=None, headers=None):
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = [f"{method} {path} HTTP/1.1", f"Content-Length: {len(data)}", "Connection: close"]
+    head += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+    raw = await reader.read()
+    writer.close()
+
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    resp_headers = dict(line.split(": ", 1) for line in lines[1:])
+    return status, resp_headers, json.loads(payload) if payload else None
+
+
+def serve(test):
+    # запустить сервер на свободном порту, выполнить test(server, storage), остановить
+    async def main():
+        storage = CountingStorage()
+        service = TaskService(storage)
+        service.load()
+        server = TaskServer(service, port=0, sync_interval=0)
+        await server.start()
+        try:
+            await test(server, storage)
+        finally:
+            await server.stop()
+    asyncio.run(main())
+
+
+def test_crud_and_pagination():
+    async def test(server, _storage):
+        for i in range(5):
+            status, _, task = await request(server, "POST", "/tasks", {"title": f"T{i}", "priority": "high"})
+            assert status == 201 and task["title"] == f"T{i}"
+
+        status, _, page = await request(server, "GET", "/tasks?limit=2&offset=2")
+        assert [t["title"] for t in page["items"]] == ["T2", "T3"]
+        assert page["total"] == 5 and page["next"] == 4
+        assert (await request(server, "GET", "/tasks?limit=0"))[0] == 400
+        assert (await request(server, "GET", "/tasks?limit=-3"))[0] == 400
+        _, _, past_end = await request(server, "GET", "/tasks?offset=10")
+        assert past_end["items"] == [] and past_end["next"] is None
+
+        tid, other = page["items"][0]["id"], page["items"][1]["id"]
+        status, _, task = await request(server, "PATCH", f"/tasks/{tid}", {"priority": "low"})
+        assert status == 200 and task["priority"] == "low"
+        status, _, task = await request(server, "POST", f"/tasks/{tid}/done")
+        assert task["status"] == "done"
+        _, _, page = await request(server, "GET", "/tasks?status=done")
+        assert [t["id"] for t in page["items"]] == [tid]
+
+        assert (await request(server, "DELETE", f"/tasks/{tid}"))[0] == 204
+        assert (await request(server, "GET", f"/tasks/{tid}"))[0] == 404
+        assert (await request(server, "PATCH", "/tasks/x", {"title": "y"}))[0] == 404
+        assert (await request(server, "PATCH", f"/tasks/{other}", {"created_at": "y"}))[0] == 400
+        assert (await request(server, "POST", "/tasks", {"description": "no title"}))[0] == 400
+        assert (await request(server, "PUT", "/tasks"))[0] == 405
+    serve(test)
+
+
+def test_etag_not_modified_until_change():
+    async def test(server, _storage):
+        await request(server, "POST", "/tasks", {"title": "A"})
+        status, headers, _ = await request(server, "GET", "/tasks")
+        etag = headers["ETag"]
+
+        status, _, body = await request(server, "GET", "/tasks?q=a", headers={"If-None-Match": etag})
+        assert status == 304 and body is None
+
+        await request(server, "POST", "/tasks", {"title": "B"})
+        status, headers, page = await request(server, "GET", "/tasks", headers={"If-None-Match": etag})
+        assert status == 200 and headers["ETag"] != etag
+        assert page["total"] == 2
+        etag = headers["ETag"]
+
+        # другой запуск сервера с той же версией данных — ETag другой
+        restarted = TaskServer(server.service, port=0, sync_interval=0)
+        restarted.version = server.version
+        assert restarted._cached(Request("GET", "/tasks", {"if-none-match": etag}, b""), lambda r: {})[0] == 200
+    serve(test)
+
+
+def test_concurrent_writes_are_grouped():
+    async def test(server, storage):
+        results = await asyncio.gather(*(
+            request(server, "POST", "/tasks", {"title": f"T{i}"}) for i in range(50)
+        ))
+        assert all(status == 201 for status, _, _ in results)
+        assert len(storage.load()) == 50
+        # писатель сохраняет накопившиеся запросы группой, а не по одному
+        assert storage.saves < 50
+
+        status, _, results = await request(server, "POST", "/batch", [
+            {"op": "add", "title": "X"},
+            {"op": "done", "id": "missing"},
+        ])
+        assert status == 200 and [r["ok"] for r in results] == [True, False]
+    serve(test)
+
+
+def test_invalid_fields_are_rejected_before_the_write():
+    async def test(server, storage):
+        _, _, task = await request(server, "POST", "/tasks", {"title": "A", "due_date": "2025-01-01"})
+        tid = task["id"]
+        saves = storage.saves
+
+        for body in ({"due_date": 5}, {"due_date": "01.02.2025"}, {"status": "archived"},
+                     {"priority": "urgent"}, {"title": None}):
+            status, _, _ = await request(server, "PATCH", f"/tasks/{tid}", body)
+            assert status == 400, body
+        status, _, _ = await request(server, "POST", "/tasks", {"title": "B", "description": 3})
+        assert status == 400
+
+        status, _, results = await request(server, "POST", "/batch", [
+            {"op": "add", "title": "C", "priority": 1},
+            {"op": "update", "id": tid, "due_date": "2025-02-30"},
+            {"op": "add", "title": "D"},
+        ])
+        assert [r["ok"] for r in results] == [False, False, True]
+
+        # задача не тронута, поиск и статистика работают
+        status, _, same = await request(server, "GET", f"/tasks/{tid}")
+        assert same == task
+        assert (await request(server, "GET", "/tasks?q=a"))[0] == 200
+        _, _, stats = await request(server, "GET", "/stats")
+        assert stats["total"] == 2
+        assert storage.saves == saves + 1       # записан только batch с «D»
+    serve(test)
+
+
+def test_oversized_header_gets_431_and_server_keeps_serving():
+    async def test(server, _storage):
+        status, _, body = await request(server, "GET", "/tasks", headers={"X-Big": "a" * 100_000})
+        assert status == 431 and "too long" in body["error"]
+        assert (await request(server, "GET", "/tasks"))[0] == 200
+    serve(test)
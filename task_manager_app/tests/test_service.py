@@ -1,3 +1,5 @@
+import pytest
+
 from core.service import TaskService
 from .fakes import MemoryStorage
 
@@ -81,3 +83,31 @@ def test_delete_nonexistent_returns_false():
     svc = make_service()
     ok = svc.delete_task("no-such-id")
     assert ok is False
+
+
+def test_delete_keeps_order_of_remaining_tasks():
+    svc = make_service()
+    a = svc.add_task("A", "", "")
+    b = svc.add_task("B", "", "")
+    c = svc.add_task("C", "", "")
+
+    svc.delete_task(b.id)
+    svc.update_task(a.id, "A2", "", "", "active", "high")
+
+    assert [t.id for t in svc.list_tasks()] == [a.id, c.id]
+    assert svc.get_task(b.id) is None
+
+
+def test_update_with_invalid_value_leaves_task_and_counters_intact():
+    svc = make_service()
+    t = svc.add_task("A", due_date="2000-01-01")
+    before, stats = t.to_dict(), svc.stats()
+
+    with pytest.raises(TypeError):
+        svc.update_task(t.id, "A", "", 5, "active", "medium")
+    with pytest.raises(TypeError):
+        svc.add_task("B", description=3)
+
+    assert t.to_dict() == before
+    assert svc.stats() == stats
+    assert svc.search("a") == [t]
@@ -0,0 +1,81 @@
+import multiprocessing
+import sys
+
+import pytest
+
+from core.service import TaskService
+from storage.shared_storage import SharedJournalStorage
+
+
+def open_service(path, **kwargs):
+    svc = TaskService(SharedJournalStorage(str(path), **kwargs))
+    svc.load()
+    return svc
+
+
+def test_changes_from_another_instance_are_merged(tmp_path):
+    path = tmp_path / "tasks.json"
+    a = open_service(path)
+    b = open_service(path)
+
+    t = a.add_task("A", "", "")
+    assert b.sync() == ([b.get_task(t.id)], [])
+    assert b.get_task(t.id).title == "A"
+
+    shown = a.get_task(t.id)
+    b.update_task(t.id, "A2", "", "2025-01-01", "active", "high")
+    changed, removed = a.sync()
+    # задача обновлена на месте — ссылки на неё остаются верными
+    assert changed == [shown] and shown.title == "A2" and shown.priority == "high"
+    assert a.list_tasks(sort_by="priority")[0] is shown
+
+    b.delete_task(t.id)
+    assert a.sync() == ([], [t.id])
+    assert a.count() == 0 and a.stats()["total"] == 0
+    assert a.sync() == ([], [])
+
+
+def test_compaction_elsewhere_is_caught_up_by_diff(tmp_path):
+    path = tmp_path / "tasks.json"
+    a = open_service(path, compact_threshold=400)
+    b = open_service(path, compact_threshold=400)
+
+    keep = b.add_task("keep", "", "")
+    gone = b.add_task("gone", "", "")
+    a.sync()
+    for i in range(5):
+        a.add_task(f"A{i}", "", "")     # журнал сворачивается в снимок в процессе A
+    assert (tmp_path / "tasks.journal").stat().st_size < 400
+    b.delete_task(gone.id)
+
+    kept = b.get_task(keep.id)
+    changed, removed = b.sync()
+    assert sorted(t.title for t in changed) == [f"A{i}" for i in range(5)]
+    assert removed == [] and b.get_task(gone.id) is None
+    assert b.get_task(keep.id) is kept
+    assert a.sync() == ([], [gone.id])
+    assert sorted(t.title for t in b.list_tasks()) == sorted(t.title for t in a.list_tasks())
+
+
+def _writer(path, name, n):
+    svc = TaskService(SharedJournalStorage(path, compact_threshold=2000))
+    svc.load()
+    for i in range(n):
+        svc.add_task(f"{name}-{i}", "", "")
+        if i % 7 == 0:
+            svc.sync()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="flock is POSIX-only")
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_writer, args=(path, f"p{k}", 40)) for k in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+
+    titles = {t.title for t in open_service(path).list_tasks()}
+    assert titles == {f"p{k}-{i}" for k in range(3) for i in range(40)}
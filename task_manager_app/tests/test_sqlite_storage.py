@@ -0,0 +1,54 @@
+from core.models import Task
+from core.service import TaskService
+from storage.json_storage import JsonStorage
+from storage.sqlite_storage import SqliteStorage, migrate_json
+
+
+def test_upsert_and_delete_roundtrip(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "tasks.db"))
+    svc = TaskService(storage)
+    svc.load()
+    a = svc.add_task("A", "", "2025-01-01", "high")
+    b = svc.add_task("B", "", "")
+    c = svc.add_task("C", "", "")
+    svc.update_task(a.id, "A2", "d", "2025-01-02", "active", "low")
+    svc.mark_done(b.id)
+    svc.delete_task(c.id)
+    storage.close()
+
+    storage = SqliteStorage(str(tmp_path / "tasks.db"))
+    tasks = storage.load()
+    assert [t.id for t in tasks] == [a.id, b.id]
+    assert tasks[0].title == "A2" and tasks[0].priority == "low"
+    assert tasks[1].status == "done"
+
+
+def test_queries_and_stats_run_in_db(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "tasks.db"))
+    storage.save([
+        Task("A", status="done", due_date="2025-01-01"),
+        Task("B", priority="high", due_date="2025-03-01"),
+        Task("C", priority="high"),
+    ])
+
+    assert [t.title for t in storage.query(status="active")] == ["B", "C"]
+    assert [t.title for t in storage.query(priority="high", status="active")] == ["B", "C"]
+    assert [t.title for t in storage.due_before("2025-02-01")] == ["A"]
+    assert storage.stats() == {"total": 3, "active": 2, "done": 1}
+
+
+def test_migrate_json_imports_once(tmp_path):
+    json_path = tmp_path / "tasks.json"
+    JsonStorage(str(json_path)).save([Task("A"), Task("B")])
+
+    storage = migrate_json(str(json_path), str(tmp_path / "tasks.db"))
+    assert [t.title for t in storage.load()] == ["A", "B"]
+    storage.close()
+
+    storage = migrate_json(str(json_path), str(tmp_path / "tasks.db"))
+    storage.save([])
+    storage.close()
+
+    storage = migrate_json(str(json_path), str(tmp_path / "tasks.db"))
+    assert storage.load() == []
+    storage.close()
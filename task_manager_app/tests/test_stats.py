@@ -0,0 +1,61 @@
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+class FixedDayService(TaskService):
+    today = "2025-02-01"
+
+    def _today(self) -> str:
+        return self.today
+
+
+def make_service():
+    service = FixedDayService(MemoryStorage())
+    service.load()
+    return service
+
+
+def test_stats_follow_every_mutation():
+    svc = make_service()
+    a = svc.add_task("A", due_date="2025-01-10", priority="high")
+    b = svc.add_task("B", due_date="2025-02-01")
+    c = svc.add_task("C", due_date="2025-03-01", priority="low")
+
+    st = svc.stats()
+    assert (st["total"], st["active"], st["done"]) == (3, 3, 0)
+    assert (st["overdue"], st["due_today"]) == (1, 1)
+    assert st["by_priority"] == {"high": 1, "medium": 1, "low": 1}
+
+    svc.mark_done(a.id)
+    svc.update_task(c.id, "C", "", "2025-01-20", "active", "high")
+    svc.delete_task(b.id)
+
+    st = svc.stats()
+    assert (st["total"], st["active"], st["done"]) == (2, 1, 1)
+    assert (st["overdue"], st["due_today"]) == (1, 0)
+    assert st["by_status"] == {"active": 1, "done": 1}
+    assert st["by_priority"] == {"high": 2}
+
+
+def test_stats_are_recounted_when_the_day_changes():
+    svc = make_service()
+    svc.add_task("A", due_date="2025-02-02")
+    assert svc.stats()["overdue"] == 0
+
+    svc.today = "2025-02-02"
+    assert (svc.stats()["overdue"], svc.stats()["due_today"]) == (0, 1)
+
+    svc.today = "2025-02-03"
+    assert (svc.stats()["overdue"], svc.stats()["due_today"]) == (1, 0)
+
+
+def test_stats_after_load():
+    storage = MemoryStorage()
+    svc = FixedDayService(storage)
+    svc.add_task("A", due_date="2025-01-01")
+    svc.add_task("B")
+
+    svc2 = FixedDayService(storage)
+    svc2.load()
+    st = svc2.stats()
+    assert (st["total"], st["active"], st["overdue"]) == (2, 2, 1)
@@ -0,0 +1,66 @@
+import random
+import threading
+
+from core.service import TaskService
+from .fakes import MemoryStorage
+
+
+def test_concurrent_readers_and_writers_stay_consistent():
+    svc = TaskService(MemoryStorage(), thread_safe=True)
+    svc.load()
+    svc.add_many({"title": f"seed {i}", "priority": "low"} for i in range(200))
+
+    stop = threading.Event()
+    errors = []
+
+    def writer(n):
+        rnd = random.Random(n)
+        for i in range(300):
+            op = rnd.random()
+            if op < 0.4:
+                svc.add_task(f"w{n} {i}", "проверка потоков", "2025-01-01", "high")
+            elif op < 0.7:
+                tasks = svc.list_tasks()
+                if tasks:
+                    svc.update_many([rnd.choice(tasks).id], status="done", priority="medium")
+            elif op < 0.9:
+                tasks = svc.list_tasks()
+                if tasks:
+                    svc.delete_task(rnd.choice(tasks).id)
+            else:
+                with svc.batch():
+                    ids = [svc.add_task(f"batch {n} {i} {k}").id for k in range(5)]
+                    svc.delete_many(ids[:2])
+
+    def reader():
+        try:
+            while not stop.is_set():
+                tasks = svc.list_tasks()
+                svc.list_tasks("active", sort_by="priority")
+                stats = svc.stats()
+                found = svc.search("потоков")
+                # каждое чтение видит целое состояние, а не середину записи
+                assert len({t.id for t in tasks}) == len(tasks)
+                assert stats["total"] == stats["active"] + stats["done"]
+                assert sum(stats["by_priority"].values()) == stats["total"]
+                assert all(t.description == "проверка потоков" for t in found)
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    stop.set()
+    for t in readers:
+        t.join()
+
+    assert not errors
+    # итог совпадает с тем, что уже лежит в хранилище, и индексы согласованы с задачами
+    tasks = svc.list_tasks()
+    assert [t.id for t in svc.storage.load()] == [t.id for t in tasks]
+    assert sorted(t.id for t in svc.list_tasks(sort_by="priority")) == sorted(t.id for t in tasks)
+    assert svc.stats()["total"] == len(tasks) == svc.count()